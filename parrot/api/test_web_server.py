@@ -35,7 +35,7 @@ class TestWebServer:
 
         web_server_module.state_instance = None
         web_server_module.director_instance = None
-        web_server_module.last_hype_time = 0
+        web_server_module.hype_state.deployed_at = float("-inf")
 
     def test_get_local_ip_success(self):
         """Test get_local_ip returns valid IP address."""
@@ -189,7 +189,7 @@ class TestWebServer:
         """Test GET /api/hype/status when hype is active."""
         import parrot.api.web_server as web_server_module
 
-        web_server_module.last_hype_time = time.time() - 2  # 2 seconds ago
+        web_server_module.hype_state.deployed_at = time.monotonic() - 2  # 2 seconds ago
 
         response = self.client.get("/api/hype/status")
         assert response.status_code == 200
@@ -199,6 +199,38 @@ class TestWebServer:
         assert data["remaining"] > 0
         assert data["remaining"] <= 8  # HYPE_DURATION
 
+    def test_get_hype_status_revalidates(self):
+        """Test GET /api/hype/status is briefly cacheable and answers 304."""
+        import parrot.api.web_server as web_server_module
+
+        response = self.client.get("/api/hype/status")
+        assert response.cache_control.max_age == 1
+        etag = response.headers["ETag"]
+
+        response = self.client.get("/api/hype/status", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        # Deploying hype changes the validator
+        web_server_module.hype_state.deployed_at = time.monotonic()
+        response = self.client.get("/api/hype/status", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert json.loads(response.data)["active"] is True
+
+    def test_get_hype_status_active_is_not_cached(self):
+        """Test the active countdown is never served from a cache."""
+        import parrot.api.web_server as web_server_module
+
+        web_server_module.hype_state.deployed_at = time.monotonic()
+        first = self.client.get("/api/hype/status")
+        assert "ETag" not in first.headers
+        assert first.cache_control.max_age is None
+
+        second = self.client.get("/api/hype/status")
+        assert second.status_code == 200
+        assert (
+            json.loads(second.data)["remaining"] < json.loads(first.data)["remaining"]
+        )
+
     def test_get_manual_dimmer_no_state(self):
         """Test GET /api/manual_dimmer when state is not initialized."""
         response = self.client.get("/api/manual_dimmer")
@@ -332,6 +364,44 @@ class TestWebServer:
         data = json.loads(response.data)
         assert "error" in data
 
+    def test_set_state_batches_updates(self):
+        """Test POST /api/state applies several state keys in one request."""
+        import parrot.api.web_server as web_server_module
+
+        mock_state = Mock()
+        web_server_module.state_instance = mock_state
+
+        response = self.client.post(
+            "/api/state",
+            json={"mode": "rave", "vj_mode": "full_rave", "effect": "strobe"},
+        )
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data == {
+            "success": True,
+            "mode": "rave",
+            "vj_mode": "full_rave",
+            "effect": "strobe",
+        }
+        mock_state.set_mode_thread_safe.assert_called_once_with(Mode.rave)
+        mock_state.set_vj_mode_thread_safe.assert_called_once_with(VJMode.full_rave)
+        mock_state.set_effect_thread_safe.assert_called_once_with("strobe")
+
+    def test_set_state_rejects_bad_keys_without_applying(self):
+        """Test POST /api/state applies nothing when any key is invalid."""
+        import parrot.api.web_server as web_server_module
+
+        mock_state = Mock()
+        web_server_module.state_instance = mock_state
+
+        response = self.client.post("/api/state", json={"mode": "rave", "hue": 3})
+        assert response.status_code == 400
+        response = self.client.post("/api/state", json={"mode": "rave", "vj_mode": "x"})
+        assert response.status_code == 400
+        response = self.client.post("/api/state", json={})
+        assert response.status_code == 400
+        mock_state.set_mode_thread_safe.assert_not_called()
+
     def test_index_route(self):
         """Test GET / serves index.html."""
         with patch("parrot.api.web_server.send_from_directory") as mock_send:
@@ -350,6 +420,26 @@ class TestWebServer:
             assert response.status_code == 200
             mock_send.assert_called_once()
 
+    def test_static_files_conditional_get(self):
+        """Test static assets are cacheable and revalidate with 304."""
+        response = self.client.get("/styles.css")
+        assert response.status_code == 200
+        assert response.cache_control.max_age == 3600
+        assert response.cache_control.public
+        etag = response.headers["ETag"]
+        response.close()
+
+        response = self.client.get("/styles.css", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.data == b""
+
+        response = self.client.get("/")
+        assert response.cache_control.max_age == 0
+        response = self.client.get(
+            "/", headers={"If-Modified-Since": response.headers["Last-Modified"]}
+        )
+        assert response.status_code == 304
+
     @patch("threading.Thread")
     @patch("builtins.print")
     def test_start_web_server(self, mock_print, mock_thread):
@@ -375,6 +465,40 @@ class TestWebServer:
             "\n🌐 Web interface available at: http://192.168.1.100:8080/"
         )
 
+    def test_start_web_server_rejects_unknown_server(self):
+        """Test start_web_server rejects unsupported WSGI servers."""
+        with pytest.raises(ValueError):
+            start_web_server(Mock(), server="tornado")
+        with pytest.raises(ValueError):
+            start_web_server(Mock(), threaded=False, server="gevent")
+
+    @patch("threading.Thread")
+    @patch("builtins.print")
+    def test_start_web_server_gevent_thread(self, mock_print, mock_thread):
+        """Test the threaded gevent server is served from a daemon thread."""
+        with patch(
+            "parrot.api.web_server.get_local_ip", return_value="127.0.0.1"
+        ), patch("parrot.api.web_server.importlib.import_module"):
+            start_web_server(Mock(), port=8080, server="gevent")
+
+        _, kwargs = mock_thread.call_args
+        assert kwargs["args"] == ("0.0.0.0", 8080, "gevent")
+        assert kwargs["daemon"] is True
+
+    @patch("threading.Thread")
+    @patch("builtins.print")
+    def test_start_web_server_missing_optional_server(self, mock_print, mock_thread):
+        """Test a missing optional server fails before the URL is announced."""
+        with patch(
+            "parrot.api.web_server.importlib.import_module",
+            side_effect=ImportError("No module named 'bjoern'"),
+        ):
+            with pytest.raises(ImportError, match="bjoern"):
+                start_web_server(Mock(), server="bjoern")
+
+        mock_print.assert_not_called()
+        mock_thread.assert_not_called()
+
     def test_app_configuration(self):
         """Test Flask app configuration."""
         assert isinstance(app, Flask)
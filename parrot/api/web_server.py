@@ -1,9 +1,12 @@
+import importlib
+import json
 import os
 import socket
 import threading
 import time
 import logging
-from flask import Flask, jsonify, request, send_from_directory
+from beartype import beartype
+from flask import Flask, Response, jsonify, request, send_from_directory
 from parrot.director.mode import Mode
 from parrot.vj.vj_mode import VJMode
 from parrot.state import State
@@ -12,14 +15,78 @@ from parrot.patch_bay import has_manual_dimmer
 # Create Flask app
 app = Flask(__name__)
 
+# Directory holding the web UI assets
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
 # Global reference to the state object
 state_instance = None
 # Global reference to the director object
 director_instance = None
+
+
+@beartype
+class HypeState:
+    """When hype was last deployed, shared between request handlers.
+
+    The timestamp is one slot written whole, so handlers on other threads
+    never see a partially updated value and need no global statement.
+    """
+
+    __slots__ = ("deployed_at",)
+
+    def __init__(self):
+        # Never deployed
+        self.deployed_at = float("-inf")
+
+
 # Track when hype was last deployed
-last_hype_time = 0
+hype_state = HypeState()
 # How long hype lasts (in seconds)
 HYPE_DURATION = 8
+# Mode names are fixed at import time, so build them once
+MODE_NAMES = tuple(p.name for p in Mode)
+VJ_MODE_NAMES = tuple(m.name for m in VJMode)
+MODE_BY_NAME = {p.name: p for p in Mode}
+VJ_MODE_BY_NAME = {m.name: m for m in VJMode}
+
+# State keys the POST routes can set: key -> (name lookup or None for free-form
+# values, thread-safe State setter)
+STATE_SETTERS = {
+    "mode": (MODE_BY_NAME, lambda state, mode: state.set_mode_thread_safe(mode)),
+    "vj_mode": (
+        VJ_MODE_BY_NAME,
+        lambda state, vj_mode: state.set_vj_mode_thread_safe(vj_mode),
+    ),
+    "effect": (None, lambda state, effect: state.set_effect_thread_safe(effect)),
+}
+
+
+def encode_json(payload):
+    """Serialize a response body the way jsonify does in production (compact)."""
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+# GET bodies for every possible current mode, encoded once instead of per poll
+MODE_RESPONSE_BODIES = {
+    mode: encode_json(
+        {"mode": mode.name if mode else None, "available_modes": MODE_NAMES}
+    )
+    for mode in (None, *Mode)
+}
+VJ_MODE_RESPONSE_BODIES = {
+    vj_mode: encode_json(
+        {
+            "vj_mode": vj_mode.name if vj_mode else None,
+            "available_vj_modes": VJ_MODE_NAMES,
+        }
+    )
+    for vj_mode in (None, *VJMode)
+}
+# Browser cache lifetime for static assets (in seconds). index.html always
+# revalidates so asset changes are picked up; unchanged files answer with 304.
+STATIC_MAX_AGE = 3600
+# WSGI servers that can host the app; gevent and bjoern are optional installs
+WEB_SERVERS = ("werkzeug", "gevent", "bjoern")
 
 
 def get_local_ip():
@@ -39,75 +106,37 @@ def get_local_ip():
 @app.route("/api/mode", methods=["GET"])
 def get_mode():
     """Get the current mode."""
-    if state_instance and state_instance.mode:
-        return jsonify(
-            {
-                "mode": state_instance.mode.name,
-                "available_modes": [p.name for p in Mode],
-            }
-        )
-    return jsonify({"mode": None, "available_modes": [p.name for p in Mode]})
+    mode = state_instance.mode if state_instance else None
+    return Response(MODE_RESPONSE_BODIES[mode], mimetype="application/json")
 
 
 @app.route("/api/mode", methods=["POST"])
 def set_mode():
     """Set the current mode."""
-    if not state_instance:
-        return jsonify({"error": "State not initialized"}), 500
-
-    data = request.json
-    if not data or "mode" not in data:
-        return jsonify({"error": "Missing mode parameter"}), 400
-
-    mode_name = data["mode"]
-    try:
-        mode = Mode[mode_name]
-
-        # Return success immediately to make the web UI responsive
-        response = jsonify({"success": True, "mode": mode.name})
-
-        # Use the thread-safe method to set the mode (after preparing the response)
-        state_instance.set_mode_thread_safe(mode)
-
-        return response
-    except KeyError:
-        return (
-            jsonify(
-                {
-                    "error": f"Invalid mode: {mode_name}. Available modes: {[p.name for p in Mode]}"
-                }
-            ),
-            400,
-        )
+    return update_state(request.json, only="mode")
 
 
 @app.route("/")
 def index():
     """Serve the main HTML page."""
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    static_dir = os.path.join(current_dir, "static")
-    return send_from_directory(static_dir, "index.html")
+    return send_from_directory(STATIC_DIR, "index.html", max_age=0)
 
 
 @app.route("/<path:path>")
 def static_files(path):
     """Serve static files."""
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    static_dir = os.path.join(current_dir, "static")
-    return send_from_directory(static_dir, path)
+    return send_from_directory(STATIC_DIR, path, max_age=STATIC_MAX_AGE)
 
 
 @app.route("/api/hype", methods=["POST"])
 def deploy_hype():
     """Deploy hype."""
-    global last_hype_time
-
     if not state_instance or not director_instance:
         return jsonify({"error": "State or Director not initialized"}), 500
 
     # Deploy hype
     director_instance.deploy_hype()
-    last_hype_time = time.time()
+    hype_state.deployed_at = time.monotonic()
 
     return jsonify(
         {"success": True, "message": "Hype deployed! [!]", "duration": HYPE_DURATION}
@@ -117,17 +146,22 @@ def deploy_hype():
 @app.route("/api/hype/status", methods=["GET"])
 def get_hype_status():
     """Get the current hype status."""
-    global last_hype_time
-    current_time = time.time()
-    elapsed = current_time - last_hype_time
+    deployed_at = hype_state.deployed_at
+    elapsed = time.monotonic() - deployed_at
 
     if elapsed < HYPE_DURATION:
-        # Hype is still active
+        # Hype is still active; the countdown changes every poll, so never cache it
         remaining = HYPE_DURATION - elapsed
         return jsonify({"active": True, "remaining": remaining})
-    else:
-        # Hype is no longer active
-        return jsonify({"active": False, "remaining": 0})
+
+    # Hype is no longer active. This answer only changes when hype is deployed
+    # again, so let pollers reuse it for a second and revalidate against the
+    # deploy time after that
+    response = jsonify({"active": False, "remaining": 0})
+    response.cache_control.public = True
+    response.cache_control.max_age = 1
+    response.set_etag(f"{deployed_at}-inactive", weak=True)
+    return response.make_conditional(request)
 
 
 @app.route("/api/manual_dimmer", methods=["GET"])
@@ -157,76 +191,134 @@ def set_manual_dimmer():
 @app.route("/api/effect", methods=["POST"])
 def set_effect():
     """Set the current effect."""
-    if not state_instance:
-        return jsonify({"error": "State not initialized"}), 500
-
-    data = request.json
-    if not data or "effect" not in data:
-        return jsonify({"error": "Missing effect parameter"}), 400
-
-    effect = data["effect"]
-    try:
-        # Return success immediately to make the web UI responsive
-        response = jsonify({"success": True, "effect": effect})
-
-        # Use the thread-safe method to set the effect (after preparing the response)
-        state_instance.set_effect_thread_safe(effect)
-
-        return response
-    except Exception as e:
-        return jsonify({"error": f"Error setting effect: {str(e)}"}), 500
+    return update_state(request.json, only="effect")
 
 
 @app.route("/api/vj_mode", methods=["GET"])
 def get_vj_mode():
     """Get the current VJ mode."""
-    if state_instance and state_instance.vj_mode:
-        return jsonify(
-            {
-                "vj_mode": state_instance.vj_mode.name,
-                "available_vj_modes": [mode.name for mode in VJMode],
-            }
-        )
-    return jsonify(
-        {"vj_mode": None, "available_vj_modes": [mode.name for mode in VJMode]}
-    )
+    vj_mode = state_instance.vj_mode if state_instance else None
+    return Response(VJ_MODE_RESPONSE_BODIES[vj_mode], mimetype="application/json")
 
 
 @app.route("/api/vj_mode", methods=["POST"])
 def set_vj_mode():
     """Set the current VJ mode."""
+    return update_state(request.json, only="vj_mode")
+
+
+@app.route("/api/state", methods=["POST"])
+def set_state():
+    """Set any of mode, vj_mode and effect in one request."""
+    return update_state(request.json)
+
+
+def update_state(data, only=None):
+    """Validate every requested state change, then apply them with the thread-safe setters.
+
+    With ``only`` set, just that key is read from ``data`` (the single-value routes).
+    """
     if not state_instance:
         return jsonify({"error": "State not initialized"}), 500
 
-    data = request.json
-    if not data or "vj_mode" not in data:
-        return jsonify({"error": "Missing vj_mode parameter"}), 400
+    if only is not None:
+        if not data or only not in data:
+            return jsonify({"error": f"Missing {only} parameter"}), 400
+        data = {only: data[only]}
+    elif not isinstance(data, dict) or not data:
+        return jsonify({"error": "Missing state parameters"}), 400
+
+    # Resolve everything before touching state so a bad key applies nothing
+    updates = []
+    for key, raw_value in data.items():
+        if key not in STATE_SETTERS:
+            return (
+                jsonify(
+                    {
+                        "error": f"Unknown state key: {key}. Available keys: {list(STATE_SETTERS)}"
+                    }
+                ),
+                400,
+            )
+        by_name, setter = STATE_SETTERS[key]
+        if by_name is None:
+            updates.append((key, raw_value, raw_value, setter))
+            continue
+        value = by_name.get(raw_value)
+        if value is None:
+            return (
+                jsonify(
+                    {
+                        "error": f"Invalid {key}: {raw_value}. Available modes: {list(by_name)}"
+                    }
+                ),
+                400,
+            )
+        updates.append((key, value.name, value, setter))
+
+    # Return success immediately to make the web UI responsive
+    response = jsonify(
+        {"success": True, **{key: shown for key, shown, _, _ in updates}}
+    )
 
-    vj_mode_name = data["vj_mode"]
-    try:
-        vj_mode = VJMode[vj_mode_name]
+    # Use the thread-safe setters (after preparing the response)
+    for key, _, value, setter in updates:
+        try:
+            setter(state_instance, value)
+        except Exception as e:
+            return jsonify({"error": f"Error setting {key}: {str(e)}"}), 500
 
-        # Return success immediately to make the web UI responsive
-        response = jsonify({"success": True, "vj_mode": vj_mode.name})
+    return response
 
-        # Use the thread-safe method to set the VJ mode (after preparing the response)
-        state_instance.set_vj_mode_thread_safe(vj_mode)
 
-        return response
-    except KeyError:
-        return (
-            jsonify(
-                {
-                    "error": f"Invalid vj_mode: {vj_mode_name}. Available modes: {[mode.name for mode in VJMode]}"
-                }
-            ),
-            400,
-        )
+def _check_server_available(server):
+    """Import an optional WSGI server up front so a missing package fails at startup."""
+    module = {"gevent": "gevent.pywsgi", "bjoern": "bjoern"}.get(server)
+    if module is None:
+        return
+    try:
+        importlib.import_module(module)
+    except ImportError as e:
+        raise ImportError(
+            f"Web server {server} is not installed; install it with "
+            f"`poetry install -E {server}`"
+        ) from e
+
+
+def _serve_forever(host, port, server):
+    """Run the app on the chosen WSGI server until the process exits."""
+    if server == "gevent":
+        from gevent.pywsgi import WSGIServer
 
+        WSGIServer((host, port), app, log=None).serve_forever()
+    elif server == "bjoern":
+        import bjoern
 
-def start_web_server(state, director=None, host="0.0.0.0", port=5000, threaded=True):
-    """Start the web server in a separate thread or return the app for main thread integration."""
+        bjoern.run(app, host, port)
+    else:
+        app.run(host=host, port=port, debug=False, use_reloader=False)
+
+
+def start_web_server(
+    state,
+    director=None,
+    host="0.0.0.0",
+    port=5000,
+    threaded=True,
+    server="werkzeug",
+):
+    """Start the web server in a separate thread or return the app for main thread integration.
+
+    ``server`` picks the WSGI server for the threaded mode. Main thread integration
+    polls the listening socket per request, so it always uses Werkzeug.
+    """
     global state_instance, director_instance
+    if server not in WEB_SERVERS:
+        raise ValueError(f"Unknown web server: {server}. Available: {WEB_SERVERS}")
+    if not threaded and server != "werkzeug":
+        raise ValueError(f"Main thread integration requires werkzeug, got {server}")
+    _check_server_available(server)
+
     state_instance = state
     director_instance = director
 
@@ -241,11 +333,10 @@ def start_web_server(state, director=None, host="0.0.0.0", port=5000, threaded=T
     print(f"[*] Connect from your mobile device using the above URL\n")
 
     if threaded:
-        # Start Flask in a separate thread (legacy mode)
+        # Start the WSGI server in a separate thread
         threading.Thread(
-            target=lambda: app.run(
-                host=host, port=port, debug=False, use_reloader=False
-            ),
+            target=_serve_forever,
+            args=(host, port, server),
             daemon=True,
         ).start()
         return None
@@ -1,6 +1,9 @@
+from functools import cached_property
+
+import numpy as np
+
 from parrot.utils.colour import Color
 from parrot.utils.lerp import Lerpable
-from parrot.utils.color_extra import lerp_color
 
 
 class ColorScheme(Lerpable):
@@ -9,12 +12,24 @@ class ColorScheme(Lerpable):
         self.bg = bg
         self.bg_contrast = bg_contrast
 
+    @cached_property
+    def rgb(self) -> tuple:
+        """fg, bg and bg_contrast as RGB tuples, converted from HSL once per scheme
+
+        Every VJ node rendering this scheme in a frame shares the conversion.
+        """
+        return (self.fg.rgb, self.bg.rgb, self.bg_contrast.rgb)
+
+    @cached_property
+    def rgb_array(self) -> np.ndarray:
+        """fg, bg and bg_contrast as rows of a float32 RGB array, computed once per scheme"""
+        return np.array(self.rgb, dtype=np.float32)
+
     def lerp(self, other, t):
-        return ColorScheme(
-            lerp_color(self.fg, other.fg, t),
-            lerp_color(self.bg, other.bg, t),
-            lerp_color(self.bg_contrast, other.bg_contrast, t),
-        )
+        # One vectorized lerp over all 9 channels; the endpoint arrays are
+        # cached on the schemes, which stay fixed for the whole transition
+        a = self.rgb_array
+        return ColorScheme.from_array(a + (other.rgb_array - a) * t)
 
     def to_list(self):
         return [self.fg, self.bg, self.bg_contrast]
@@ -25,3 +40,8 @@ class ColorScheme(Lerpable):
     @classmethod
     def from_list(cls, list):
         return cls(list[0], list[1], list[2])
+
+    @classmethod
+    def from_array(cls, rgb: np.ndarray):
+        fg, bg, bg_contrast = rgb.tolist()
+        return cls(Color(rgb=fg), Color(rgb=bg), Color(rgb=bg_contrast))
@@ -1,11 +1,13 @@
 import random
 import re
+import sys
 import time
 import os
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from colorama import Fore, Style, init
-from parrot.director.frame import Frame, FrameSignal
+from parrot.director.frame import Frame, FrameSignal, SIGNAL_BITS
 
 from parrot.patch_bay import venue_patches, get_manual_group
 from parrot.fixtures.led_par import Par
@@ -21,6 +23,7 @@ from parrot.fixtures.laser import Laser
 from parrot.fixtures.chauvet.rotosphere import ChauvetRotosphere_28Ch
 from parrot.fixtures.chauvet.derby import ChauvetDerby
 from .mode_interpretations import get_interpreter
+from parrot.interpreters.signal import SIGNAL_PROBABILITIES
 
 from parrot.utils.lerp import LerpAnimator
 from parrot.fixtures.moving_head import MovingHead
@@ -33,19 +36,48 @@ WARMUP_SECONDS = max(int(os.environ.get("WARMUP_TIME", "1")), 1)
 
 HYPE_BUCKETS = [10, 40, 70]
 
+# Print the lighting tree on every regeneration/shift (PARROT_DEBUG_TREE=1)
+DEBUG_TREE = os.getenv("PARROT_DEBUG_TREE", "").lower() in ("true", "1", "yes")
 
-def filter_nones(l):
-    return [i for i in l if i is not None]
+# Loose (ungrouped) fixtures of each of these types are grouped together
+GROUPED_FIXTURE_TYPES = [
+    Par,
+    MovingHead,
+    Motionstrip,
+    Laser,
+    ChauvetRotosphere_28Ch,
+    ChauvetDerby,
+]
+GROUPED_FIXTURE_BUCKETS = {cls: idx for idx, cls in enumerate(GROUPED_FIXTURE_TYPES)}
+
+# Interpreters drive disjoint fixture groups, so their step() calls can run
+# concurrently. Only worth it on free-threaded builds; with the GIL a pool just
+# adds handoff overhead to every frame.
+PARALLEL_STEP = not getattr(sys, "_is_gil_enabled", lambda: True)()
+STEP_WORKERS = 8
+
+# Strip ANSI color codes and non-ascii characters from interpreter strings
+ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;]*m")
+NON_ASCII_RE = re.compile(r"[^\x00-\x7F]+")
+
+
+def is_signal_switch(interpreter) -> bool:
+    return hasattr(interpreter, "responds_mask") and hasattr(interpreter, "set_enabled")
 
 
 class Director:
     def __init__(self, state: State, vj_director=None):
-        self.scheme = LerpAnimator(random.choice(color_schemes), 4)
-        self.last_shift_time = time.time()
+        # Private generator: shifts skip the module-level random wrappers
+        self.rng = random.Random()
+        self.scheme = LerpAnimator(self.rng.choice(color_schemes), 4)
+        self.last_shift_time = time.monotonic()
         self.shift_count = 0
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.state = state
         self.vj_director = vj_director
+        # Sized to the interpreter count by set_interpreters
+        self.step_pool = None
+        self.step_workers = 0
 
         # Initialize position manager first (so fixtures have positions before interpreters are created)
         self.position_manager = FixturePositionManager(state)
@@ -61,26 +93,21 @@ class Director:
         self.state.events.on_venue_change += lambda s: self.setup_patch()
 
     def setup_patch(self):
+        # Resolve the venue's fixtures once per venue change, not per frame
+        self.venue_fixtures = tuple(venue_patches[self.state.venue])
+        self.manual_group = get_manual_group(self.state.venue)
         self.group_fixtures()
         self.generate_all()  # Initialize both lighting and VJ
 
     def group_fixtures(self):
-        to_group = [
-            Par,
-            MovingHead,
-            Motionstrip,
-            Laser,
-            ChauvetRotosphere_28Ch,
-            ChauvetDerby,
-        ]
         self.fixture_groups = []
 
         # Get all fixtures from the venue patch
-        all_fixtures = venue_patches[self.state.venue]
+        all_fixtures = self.venue_fixtures
 
-        # First, collect any existing FixtureGroup instances
-        grouped_fixtures = []
-        ungrouped_fixtures = []
+        # Existing FixtureGroup instances become groups as-is, loose fixtures are
+        # bucketed by the first GROUPED_FIXTURE_TYPES entry in their class hierarchy
+        buckets = [[] for _ in GROUPED_FIXTURE_TYPES]
 
         for fixture in all_fixtures:
             if isinstance(fixture, FixtureGroup):
@@ -88,38 +115,30 @@ class Director:
                 if isinstance(fixture, ManualGroup):
                     continue
                 self.fixture_groups.append(fixture.fixtures)
-                grouped_fixtures.extend(fixture.fixtures)
             else:
-                ungrouped_fixtures.append(fixture)
+                for base in type(fixture).__mro__:
+                    bucket_idx = GROUPED_FIXTURE_BUCKETS.get(base)
+                    if bucket_idx is not None:
+                        buckets[bucket_idx].append(fixture)
+                        break
 
-        # Then apply the existing algorithm to ungrouped fixtures
-        for cls in to_group:
-            fixtures = [i for i in ungrouped_fixtures if isinstance(i, cls)]
-            if len(fixtures) > 0:
-                self.fixture_groups.append(fixtures)
+        self.fixture_groups.extend(bucket for bucket in buckets if bucket)
 
     def format_fixture_names(self, fixtures):
         # Format fixtures
-        fixtures = [str(j) for j in fixtures]
         if len(fixtures) == 1:
-            return fixtures[0]
-        
-        # Group fixtures by type (base name)
+            return str(fixtures[0])
+
+        # Group fixture addresses by type (base name)
         grouped = defaultdict(list)
         for f in fixtures:
-            parts = f.split(" @ ")
-            base_name = parts[0]
-            address = int(parts[1])
-            grouped[base_name].append(address)
-        
+            grouped[f.name].append(f.address)
+
         # Format each group: "type @ addr1, addr2, addr3"
-        parts = []
-        for base_name in sorted(grouped.keys()):
-            addresses = sorted(grouped[base_name])
-            addr_str = ", ".join(str(addr) for addr in addresses)
-            parts.append(f"{base_name} @ {addr_str}")
-        
-        return "; ".join(parts)
+        return "; ".join(
+            f"{base_name} @ {', '.join(str(addr) for addr in sorted(grouped[base_name]))}"
+            for base_name in sorted(grouped)
+        )
 
     def print_lighting_tree(self, context: str = ""):
         """Print a tree representation of the lighting interpreters"""
@@ -138,35 +157,69 @@ class Director:
             
             fixture_str = self.format_fixture_names(interpreter.group)
             # Strip all ANSI escape sequences from interpreter string
-            interpreter_str = re.sub(r'\x1b\[[0-9;]*m', '', str(interpreter))
+            interpreter_str = ANSI_ESCAPE_RE.sub("", str(interpreter))
             # Strip non-ascii characters
-            interpreter_str = re.sub(r'[^\x00-\x7F]+', '', interpreter_str)
+            interpreter_str = NON_ASCII_RE.sub("", interpreter_str)
             
             result += f"{connector}{Fore.BLUE}{fixture_str}{Style.RESET_ALL} {interpreter_str}\n"
         
         return result
 
-    def generate_interpreters(self):
-        """Generate interpreters for lighting only (does not affect VJ)"""
-        self.interpreters: List[InterpreterBase] = [
+    def hype_bracket(self):
+        """Min and max hype interpreters may pick, narrowed around the current hype when limited"""
+        if not self.state.hype_limiter:
+            return 0, 100
+        return max(0, self.state.hype - 30), min(100, self.state.hype + 30)
+
+    def build_interpreters(self) -> List[InterpreterBase]:
+        """Build a fresh interpreter for every fixture group"""
+        mode = self.state.mode
+        allow_rainbows = self.state.theme.allow_rainbows
+        min_hype, max_hype = self.hype_bracket()
+        return [
             get_interpreter(
-                self.state.mode,
+                mode,
                 group,
                 InterpreterArgs(
                     HYPE_BUCKETS[idx % len(HYPE_BUCKETS)],
-                    self.state.theme.allow_rainbows,
-                    0 if not self.state.hype_limiter else max(0, self.state.hype - 30),
-                    (
-                        100
-                        if not self.state.hype_limiter
-                        else min(100, self.state.hype + 30)
-                    ),
+                    allow_rainbows,
+                    min_hype,
+                    max_hype,
                 ),
             )
             for idx, group in enumerate(self.fixture_groups)
         ]
 
-        print(self.print_lighting_tree(f"after initialization to {self.state.mode.name}"))
+    def set_interpreters(self, interpreters: List[InterpreterBase]):
+        """Install a full set of interpreters and index the signal switches among them"""
+        self.interpreters = interpreters
+        self.signal_switches = [i for i in interpreters if is_signal_switch(i)]
+        self.resize_step_pool(len(interpreters))
+
+    def resize_step_pool(self, count: int):
+        """Keep one step worker per interpreter, up to STEP_WORKERS"""
+        workers = min(STEP_WORKERS, count) if PARALLEL_STEP else 0
+        if workers == self.step_workers:
+            return
+        if self.step_pool is not None:
+            self.step_pool.shutdown(wait=False)
+        self.step_pool = ThreadPoolExecutor(max_workers=workers) if workers else None
+        self.step_workers = workers
+
+    def cleanup(self):
+        """Stop the step workers"""
+        self.resize_step_pool(0)
+
+    def log_lighting_tree(self, context: str):
+        """Print the lighting tree when DEBUG_TREE is on; otherwise skip building it"""
+        if DEBUG_TREE:
+            print(self.print_lighting_tree(context))
+
+    def generate_interpreters(self):
+        """Generate interpreters for lighting only (does not affect VJ)"""
+        self.set_interpreters(self.build_interpreters())
+
+        self.log_lighting_tree(f"after initialization to {self.state.mode.name}")
 
     def generate_all(self):
         """Generate both lighting interpreters and VJ visuals"""
@@ -177,30 +230,28 @@ class Director:
             self.vj_director.shift(self.state.vj_mode, threshold=1.0)
 
     def generate_color_scheme(self):
-        s = random.choice(self.state.theme.color_scheme)
+        s = self.rng.choice(self.state.theme.color_scheme)
         self.scheme.push(s)
         print(f"Shifting to {format_color_scheme(s)}")
 
     def shift_color_scheme(self):
-        s = random.choice(self.state.theme.color_scheme)
+        s = self.rng.choice(self.state.theme.color_scheme)
         st = s.to_list()
         ct = self.scheme.render().to_list()
-        idx = random.randint(0, 2)
+        idx = self.rng.randrange(3)
         ct[idx] = st[idx]
         new_scheme = ColorScheme.from_list(ct)
         self.scheme.push(new_scheme)
         print(f"Shifting to {format_color_scheme(new_scheme)}")
 
     def shift_interpreter(self):
-        eviction_index = random.randint(0, len(self.interpreters) - 1)
+        eviction_index = self.rng.randrange(len(self.interpreters))
         eviction_group = self.fixture_groups[eviction_index]
 
-        hype_bracket = (
-            0 if not self.state.hype_limiter else max(0, self.state.hype - 30),
-            100 if not self.state.hype_limiter else min(100, self.state.hype + 30),
-        )
+        hype_bracket = self.hype_bracket()
 
-        self.interpreters[eviction_index] = get_interpreter(
+        evicted = self.interpreters[eviction_index]
+        replacement = get_interpreter(
             self.state.mode,
             eviction_group,
             InterpreterArgs(
@@ -210,53 +261,44 @@ class Director:
                 hype_bracket[1],
             ),
         )
+        self.interpreters[eviction_index] = replacement
+
+        # Keep the signal switch index in step with the swapped slot
+        if is_signal_switch(evicted):
+            self.signal_switches.remove(evicted)
+        if is_signal_switch(replacement):
+            self.signal_switches.append(replacement)
 
     def ensure_each_signal_is_enabled(self):
-        """Makes a list of every interpreter that is a SignalSwitch. Then for each signal they handle, ensures
-        at least one interpreter handles it. If not, a randomly selected SignalSwitch has the un-handled signal enabled.
+        """For each signal the SignalSwitch interpreters handle, ensures at least one interpreter
+        handles it. If not, a randomly selected SignalSwitch has the un-handled signal enabled.
         """
-        signal_switches = [
-            i
-            for i in self.interpreters
-            if hasattr(i, "responds_to") and hasattr(i, "set_enabled")
-        ]
+        signal_switches = self.signal_switches
         if not signal_switches:
             return
 
-        for signal in FrameSignal:
-            if not any(i.responds_to.get(signal, False) for i in signal_switches):
-                random.choice(signal_switches).set_enabled(signal, True)
+        covered = 0
+        for i in signal_switches:
+            covered |= i.responds_mask
+
+        for signal in SIGNAL_PROBABILITIES:
+            if not covered & SIGNAL_BITS[signal]:
+                self.rng.choice(signal_switches).set_enabled(signal, True)
 
     def shift_lighting_only(self):
         """Full shift of DMX lighting only (no VJ changes) - regenerates all interpreters"""
         self.generate_color_scheme()
 
         # Regenerate all interpreters (similar to generate_interpreters but without VJ shift)
-        self.interpreters: List[InterpreterBase] = [
-            get_interpreter(
-                self.state.mode,
-                group,
-                InterpreterArgs(
-                    HYPE_BUCKETS[idx % len(HYPE_BUCKETS)],
-                    self.state.theme.allow_rainbows,
-                    0 if not self.state.hype_limiter else max(0, self.state.hype - 30),
-                    (
-                        100
-                        if not self.state.hype_limiter
-                        else min(100, self.state.hype + 30)
-                    ),
-                ),
-            )
-            for idx, group in enumerate(self.fixture_groups)
-        ]
+        self.set_interpreters(self.build_interpreters())
 
         self.ensure_each_signal_is_enabled()
 
-        self.last_shift_time = time.time()
+        self.last_shift_time = time.monotonic()
         self.shift_count += 1
 
         # Print the tree structure after shift
-        print(self.print_lighting_tree(f"after shift #{self.shift_count} to {self.state.mode.name}"))
+        self.log_lighting_tree(f"after shift #{self.shift_count} to {self.state.mode.name}")
 
     def shift_vj_only(self):
         """Full shift of VJ visuals only (no lighting changes) - complete regeneration"""
@@ -273,16 +315,17 @@ class Director:
         if self.vj_director:
             self.vj_director.shift(self.state.vj_mode, threshold=0.3)
 
-        self.last_shift_time = time.time()
+        self.last_shift_time = time.monotonic()
         self.shift_count += 1
 
         # Print the tree structure after shift
-        print(self.print_lighting_tree(f"after shift #{self.shift_count} to {self.state.mode.name}"))
+        self.log_lighting_tree(f"after shift #{self.shift_count} to {self.state.mode.name}")
 
     def step(self, frame: Frame):
         self.last_frame = frame
         scheme = self.scheme.render()
-        run_time = time.time() - self.start_time
+        now = time.monotonic()
+        run_time = now - self.start_time
         warmup_phase = min(1, run_time / WARMUP_SECONDS)
 
         if warmup_phase == 1 and not self.warmup_complete:
@@ -293,18 +336,22 @@ class Director:
 
         # Reset fixture state before interpreter step() calls
         # This ensures strobe values accumulate using max(existing, new)
-        for fixture in venue_patches[self.state.venue]:
+        for fixture in self.venue_fixtures:
             fixture.begin()
 
-        for i in self.interpreters:
-            i.step(frame, scheme)
+        if self.step_pool is None:
+            for i in self.interpreters:
+                i.step(frame, scheme)
+        else:
+            # Each interpreter only mutates fixtures in its own group
+            list(self.step_pool.map(lambda i: i.step(frame, scheme), self.interpreters))
 
         # Pass frame and scheme to VJ system for rendering
         if self.vj_director:
             self.vj_director.step(frame, scheme)
 
         if (
-            time.time() - self.last_shift_time > SHIFT_AFTER
+            now - self.last_shift_time > SHIFT_AFTER
             and frame[FrameSignal.sustained_low] < 0.2
         ):
             for i in self.interpreters:
@@ -312,14 +359,14 @@ class Director:
             self.shift()
 
     def render(self, dmx):
-        # Get manual group and set its dimmer value
-        manual_group = get_manual_group(self.state.venue)
+        # Set the manual group's dimmer value
+        manual_group = self.manual_group
         if manual_group:
             manual_group.set_manual_dimmer(self.state.manual_dimmer)
             manual_group.render(dmx)
 
         # Render all fixtures
-        for i in venue_patches[self.state.venue]:
+        for i in self.venue_fixtures:
             i.render(dmx)
 
         dmx.submit()
@@ -332,4 +379,4 @@ class Director:
         print(f"mode changed to: {mode.name}")
         # Regenerate lighting interpreters only (VJ is independent)
         self.generate_interpreters()
-        print(self.print_lighting_tree(f"after mode change to {mode.name}"))
+        self.log_lighting_tree(f"after mode change to {mode.name}")
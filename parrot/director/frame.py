@@ -19,6 +19,10 @@ class FrameSignal(enum.Enum):
     dampen = "dampen"
 
 
+# One bit per signal, for packing sets of signals into an int mask
+SIGNAL_BITS = {signal: 1 << idx for idx, signal in enumerate(FrameSignal)}
+
+
 @beartype
 class Frame:
     def __init__(
@@ -45,12 +45,99 @@ class TestDirector(unittest.TestCase):
         self.assertEqual(self.director.state, self.state)
         self.assertFalse(self.director.warmup_complete)
 
+    def test_shift_interpreter_keeps_signal_switches_in_sync(self):
+        """Test that shifting interpreters keeps the cached signal switch list current"""
+        from itertools import cycle
+        from parrot.director.director import is_signal_switch
+        from parrot.interpreters.dimmer import Dimmer0
+        from parrot.interpreters.signal import signal_switch
+
+        # Alternate between plain and signal-switch interpreters
+        kinds = cycle([signal_switch(Dimmer0), Dimmer0, Dimmer0])
+        with patch(
+            "parrot.director.director.get_interpreter",
+            side_effect=lambda mode, group, args: next(kinds)(group, args),
+        ):
+            self.director.generate_interpreters()
+            for _ in range(20):
+                self.director.shift_interpreter()
+                expected = [
+                    i for i in self.director.interpreters if is_signal_switch(i)
+                ]
+                self.assertCountEqual(self.director.signal_switches, expected)
+
     def test_setup_patch(self):
         """Test that setup_patch creates fixture groups and interpreters"""
         self.director.setup_patch()
         self.assertIsNotNone(self.director.fixture_groups)
         self.assertIsNotNone(self.director.interpreters)
 
+    def test_venue_change_refreshes_cached_fixtures(self):
+        """Test that the cached venue fixtures follow venue changes"""
+        from parrot.patch_bay import venues, venue_patches, get_manual_group
+
+        self.state.set_venue(venues.mtn_lotus)
+        self.assertEqual(
+            self.director.venue_fixtures, tuple(venue_patches[venues.mtn_lotus])
+        )
+        self.assertIs(self.director.manual_group, get_manual_group(venues.mtn_lotus))
+
+    def test_parallel_step_runs_every_interpreter(self):
+        """Test that the threaded interpreter step still steps each interpreter once"""
+        with patch("parrot.director.director.PARALLEL_STEP", True):
+            director = Director(self.state)
+        self.assertIsNotNone(director.step_pool)
+
+        director.interpreters = [MagicMock() for _ in range(3)]
+        frame = Frame({signal: 0.5 for signal in FrameSignal})
+        director.step(frame)
+
+        for interpreter in director.interpreters:
+            interpreter.step.assert_called_once()
+        director.cleanup()
+        self.assertIsNone(director.step_pool)
+
+    def test_step_pool_follows_interpreter_count(self):
+        """Test the step pool is sized to the interpreters and rebuilt when they change"""
+        with patch("parrot.director.director.PARALLEL_STEP", True):
+            director = Director(self.state)
+            self.assertEqual(director.step_workers, min(8, len(director.interpreters)))
+
+            director.set_interpreters([MagicMock() for _ in range(2)])
+            self.assertEqual(director.step_workers, 2)
+            pool = director.step_pool
+
+            # Same group count keeps the running pool
+            director.set_interpreters([MagicMock() for _ in range(2)])
+            self.assertIs(director.step_pool, pool)
+
+            director.set_interpreters([MagicMock() for _ in range(20)])
+            self.assertEqual(director.step_workers, 8)
+            self.assertIsNot(director.step_pool, pool)
+
+            director.cleanup()
+            self.assertIsNone(director.step_pool)
+
+    def test_ensure_each_signal_is_enabled(self):
+        """Test that every switchable signal ends up handled by some interpreter"""
+        from parrot.interpreters.base import InterpreterArgs
+        from parrot.interpreters.dimmer import Dimmer0
+        from parrot.interpreters.signal import SIGNAL_PROBABILITIES, signal_switch
+
+        switch_cls = signal_switch(Dimmer0)
+        args = InterpreterArgs(50, True, 0, 100)
+        switches = [switch_cls(group, args) for group in self.director.fixture_groups]
+        for switch in switches:
+            for signal in SIGNAL_PROBABILITIES:
+                switch.set_enabled(signal, False)
+            self.assertEqual(switch.responds_mask, 0)
+
+        self.director.set_interpreters(switches)
+        self.director.ensure_each_signal_is_enabled()
+
+        for signal in SIGNAL_PROBABILITIES:
+            self.assertTrue(any(switch.is_enabled(signal) for switch in switches))
+
     def test_mode_change(self):
         """Test that mode changes trigger interpreter regeneration"""
         with patch.object(self.director, "generate_interpreters") as mock_gen:
@@ -64,6 +151,32 @@ class TestDirector(unittest.TestCase):
         new_scheme = self.director.scheme.render()
         self.assertNotEqual(original_scheme, new_scheme)
 
+    def test_color_scheme_lerp_matches_per_color_lerp(self):
+        """Test the vectorized scheme lerp agrees with lerping each color"""
+        from parrot.director.color_scheme import ColorScheme
+        from parrot.utils.color_extra import lerp_color
+        from parrot.utils.colour import Color
+
+        a = ColorScheme(Color("red"), Color("blue"), Color("#334455"))
+        b = ColorScheme(Color("green"), Color("white"), Color("#aa1100"))
+        mid = a.lerp(b, 0.3)
+        for got, x, y in zip(mid.to_list(), a.to_list(), b.to_list()):
+            expected = lerp_color(x, y, 0.3)
+            for got_c, expected_c in zip(got.rgb, expected.rgb):
+                self.assertAlmostEqual(got_c, expected_c, places=5)
+
+    def test_color_scheme_rgb_converted_once(self):
+        """Test a scheme's RGB tuples are converted once and shared"""
+        from parrot.director.color_scheme import ColorScheme
+        from parrot.utils.colour import Color
+
+        scheme = ColorScheme(Color("red"), Color("blue"), Color("#334455"))
+
+        self.assertEqual(
+            scheme.rgb, (scheme.fg.rgb, scheme.bg.rgb, scheme.bg_contrast.rgb)
+        )
+        self.assertIs(scheme.rgb, scheme.rgb)
+
     def test_manual_fixtures_rendered_to_dmx(self):
         """Test that manual fixtures are rendered to DMX output when present"""
         from parrot.patch_bay import venues, get_manual_group
@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 
-import time
+import threading
 import moderngl_window as mglw
 import moderngl as mgl
 from beartype import beartype
 import numpy as np
+from OpenGL import GL
 
 from parrot.audio.audio_analyzer import AudioAnalyzer
 from parrot.director.director import Director
@@ -13,6 +14,7 @@ from parrot.director.frame import Frame, FrameSignal
 from parrot.state import State
 from parrot.utils.dmx_utils import get_controller
 from parrot.vj.vj_director import VJDirector
+from parrot.vj.nodes.fixture_visualization import FixtureVisualization
 from parrot.director.signal_states import SignalStates
 from parrot.utils.overlay_ui import OverlayUI
 from parrot.keyboard_handler import KeyboardHandler
@@ -21,6 +23,29 @@ from parrot.director.themes import themes
 from parrot.vj.vj_mode import VJMode
 from parrot.patch_bay import venues
 
+TARGET_FPS = 60.0
+
+# Full-screen triangle strip for the display pass: x, y, u, v per vertex
+QUAD_VERTICES = np.array(
+    [
+        [-1.0, -1.0, 0.0, 0.0],
+        [1.0, -1.0, 1.0, 0.0],
+        [-1.0, 1.0, 0.0, 1.0],
+        [1.0, 1.0, 1.0, 1.0],
+    ],
+    dtype=np.float32,
+)
+QUAD_VERTICES.flags.writeable = False
+
+
+def cover_uv_scale(source_width, source_height, target_width, target_height):
+    """UV scale that crops the source to cover the target while keeping its aspect"""
+    src_aspect = source_width / source_height
+    dst_aspect = target_width / target_height
+    if src_aspect > dst_aspect:
+        return (dst_aspect / src_aspect, 1.0)
+    return (1.0, src_aspect / dst_aspect)
+
 
 def run_gl_window_app(args):
     """Run Party Parrot with modern GL window"""
@@ -60,8 +85,6 @@ def run_gl_window_app(args):
     director = Director(state, vj_director)
 
     # Initialize fixture renderer (uses director's position manager)
-    from parrot.vj.nodes.fixture_visualization import FixtureVisualization
-
     fixture_renderer = FixtureVisualization(
         state=state,
         position_manager=director.position_manager,
@@ -92,28 +115,14 @@ def run_gl_window_app(args):
     in vec2 uv;
     out vec3 color;
     uniform sampler2D source_texture;
-    uniform vec2 source_size;
-    uniform vec2 target_size;
+    uniform vec2 uv_scale;
     
     void main() {
-        float src_aspect = source_size.x / source_size.y;
-        float dst_aspect = target_size.x / target_size.y;
-        
-        float scale_x = 1.0;
-        float scale_y = 1.0;
-        if (src_aspect > dst_aspect) {
-            scale_x = src_aspect / dst_aspect;
-        } else {
-            scale_y = dst_aspect / src_aspect;
-        }
-        
         // Flip Y coordinate (OpenGL texture origin is bottom-left)
         vec2 flipped_uv = vec2(uv.x, 1.0 - uv.y);
         
-        vec2 centered = (flipped_uv - 0.5);
-        centered.x /= scale_x;
-        centered.y /= scale_y;
-        vec2 cover_uv = centered + 0.5;
+        // uv_scale crops the source to cover the window (computed on resize)
+        vec2 cover_uv = (flipped_uv - 0.5) * uv_scale + 0.5;
         
         color = texture(source_texture, cover_uv).rgb;
     }
@@ -123,47 +132,32 @@ def run_gl_window_app(args):
         vertex_shader=vertex_shader, fragment_shader=fragment_shader
     )
 
-    vertices = np.array(
-        [
-            -1.0,
-            -1.0,
-            0.0,
-            0.0,
-            1.0,
-            -1.0,
-            1.0,
-            0.0,
-            -1.0,
-            1.0,
-            0.0,
-            1.0,
-            1.0,
-            1.0,
-            1.0,
-            1.0,
-        ],
-        dtype=np.float32,
-    )
-
-    vbo = ctx.buffer(vertices.tobytes())
+    vbo = ctx.buffer(QUAD_VERTICES)
     display_quad = ctx.vertex_array(
         display_shader, [(vbo, "2f 2f", "in_position", "in_texcoord")]
     )
 
+    # Bind display uniforms once; the cover scale is only re-uploaded on resize
+    display_shader["source_texture"].value = 0
+    uv_scale_uniform = display_shader["uv_scale"]
+    last_display_sizes = None
+
     # Start web server if not disabled (integrated into main thread)
     web_server = None
     if not getattr(args, "no_web", False):
         from parrot.api import start_web_server
 
+        web_server_kind = getattr(args, "web_server", "werkzeug")
         web_server = start_web_server(
             state,
             director=director,
             port=getattr(args, "web_port", 4040),
-            threaded=False,  # Run in main thread
+            # Werkzeug runs in the main thread, other servers get their own thread
+            threaded=web_server_kind != "werkzeug",
+            server=web_server_kind,
         )
 
     # Timing
-    last_audio_update = time.perf_counter()
     audio_update_interval = 0.03
 
     # Check if we're in debug frame capture mode
@@ -375,13 +369,23 @@ def run_gl_window_app(args):
             print(f"   Error details: {type(e).__name__}")
             print("   Settings still available via overlay (ENTER key)")
 
-    create_settings_menus()
+    # Build the menus once the event loop is running so the first frame isn't
+    # held up by the PyObjC bridge calls
+    pyglet.clock.schedule_once(lambda dt: create_settings_menus(), 0.0)
 
     # Screenshot mode
     screenshot_mode = getattr(args, "screenshot", False)
-    screenshot_time = None
+    screenshot_due = False
+    # Pixel buffer the screenshot is read into; saved on the following frame
+    screenshot_pbo = None
+    screenshot_size = None
+
+    def mark_screenshot_due(dt):
+        nonlocal screenshot_due
+        screenshot_due = True
+
     if screenshot_mode:
-        screenshot_time = time.perf_counter() + 0.5
+        pyglet.clock.schedule_once(mark_screenshot_due, 0.5)
         print("[*] Screenshot mode: will capture after 0.5s and exit")
 
     # Override fixture mode if specified via args, otherwise use loaded/default
@@ -441,10 +445,22 @@ def run_gl_window_app(args):
 
     mouse_handler = MouseHandler()
 
+    # Track whether the window is minimized so rendering can be skipped
+    window_visible = True
+
+    def on_hide():
+        nonlocal window_visible
+        window_visible = False
+
+    def on_show():
+        nonlocal window_visible
+        window_visible = True
+
     # Access the underlying pyglet window and register the handlers
     for w in pyglet.app.windows:
         w.push_handlers(keyboard_handler)
         w.push_handlers(mouse_handler)
+        w.push_handlers(on_hide=on_hide, on_show=on_show)
 
     # Activate window to ensure it gets focus on macOS
     if pyglet_window:
@@ -476,14 +492,18 @@ def run_gl_window_app(args):
 
     # Schedule web server request handling if enabled
     if web_server:
-        import select
+        import selectors
+
+        # Register the listening socket once instead of rebuilding the fd set
+        # on every poll
+        web_selector = selectors.DefaultSelector()
+        web_selector.register(web_server.socket, selectors.EVENT_READ)
 
         def handle_web_requests(dt):
             """Handle web server requests in the main thread"""
             try:
                 # Check if there are pending requests (non-blocking)
-                ready = select.select([web_server.socket], [], [], 0.0)
-                if ready[0]:
+                if web_selector.select(timeout=0):
                     web_server.handle_request()
             except Exception as e:
                 # Silently ignore errors to avoid spamming console
@@ -493,50 +513,78 @@ def run_gl_window_app(args):
         pyglet.clock.schedule_interval(handle_web_requests, 0.05)
         print("[*] Web server integrated into main thread")
 
-    # Track time for delta time calculations
-    last_frame_time = time.perf_counter()
-
     # Track window size for resize detection
     last_window_size = window.size
 
-    while not window.is_closing:
-        current_time = time.perf_counter()
-        dt = current_time - last_frame_time
-        last_frame_time = current_time
+    # Silent frame shown until the first audio frame reaches the VJ director
+    idle_frame = Frame({signal: 0.0 for signal in FrameSignal})
+
+    # Audio capture and analysis run on their own thread so a slow microphone
+    # read never stalls a frame. The render loop takes the latest frame and
+    # steps the director itself, since shifts touch the GL context.
+    audio_lock = threading.Lock()
+    audio_stop = threading.Event()
+    pending_audio_frame = None
+
+    def audio_loop():
+        nonlocal pending_audio_frame
+        while not audio_stop.is_set():
+            frame = audio_analyzer.analyze_audio()
+            if frame:
+                with audio_lock:
+                    pending_audio_frame = frame
+            audio_stop.wait(audio_update_interval)
+
+    audio_thread = threading.Thread(target=audio_loop, daemon=True)
+
+    def render_frame(dt):
+        """Render one frame; scheduled by the pyglet clock"""
+        nonlocal last_window_size, last_display_sizes
+        nonlocal frame_counter, pending_audio_frame
+        nonlocal screenshot_pbo, screenshot_size
+
+        if window.is_closing:
+            pyglet.app.exit()
+            return
 
-        # Update manual dimmer fade (progressive fade when M/K held)
+        # Update manual dimmer fade (progressive fade when M/K held); dt is the
+        # time since the previous frame as measured by the pyglet clock
         keyboard_handler.update_manual_dimmer(dt)
 
-        # Check if we should take screenshot
-        if screenshot_mode and screenshot_time and current_time >= screenshot_time:
-            print("\n📸 Capturing screenshot...")
+        # Save the screenshot read back at the end of the previous frame
+        if screenshot_pbo:
             from PIL import Image
 
-            window_w, window_h = window.size
-            ctx.screen.use()
-            screen_data = ctx.screen.read()
+            window_w, window_h = screenshot_size
+            # Orientation -1 decodes bottom-up, flipping the GL rows in one copy
             screen_img = Image.frombuffer(
-                "RGB", (window_w, window_h), screen_data, "raw", "RGB", 0, 1
+                "RGB", screenshot_size, screenshot_pbo.read(), "raw", "RGB", 0, -1
             )
-            screen_img = screen_img.transpose(Image.FLIP_TOP_BOTTOM)
             screen_img.save("test_output/screenshot.png")
+            screenshot_pbo.release()
             print(f"✅ Saved screenshot: {window_w}x{window_h}")
             print("🛑 Exiting after screenshot")
-            break
+            pyglet.app.exit()
+            return
 
-        # Update audio at intervals
-        if time.perf_counter() - last_audio_update >= audio_update_interval:
-            frame = audio_analyzer.analyze_audio()
-            if frame:
-                state.process_gui_updates()
-                director.step(frame)
-                director.render(dmx)
-            last_audio_update = time.perf_counter()
+        # Step the director with the newest analyzed audio frame, if any
+        with audio_lock:
+            frame, pending_audio_frame = pending_audio_frame, None
+        # Apply mode changes queued by a threaded web server even without audio
+        state.process_gui_updates()
+        if frame:
+            director.step(frame)
+            director.render(dmx)
+
+        # Nobody can see a minimized window; keep driving the lights but skip
+        # the VJ pipeline and overlay
+        if not window_visible:
+            return
 
         # Get VJ frame data
         frame_data, scheme_data = vj_director.get_latest_frame_data()
         if not frame_data:
-            frame_data = Frame({signal: 0.0 for signal in FrameSignal})
+            frame_data = idle_frame
             scheme_data = director.scheme.render()
 
         # Get current window size
@@ -568,38 +616,65 @@ def run_gl_window_app(args):
                 source_texture = rendered_fbo.color_attachments[0]
                 source_width, source_height = source_texture.size
 
-                # Bind texture and set uniforms
-                source_texture.use(0)
-                display_shader["source_texture"] = 0
-                display_shader["source_size"].value = (
-                    float(source_width),
-                    float(source_height),
-                )
-                display_shader["target_size"].value = (
-                    float(window_width),
-                    float(window_height),
-                )
+                if (source_width, source_height) == (window_width, window_height):
+                    # Same size: a vertically flipped blit replaces the
+                    # full-screen shader pass
+                    GL.glBindFramebuffer(GL.GL_READ_FRAMEBUFFER, rendered_fbo.glo)
+                    GL.glBlitFramebuffer(
+                        0,
+                        0,
+                        source_width,
+                        source_height,
+                        0,
+                        window_height,
+                        window_width,
+                        0,
+                        GL.GL_COLOR_BUFFER_BIT,
+                        GL.GL_NEAREST,
+                    )
+                    GL.glBindFramebuffer(GL.GL_READ_FRAMEBUFFER, ctx.screen.glo)
+                else:
+                    # Bind texture and update the cover scale if either size changed
+                    source_texture.use(0)
+                    display_sizes = (
+                        source_width,
+                        source_height,
+                        window_width,
+                        window_height,
+                    )
+                    if display_sizes != last_display_sizes:
+                        last_display_sizes = display_sizes
+                        uv_scale_uniform.value = cover_uv_scale(
+                            source_width, source_height, window_width, window_height
+                        )
 
-                # Render to screen with proper viewport
-                display_quad.render(mgl.TRIANGLE_STRIP)
+                    # Render to screen with proper viewport
+                    display_quad.render(mgl.TRIANGLE_STRIP)
             except Exception as e:
                 print(f"Error displaying to screen: {e}")
 
-        # Restore viewport before rendering overlay (imgui manages its own viewport)
-        ctx.viewport = (0, 0, window_width, window_height)
-
+        # The viewport set above is still current for the overlay (imgui
+        # manages its own viewport)
         # Render overlay UI
         overlay.render()
 
+        # Queue the screenshot readback into a pixel buffer before the swap;
+        # the copy overlaps with the next frame instead of stalling this one
+        if screenshot_due and screenshot_pbo is None:
+            print("\n📸 Capturing screenshot...")
+            screenshot_size = (window_width, window_height)
+            screenshot_pbo = ctx.buffer(reserve=window_width * window_height * 3)
+            ctx.screen.read_into(screenshot_pbo, screenshot_size, components=3)
+
         # Swap buffers and poll events
         window.swap_buffers()
-        window.ctx.finish()  # Wait for rendering to complete
 
         # Debug frame capture mode (after swap so we see what's displayed)
         if debug_frame_mode:
             frame_counter += 1
             if frame_counter == 20:
                 print("\n📸 Capturing frame 20...")
+                ctx.finish()  # Wait for rendering to complete before readback
                 # Save what VJ rendered
                 if rendered_fbo and rendered_fbo.color_attachments:
                     from PIL import Image
@@ -607,8 +682,7 @@ def run_gl_window_app(args):
                     tex = rendered_fbo.color_attachments[0]
                     w, h = tex.size
                     data = tex.read()
-                    img = Image.frombuffer("RGB", (w, h), data, "raw", "RGB", 0, 1)
-                    img = img.transpose(Image.FLIP_TOP_BOTTOM)
+                    img = Image.frombuffer("RGB", (w, h), data, "raw", "RGB", 0, -1)
                     img.save("test_output/debug_vj_render.png")
                     print(f"✅ Saved VJ render: {w}x{h}")
 
@@ -624,9 +698,8 @@ def run_gl_window_app(args):
                     ctx.screen.use()
                     screen_data = ctx.screen.read()
                     screen_img = Image.frombuffer(
-                        "RGB", (window_w, window_h), screen_data, "raw", "RGB", 0, 1
+                        "RGB", (window_w, window_h), screen_data, "raw", "RGB", 0, -1
                     )
-                    screen_img = screen_img.transpose(Image.FLIP_TOP_BOTTOM)
                     screen_img.save("test_output/debug_window_screen.png")
                     print(f"✅ Saved window screen: {window_w}x{window_h}")
 
@@ -642,16 +715,24 @@ def run_gl_window_app(args):
                     print(f"⚠️  Could not capture window screen: {e}")
 
                 print("🛑 Exiting after frame 20 capture")
-                break
+                pyglet.app.exit()
+                return
 
-        # Process window events (keyboard, mouse, etc)
-        for w in pyglet.app.windows:
-            w.dispatch_events()
+    # pyglet drives window events and the scheduled callbacks (including the
+    # web server) and sleeps between frames instead of busy-looping
+    audio_thread.start()
+    pyglet.clock.schedule_interval(render_frame, 1 / TARGET_FPS)
+    pyglet.app.run(None)
 
     # Cleanup
     print("\n[*] Shutting down...")
+    if web_server:
+        web_selector.close()
+    audio_stop.set()
+    audio_thread.join(timeout=1.0)
     state.save_state()
     audio_analyzer.cleanup()
+    director.cleanup()
     vj_director.cleanup()
 
     # Cleanup fixture renderer
@@ -114,6 +114,15 @@ class BaseInterpretationNode(ABC, Generic[C, RI, RR]):
         """
         pass
 
+    def render_target(self) -> BaseInterpretationNode[C, Any, RR]:
+        """
+        Returns the node whose render() does the work when this node is rendered.
+        Nodes that only forward render() to a child selected in generate() return
+        that child's target, so callers can skip the forwarding until the next
+        generate().
+        """
+        return self
+
     def print_self(self) -> str:
         """
         Return a string representation of this node for tree printing.
@@ -275,6 +284,9 @@ class RandomOperation(BaseInterpretationNode[C, RR, RR]):
                 self.current_operation.enter_recursive(self._context)
             self.current_operation.generate_recursive(vibe)
 
+    def render_target(self) -> BaseInterpretationNode[C, Any, RR]:
+        return self.current_operation.render_target()
+
     def render(
         self,
         frame: Frame,
@@ -373,6 +385,12 @@ class RandomChild(BaseInterpretationNode[C, RI, RR]):
             self.generate(vibe)
             # Don't call generate_recursive on all_inputs since generate() already did it
 
+    def render_target(self) -> BaseInterpretationNode[C, Any, RR]:
+        if self._current_child is None:
+            # Keep rendering through this node so it raises
+            return self
+        return self._current_child.render_target()
+
     def render(
         self,
         frame: Frame,
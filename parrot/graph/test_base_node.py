@@ -438,6 +438,14 @@ class TestRandomNode:
             self.mock_vibe, 1.0
         )
 
+    def test_random_node_render_target(self):
+        """Test that Random node resolves to its current operation."""
+        child = ConstantNode(10.0)
+        random_node = RandomOperation(child, [AddNode])
+
+        assert random_node.render_target() is random_node.current_operation
+        assert child.render_target() is child
+
 
 class TestRandomChild:
     """Test cases for the RandomChild node."""
@@ -617,6 +625,23 @@ class TestRandomChild:
         assert child1.entered
         assert not child2.entered
 
+    def test_render_target_follows_selected_child(self, monkeypatch):
+        child1 = ConstantNode(10.0)
+        child2 = ConstantNode(20.0)
+        inner = RandomChild([child2])
+        node = RandomChild([child1, inner])
+        node.enter_recursive(SimpleContext())
+
+        # Nothing selected yet, so rendering must still go through the node
+        assert node.render_target() is node
+
+        monkeypatch.setattr(
+            "parrot.graph.BaseInterpretationNode.random.choice", lambda seq: seq[-1]
+        )
+        node.generate_recursive(self.mock_vibe)
+
+        assert node.render_target() is child2
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
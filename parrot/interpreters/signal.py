@@ -2,7 +2,7 @@ import random
 from typing import Dict, List, Type, TypeVar
 
 from parrot.director.color_scheme import ColorScheme
-from parrot.director.frame import Frame, FrameSignal
+from parrot.director.frame import Frame, FrameSignal, SIGNAL_BITS
 from parrot.fixtures.base import FixtureBase, FixtureWithBulbs
 from parrot.interpreters.base import InterpreterArgs, InterpreterBase
 from parrot.interpreters.bulbs import for_bulbs
@@ -45,6 +45,11 @@ def signal_switch(
                 signal: random.random() < probability
                 for signal, probability in SIGNAL_PROBABILITIES.items()
             }
+            # Same set as responds_to packed into SIGNAL_BITS, kept in sync by set_enabled
+            self.responds_mask = 0
+            for signal, enabled in self.responds_to.items():
+                if enabled:
+                    self.responds_mask |= SIGNAL_BITS[signal]
 
             self.pulse_type = random.choice(
                 [HardSpatialPulse, HardSpatialCenterOutPulse]
@@ -62,6 +67,10 @@ def signal_switch(
         def set_enabled(self, signal: FrameSignal, enabled: bool):
             if signal in self.responds_to:
                 self.responds_to[signal] = enabled
+                if enabled:
+                    self.responds_mask |= SIGNAL_BITS[signal]
+                else:
+                    self.responds_mask &= ~SIGNAL_BITS[signal]
 
         def step(self, frame: Frame, scheme: ColorScheme):
             # Always run standard interpreter first
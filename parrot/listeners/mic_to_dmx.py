@@ -104,6 +104,7 @@ class MicToDmx(object):
                 self.state,
                 director=self.director,
                 port=getattr(self.args, "web_port", 4040),
+                server=getattr(self.args, "web_server", "werkzeug"),
             )
 
         self.frame_count = 0
@@ -119,6 +120,8 @@ class MicToDmx(object):
 
     def run(self):
         self._run_audio_loop()
+        # The loop has stopped stepping, so the step workers can go
+        self.director.cleanup()
 
     def _run_audio_loop(self):
         """Run the main audio processing loop"""
@@ -13,6 +13,12 @@ def parse_arguments():
     parser.add_argument("--plot", action="store_true", help="Enable plotting")
     parser.add_argument("--web-port", type=int, default=4040, help="Web server port")
     parser.add_argument("--no-web", action="store_true", help="Disable web server")
+    parser.add_argument(
+        "--web-server",
+        choices=["werkzeug", "gevent", "bjoern"],
+        default="werkzeug",
+        help="WSGI server for the web interface (gevent/bjoern run in a background thread)",
+    )
     parser.add_argument(
         "--vj-fullscreen", action="store_true", help="Run VJ in fullscreen mode"
     )
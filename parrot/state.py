@@ -1,6 +1,7 @@
 import json
 import os
 import queue
+import threading
 from events import Events
 from beartype import beartype
 from parrot.director.mode import Mode
@@ -9,10 +10,50 @@ from parrot.director.themes import themes, get_theme_by_name
 from parrot.patch_bay import venues
 
 
+class TupleEventSlot:
+    """Event slot that keeps its handlers in a tuple
+
+    Subscribing and unsubscribing build a new tuple, so firing iterates the
+    current one directly instead of copying the handler list on every call.
+    Handlers added while an event fires only see the next one.
+    """
+
+    def __init__(self, name):
+        self.targets = ()
+        self.__name__ = name
+
+    def __repr__(self):
+        return "event '%s'" % self.__name__
+
+    def __call__(self, *a, **kw):
+        for f in self.targets:
+            f(*a, **kw)
+
+    def __iadd__(self, f):
+        self.targets = self.targets + (f,)
+        return self
+
+    def __isub__(self, f):
+        self.targets = tuple(t for t in self.targets if t != f)
+        return self
+
+    def __len__(self):
+        return len(self.targets)
+
+    def __iter__(self):
+        return iter(self.targets)
+
+    def __contains__(self, f):
+        return f in self.targets
+
+    def __getitem__(self, key):
+        return self.targets[key]
+
+
 @beartype
 class State:
     def __init__(self):
-        self.events = Events()
+        self.events = Events(event_slot_cls=TupleEventSlot)
 
         # Default values
         self._mode = Mode.chill  # Default mode
@@ -49,9 +90,15 @@ class State:
         self.save_state()
 
     def set_mode_thread_safe(self, value: Mode):
-        """Set the mode (now safe since web server runs on main thread)."""
-        # Since web server now runs on main thread, just call the regular method
-        self.set_mode(value)
+        """Set the mode from any thread.
+
+        Off the main thread the change is queued for process_gui_updates, so the
+        mode handlers still run on the thread that owns the GL context.
+        """
+        if threading.current_thread() is threading.main_thread():
+            self.set_mode(value)
+        else:
+            self._gui_update_queue.put(("set_mode", value))
         print(f"Mode changed from web interface to: {value.name}")
 
     def set_effect_thread_safe(self, effect: str):
@@ -80,9 +127,11 @@ class State:
         self.save_state()
 
     def set_vj_mode_thread_safe(self, value: VJMode):
-        """Set the VJ mode (now safe since web server runs on main thread)."""
-        # Since web server now runs on main thread, just call the regular method
-        self.set_vj_mode(value)
+        """Set the VJ mode from any thread, queueing it like set_mode_thread_safe."""
+        if threading.current_thread() is threading.main_thread():
+            self.set_vj_mode(value)
+        else:
+            self._gui_update_queue.put(("set_vj_mode", value))
         print(f"VJ mode changed from web interface to: {value.name}")
 
     @property
@@ -274,6 +323,13 @@ class State:
                                     except Exception as e:
                                         print(f"Error in GUI event handler: {e}")
 
+                elif update_type == "set_mode":
+                    # Queued from another thread: apply it like a direct set
+                    self.set_mode(value)
+
+                elif update_type == "set_vj_mode":
+                    self.set_vj_mode(value)
+
                 elif update_type == "vj_mode":
                     # Update the VJ mode on the main thread
                     if self._vj_mode != value:
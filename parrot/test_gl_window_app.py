@@ -0,0 +1,24 @@
+import unittest
+
+from parrot.gl_window_app import cover_uv_scale
+
+
+class TestCoverUVScale(unittest.TestCase):
+    """Test the aspect-fill scale used by the display shader"""
+
+    def test_same_aspect_is_identity(self):
+        self.assertEqual(cover_uv_scale(1920, 1080, 1280, 720), (1.0, 1.0))
+
+    def test_wider_source_crops_horizontally(self):
+        scale_x, scale_y = cover_uv_scale(1920, 1080, 1080, 1080)
+        self.assertAlmostEqual(scale_x, 1080 / 1920)
+        self.assertEqual(scale_y, 1.0)
+
+    def test_taller_source_crops_vertically(self):
+        scale_x, scale_y = cover_uv_scale(1080, 1080, 1920, 1080)
+        self.assertEqual(scale_x, 1.0)
+        self.assertAlmostEqual(scale_y, 1080 / 1920)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,7 @@ import os
 import tempfile
 import shutil
 from unittest.mock import Mock, patch, MagicMock
-from parrot.state import State
+from parrot.state import State, TupleEventSlot
 from parrot.director.mode import Mode
 from parrot.director.themes import themes
 
@@ -81,6 +81,38 @@ class TestState:
 
         assert state.mode == Mode.chill
 
+    def test_thread_safe_setters_queue_changes_from_other_threads(self):
+        """Test web server threads hand mode changes to the main loop."""
+        import threading
+        from parrot.vj.vj_mode import VJMode
+
+        state = State()
+        state.set_mode(Mode.chill)
+        state.set_vj_mode(VJMode.blackout)
+        mode_handler = Mock()
+        vj_mode_handler = Mock()
+        state.events.on_mode_change += mode_handler
+        state.events.on_vj_mode_change += vj_mode_handler
+
+        def set_from_web_thread():
+            state.set_mode_thread_safe(Mode.rave)
+            state.set_vj_mode_thread_safe(VJMode.full_rave)
+
+        thread = threading.Thread(target=set_from_web_thread)
+        thread.start()
+        thread.join()
+
+        # Nothing changes until the main thread drains the queue
+        assert state.mode == Mode.chill
+        mode_handler.assert_not_called()
+
+        state.process_gui_updates()
+
+        assert state.mode == Mode.rave
+        assert state.vj_mode == VJMode.full_rave
+        mode_handler.assert_called_once_with(Mode.rave)
+        vj_mode_handler.assert_called_once_with(VJMode.full_rave)
+
     def test_set_hype(self):
         """Test setting hype value triggers events."""
         state = State()
@@ -262,3 +294,37 @@ class TestState:
 
         assert state.mode == Mode.rave
         mock_gui_handler.assert_called_once_with(Mode.rave)
+
+
+class TestTupleEventSlot:
+    def test_subscribe_fire_unsubscribe(self):
+        """Test handlers are called in order and removed by -="""
+        slot = TupleEventSlot("on_change")
+        calls = []
+        first = lambda value: calls.append(("first", value))
+        second = lambda value: calls.append(("second", value))
+
+        slot += first
+        slot += second
+        slot(1)
+        slot -= first
+        slot(2)
+
+        assert calls == [("first", 1), ("second", 1), ("second", 2)]
+        assert first not in slot
+        assert list(slot) == [second]
+
+    def test_handler_added_while_firing_waits_for_next_event(self):
+        """Test subscribing from a handler doesn't change the running event"""
+        slot = TupleEventSlot("on_change")
+        late = Mock()
+
+        def subscribe_late(value):
+            slot.__iadd__(late)
+
+        slot += subscribe_late
+        slot(1)
+        late.assert_not_called()
+
+        slot(2)
+        late.assert_called_once_with(2)
@@ -1,7 +1,12 @@
 from DMXEnttecPro import Controller
-import math
 import os
 import enum
+import re
+import queue
+import random
+import threading
+import time
+import numpy as np
 import serial.tools.list_ports
 from serial.serialutil import SerialException
 
@@ -10,6 +15,9 @@ from parrot.utils.mock_controller import MockDmxController
 from .math import clamp
 from stupidArtnet import StupidArtnet
 
+# Environment doesn't change while the app runs, so MOCK_DMX is read once
+_MOCK_DMX = os.environ.get("MOCK_DMX", "").lower() in ("1", "true", "yes", "on")
+
 
 class Universe(enum.Enum):
     """DMX Universe enumeration"""
@@ -18,23 +26,50 @@ class Universe(enum.Enum):
     art1 = "art1"  # Maps to Art-Net controller
 
 
-@beartype
 def dmx_clamp(n):
-    if math.isnan(n):
+    # Called for every channel of every fixture each frame, so the NaN check and
+    # clamp are inlined rather than going through math.isnan and clamp()
+    if n != n or n <= 0:
         return 0
-    return int(clamp(n, 0, 255))
+    if n >= 255:
+        return 255
+    return int(n)
+
+
+# Below this many values a plain loop beats NumPy's per-call overhead
+_CLAMP_LIST_NUMPY_MIN = 128
 
 
-@beartype
 def dmx_clamp_list(items):
-    return [int(clamp(item, 0, 255)) for item in items]
+    if len(items) < _CLAMP_LIST_NUMPY_MIN:
+        return [dmx_clamp(item) for item in items]
+    values = np.nan_to_num(np.asarray(items, dtype=np.float64), nan=0.0)
+    return np.clip(values, 0, 255).astype(np.int64).tolist()
 
 
 usb_path = "/dev/cu.usbserial-EN419206"
 
+# Last port find_entec_port() returned; reused while the device node exists
+_last_entec_port = None
+
 
 @beartype
 def find_entec_port():
+    """Find the Entec serial port, skipping the scan if the last one still exists"""
+    global _last_entec_port
+    if _last_entec_port is not None and os.path.exists(_last_entec_port):
+        return _last_entec_port
+    _last_entec_port = _scan_entec_port()
+    return _last_entec_port
+
+
+# Matched case-insensitively against a port's description, hwid,
+# manufacturer and product joined into a single string
+ENTEC_KEYWORDS = re.compile("enttec|entec|dmx|ftdi", re.IGNORECASE)
+
+
+@beartype
+def _scan_entec_port():
     import os
     import glob
     import serial.tools.list_ports
@@ -56,22 +91,21 @@ def find_entec_port():
     print(f"Scanning {len(ports)} serial ports for Entec DMX controller...")
 
     for port in ports:
-        desc = str(port.description).lower()
         hwid = str(port.hwid).lower()
-        manufacturer = str(getattr(port, "manufacturer", "")).lower()
-        product = str(getattr(port, "product", "")).lower()
 
         if "0403" in hwid and "6001" in hwid:
             print(f"[OK] Found FTDI device at {port.device}")
             return port.device
 
-        if any(
-            keyword in desc
-            or keyword in hwid
-            or keyword in manufacturer
-            or keyword in product
-            for keyword in ["enttec", "entec", "dmx", "ftdi"]
-        ):
+        fields = "|".join(
+            (
+                str(port.description),
+                hwid,
+                str(getattr(port, "manufacturer", "")),
+                str(getattr(port, "product", "")),
+            )
+        )
+        if ENTEC_KEYWORDS.search(fields):
             print(f"[?] Found potential Entec device at {port.device}")
             return port.device
 
@@ -93,10 +127,10 @@ def find_entec_port():
 
     print(f"Scanning /dev using patterns: {scan_patterns}")
     for pattern in scan_patterns:
+        # glob only yields paths that exist, so no separate existence check
         for path in glob.glob(pattern):
-            if os.path.exists(path):
-                print(f"[OK] Found device at {path}")
-                return path
+            print(f"[OK] Found device at {path}")
+            return path
 
     print("[!] No Entec DMX controller port found")
     return None
@@ -107,32 +141,113 @@ class ArtNetController:
 
     def __init__(self, artnet_ip="127.0.0.1", artnet_universe=0):
         self.artnet = StupidArtnet(artnet_ip, artnet_universe, 512, 30, True, True)
-        self.dmx_data = [0] * 512
+        # StupidArtnet keeps a reference to the buffer it is given, so channel
+        # writes land directly in the packet payload and submit just sends it
+        self.dmx_data = bytearray(512)
+        self.artnet.set(self.dmx_data)
+        # Zero-copy uint8 view of the same bytes for vectorized edits (fades, dims)
+        self.dmx_array = np.frombuffer(self.dmx_data, dtype=np.uint8)
 
     def set_channel(self, channel, value, universe=None):
         # Channels are 1-indexed for DMX, 0-indexed for Art-Net
         # universe parameter is accepted for compatibility but not used (single universe controller)
         if 1 <= channel <= 512:
-            self.dmx_data[channel - 1] = int(value)
+            self.dmx_data[channel - 1] = min(255, max(0, int(value)))
+
+    def set_channels(self, start, values, universe=None):
+        # Bulk write of consecutive channels; values must already be 0-255 ints
+        set_buffer_channels(self.dmx_data, start, values)
 
     def submit(self):
-        self.artnet.set(self.dmx_data)
         self.artnet.show()
 
+    def submit_frame(self, frame):
+        """Send a snapshot of the channels instead of the live buffer"""
+        artnet = self.artnet
+        artnet.buffer = frame
+        try:
+            artnet.show()
+        finally:
+            artnet.buffer = self.dmx_data
+
+
+# Unchanged universes are still re-sent this often (seconds), so Art-Net nodes
+# that time out on silence keep their last frame
+DMX_KEEPALIVE_INTERVAL = 1.0
+
+# Exponential backoff (seconds) between Entec reconnect attempts while a
+# device keeps failing, so a flaky port isn't reopened every frame
+RECONNECT_BASE_DELAY = 0.5
+RECONNECT_MAX_DELAY = 30.0
+
+
+def set_buffer_channels(buffer, start, values):
+    """Copy consecutive 1-indexed channel values into a DMX byte buffer in one slice"""
+    offset = start - 1
+    if offset < 0:
+        values = values[-offset:]
+        offset = 0
+    count = min(len(values), len(buffer) - offset)
+    if count > 0:
+        buffer[offset : offset + count] = bytes(values[:count])
+
+
+def submit_frame(controller, frame):
+    """Send ``frame``, a snapshot of the controller's channel buffer
+
+    Lets a writer thread send exactly the frame it was handed while the render
+    thread keeps writing the live buffer. Controllers without a buffer
+    (``frame`` is None) just submit.
+    """
+    if frame is None:
+        controller.submit()
+    elif isinstance(controller, ArtNetController):
+        controller.submit_frame(frame)
+    elif is_entec_controller(controller):
+        # Same packet DMXEnttecPro's Controller.submit() builds from .channels
+        size = len(frame) + 1
+        controller._conn.write(
+            controller._signal_start
+            + bytes([6, size & 0xFF, (size >> 8) & 0xFF, 0])
+            + frame
+            + controller._signal_end
+        )
+    else:
+        controller.submit()
+
+
+def channel_buffer(controller):
+    """The controller's DMX byte buffer, or None if it doesn't expose one"""
+    for attr in ("channels", "dmx_data"):
+        buffer = getattr(controller, attr, None)
+        if isinstance(buffer, (bytes, bytearray)):
+            return buffer
+    return None
+
 
 class SwitchController:
     """Routes DMX commands to the appropriate controller based on universe"""
 
-    def __init__(self, controller_map):
+    def __init__(self, controller_map, async_submit=False):
         """
         Initialize with a mapping of Universe -> controller
 
         Args:
             controller_map: Dict mapping Universe enum values to controller instances
+            async_submit: Hand submits to a background writer thread instead of
+                writing to the devices inline
         """
         self.controller_map = controller_map
+        self._submitter = AsyncSubmitter() if async_submit else None
         # Track which universes use Entec controllers for reconnection
         self._entec_universes = set()
+        # Universe -> (channel snapshot, time) of the last frame actually sent
+        self._last_submitted = {}
+        # Universe -> channel snapshot handed to the writer thread, not yet sent
+        self._in_flight = {}
+        # Universe -> failed reconnect count and earliest next attempt time
+        self._reconnect_attempts = {}
+        self._next_reconnect = {}
 
     def _mark_entec_universe(self, universe):
         """Mark a universe as using an Entec controller"""
@@ -144,17 +259,44 @@ class SwitchController:
         if controller:
             controller.set_channel(channel, value)
 
+    def set_channels(self, start, values, universe=Universe.default):
+        """Set consecutive channels starting at ``start``; values must be 0-255 ints"""
+        controller = self.controller_map.get(universe)
+        if not controller:
+            return
+        if hasattr(controller, "set_channels"):
+            controller.set_channels(start, values)
+            return
+        buffer = channel_buffer(controller)
+        if buffer is not None:
+            set_buffer_channels(buffer, start, values)
+            return
+        for i, value in enumerate(values):
+            controller.set_channel(start + i, value)
+
     def _reconnect_entec(self, universe):
         """Attempt to reconnect the Entec controller for a universe"""
         if universe not in self._entec_universes:
             return False
 
+        now = time.monotonic()
+        if now < self._next_reconnect.get(universe, 0.0):
+            return False
+        attempts = self._reconnect_attempts.get(universe, 0)
+        delay = min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2 ** min(attempts, 10))
+        self._next_reconnect[universe] = now + delay + random.uniform(0, delay / 4)
+        self._reconnect_attempts[universe] = attempts + 1
+
+        # Whatever controller ends up here has not been sent anything yet
+        self._last_submitted.pop(universe, None)
+        self._in_flight.pop(universe, None)
+
         print(
             f"[*] Attempting to reconnect Entec DMX controller for universe {universe.value}..."
         )
         try:
             new_controller = get_entec_controller()
-            if isinstance(new_controller, Controller):
+            if is_entec_controller(new_controller):
                 self.controller_map[universe] = new_controller
                 print(
                     f"[OK] Successfully reconnected Entec DMX controller for universe {universe.value}"
@@ -177,19 +319,129 @@ class SwitchController:
             return False
 
     def submit(self):
-        """Submit all controllers"""
+        """Submit all controllers whose channels changed since their last frame"""
+        if self._submitter is not None:
+            self._drain_submit_results()
+
+        now = time.monotonic()
+        due = []
         for universe, controller in self.controller_map.items():
+            buffer = channel_buffer(controller)
+            frame = None
+            if buffer is not None:
+                last = self._last_submitted.get(universe)
+                if (
+                    last is not None
+                    and last[0] == buffer
+                    and now - last[1] < DMX_KEEPALIVE_INTERVAL
+                ):
+                    continue
+                if self._in_flight.get(universe) == buffer:
+                    # Already on its way to the device
+                    continue
+                frame = bytes(buffer)
+            due.append((universe, controller, frame))
+
+        if self._submitter is not None:
+            for universe, _, frame in due:
+                if frame is not None:
+                    self._in_flight[universe] = frame
+            self._submitter.post(due, now)
+            return
+
+        for universe, controller, frame in due:
             try:
                 controller.submit()
             except (SerialException, OSError) as e:
-                # Device may have disconnected - print error and attempt reconnect
-                print(f"[!] DMX controller crash for universe {universe.value}: {e}")
-                # Only attempt reconnection for Entec controllers
-                if universe in self._entec_universes:
-                    print(f"   Attempting to reconnect...")
-                    self._reconnect_entec(universe)
+                self._submit_failed(universe, e)
+            else:
+                if frame is not None:
+                    self._last_submitted[universe] = (frame, now)
+                self._submit_succeeded(universe)
+
+    def _drain_submit_results(self):
+        """Handle outcomes reported by the background submitter"""
+        while True:
+            try:
+                universe, controller, frame, posted_at, error = (
+                    self._submitter.results.get_nowait()
+                )
+            except queue.Empty:
+                return
+            if self._in_flight.get(universe) is frame:
+                del self._in_flight[universe]
+            if self.controller_map.get(universe) is not controller:
+                # Sent to a controller that has since been replaced
+                continue
+            if error is None:
+                if frame is not None:
+                    self._last_submitted[universe] = (frame, posted_at)
+                self._submit_succeeded(universe)
+            else:
+                self._submit_failed(universe, error)
+
+    def _submit_succeeded(self, universe):
+        if universe in self._reconnect_attempts:
+            del self._reconnect_attempts[universe]
+            del self._next_reconnect[universe]
+
+    def _submit_failed(self, universe, e):
+        # Device may have disconnected - print error and attempt reconnect
+        print(f"[!] DMX controller crash for universe {universe.value}: {e}")
+        # Only attempt reconnection for Entec controllers
+        if universe in self._entec_universes:
+            print(f"   Attempting to reconnect...")
+            self._reconnect_entec(universe)
+        else:
+            print(f"   Skipping reconnection (not an Entec controller)")
+
+
+class AsyncSubmitter:
+    """Runs controller submits on a daemon thread so serial writes never block the caller.
+
+    Only the newest frame per universe is kept: if the writer falls behind, older
+    frames of a universe are dropped, but every universe posted is eventually
+    sent. Each submit outcome is reported on ``results`` as
+    ``(universe, controller, frame, posted_at, error_or_None)`` for the owning
+    thread to act on.
+    """
+
+    def __init__(self):
+        self.results = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        # Universe -> (controller, frame, posted_at) waiting to be sent
+        self._pending = {}
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def post(self, requests, posted_at):
+        """Queue ``[(universe, controller, frame), ...]`` to submit
+
+        ``frame`` is a bytes snapshot of the channels to send, or None for
+        controllers without a channel buffer. Replaces only the unsent frames
+        of the same universes.
+        """
+        if not requests:
+            return
+        with self._lock:
+            for universe, controller, frame in requests:
+                self._pending[universe] = (controller, frame, posted_at)
+        self._wake.set()
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._wake.clear()
+            for universe, (controller, frame, posted_at) in pending.items():
+                try:
+                    submit_frame(controller, frame)
+                except (SerialException, OSError) as e:
+                    self.results.put((universe, controller, frame, posted_at, e))
                 else:
-                    print(f"   Skipping reconnection (not an Entec controller)")
+                    self.results.put((universe, controller, frame, posted_at, None))
 
 
 # Per-venue Art-Net configuration
@@ -199,10 +451,21 @@ artnet_config = {
 }
 
 
-@beartype
+def open_entec_controller(port_path):
+    """Open a real Entec controller, tagged so callers can tell it from the mock"""
+    controller = Controller(port_path)
+    controller.is_entec = True
+    return controller
+
+
+def is_entec_controller(controller):
+    """Whether this is a real Entec controller opened by open_entec_controller"""
+    return getattr(controller, "is_entec", False) is True
+
+
 def get_entec_controller():
     """Get Entec controller or mock if not available"""
-    if os.environ.get("MOCK_DMX", False) != False:
+    if _MOCK_DMX:
         return MockDmxController()
 
     # Try to find the Entec port
@@ -222,14 +485,14 @@ def get_entec_controller():
 
     # Try to connect with the found port
     try:
-        return Controller(port_path)
+        return open_entec_controller(port_path)
     except Exception as e:
         # If cu.* fails, try tty.* variant (macOS specific)
         if port_path.startswith("/dev/cu."):
             tty_path = port_path.replace("/dev/cu.", "/dev/tty.")
             if os.path.exists(tty_path):
                 try:
-                    return Controller(tty_path)
+                    return open_entec_controller(tty_path)
                 except Exception as e2:
                     print(
                         f"Could not connect to Entec DMX controller at {port_path}: {e}"
@@ -247,14 +510,15 @@ def get_entec_controller():
 def get_controller(venue=None):
     """Get DMX controller with universe routing based on venue"""
     controller_map = {}
-    switch_controller = SwitchController(controller_map)
+    # Serial writes can take milliseconds; keep them off the render loop
+    switch_controller = SwitchController(controller_map, async_submit=True)
 
     # Always add primary DMX controller (Entec or mock) as default universe
     entec = get_entec_controller()
     controller_map[Universe.default] = entec
 
     # Mark as Entec universe if it's a real Controller (not MockDmxController)
-    if isinstance(entec, Controller):
+    if is_entec_controller(entec):
         switch_controller._mark_entec_universe(Universe.default)
 
     # Add Art-Net if configured for this venue
@@ -27,13 +27,13 @@ class LerpAnimator(Generic[T]):
 
     def push(self, target: T):
         self.target = target
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
 
     def render(self) -> T:
         if self.target is None:
             return self.subject
 
-        t = (time.time() - self.start_time) / self.duration
+        t = (time.monotonic() - self.start_time) / self.duration
         if t > 1:
             self.subject = self.target
             self.target = None
@@ -1,9 +1,14 @@
 class MockDmxController:
+    is_entec = False
+
     def __init__(self):
         pass
 
     def set_channel(self, channel, value, universe=None):
         pass
 
+    def set_channels(self, start, values, universe=None):
+        pass
+
     def submit(self):
         pass
@@ -23,6 +23,12 @@ class OverlayUI:
         # Initialize ImGui context
         imgui.create_context()
 
+        # IO state lives as long as the context; keep a handle to it
+        self.io = imgui.get_io()
+
+        # Double the font scale for better readability
+        self.io.font_global_scale = 2.0
+
         # Create renderer using official pyglet integration
         # This auto-detects the appropriate renderer and handles all input callbacks
         self.renderer = create_renderer(pyglet_window, attach_callbacks=True)
@@ -33,6 +39,25 @@ class OverlayUI:
         self.button_width = 440
         self.button_height = 60
 
+        # Mode buttons and the highlight colors for the selected one
+        self.modes = [(mode, mode.name.upper()) for mode in Mode]
+        self.selected_button_colors = (
+            (imgui.COLOR_BUTTON, 0.2, 0.6, 0.2, 1.0),
+            (imgui.COLOR_BUTTON_HOVERED, 0.2, 0.7, 0.2, 1.0),
+            (imgui.COLOR_BUTTON_ACTIVE, 0.2, 0.8, 0.2, 1.0),
+        )
+
+        # Combo contents and their index lookups never change, so build them once
+        self.vj_modes = list(VJMode)
+        self.vj_mode_names = [m.name.replace("_", " ").title() for m in self.vj_modes]
+        self.vj_mode_index = {m: i for i, m in enumerate(self.vj_modes)}
+        self.venues = list(venues)
+        self.venue_names = [v.name for v in self.venues]
+        self.venue_index = {v: i for i, v in enumerate(self.venues)}
+        self.theme_names = [t.name for t in themes]
+        # Themes hold color scheme lists and aren't hashable; index by name
+        self.theme_index = {t.name: i for i, t in enumerate(themes)}
+
     def toggle(self):
         """Toggle overlay visibility"""
         self.visible = not self.visible
@@ -61,15 +86,15 @@ class OverlayUI:
         # Event callbacks only fire when events happen. If the mouse hasn't moved
         # since the overlay became visible, ImGui doesn't know where it is and
         # won't respond to clicks. Manually sync mouse position from window state.
-        if self._first_render:
-            io = imgui.get_io()
+        first_render = self._first_render
+        if first_render:
             try:
                 x, y = self.pyglet_window._mouse_x, self.pyglet_window._mouse_y
                 # Convert from pyglet (bottom-left) to ImGui (top-left) coordinates
-                io.mouse_pos = (x, self.pyglet_window.height - y)
+                self.io.mouse_pos = (x, self.pyglet_window.height - y)
             except (AttributeError, TypeError):
                 # Fallback if mouse position unavailable
-                io.mouse_pos = (
+                self.io.mouse_pos = (
                     self.pyglet_window.width / 2,
                     self.pyglet_window.height / 2,
                 )
@@ -77,14 +102,13 @@ class OverlayUI:
 
         imgui.new_frame()
 
-        # Double the font scale for better readability
-        imgui.get_io().font_global_scale = 2.0
-
-        # Create the overlay window
-        imgui.set_next_window_position(20, 20, imgui.FIRST_USE_EVER)
-        imgui.set_next_window_size(
-            self.window_width, self.window_height, imgui.FIRST_USE_EVER
-        )
+        # Create the overlay window. FIRST_USE_EVER makes ImGui ignore these after
+        # the first use anyway, so only pay for the calls when the overlay opens
+        if first_render:
+            imgui.set_next_window_position(20, 20, imgui.FIRST_USE_EVER)
+            imgui.set_next_window_size(
+                self.window_width, self.window_height, imgui.FIRST_USE_EVER
+            )
 
         # Begin window with close button - capture if window should remain open
         expanded, opened = imgui.begin("Party Parrot Control", True)
@@ -101,20 +125,13 @@ class OverlayUI:
             # Mode toggle buttons
             current_mode = self.state.mode
 
-            for mode in Mode:
+            for mode, label in self.modes:
                 is_selected = current_mode == mode
                 if is_selected:
-                    imgui.push_style_color(imgui.COLOR_BUTTON, 0.2, 0.6, 0.2, 1.0)
-                    imgui.push_style_color(
-                        imgui.COLOR_BUTTON_HOVERED, 0.2, 0.7, 0.2, 1.0
-                    )
-                    imgui.push_style_color(
-                        imgui.COLOR_BUTTON_ACTIVE, 0.2, 0.8, 0.2, 1.0
-                    )
-
-                if imgui.button(
-                    mode.name.upper(), self.button_width, self.button_height
-                ):
+                    for color in self.selected_button_colors:
+                        imgui.push_style_color(*color)
+
+                if imgui.button(label, self.button_width, self.button_height):
                     self.state.set_mode(mode)
                     print(f"[*] Mode changed to: {mode.name}")
 
@@ -127,15 +144,13 @@ class OverlayUI:
 
             # VJ Mode selection
             imgui.text("VJ Mode (Visuals)")
-            vj_modes = list(VJMode)
-            vj_mode_names = [m.name.replace("_", " ").title() for m in vj_modes]
-            current_vj_mode_idx = vj_modes.index(self.state.vj_mode)
+            current_vj_mode_idx = self.vj_mode_index[self.state.vj_mode]
             clicked, new_vj_mode_idx = imgui.combo(
-                "##vj_mode", current_vj_mode_idx, vj_mode_names
+                "##vj_mode", current_vj_mode_idx, self.vj_mode_names
             )
             if clicked and new_vj_mode_idx != current_vj_mode_idx:
-                self.state.set_vj_mode(vj_modes[new_vj_mode_idx])
-                print(f"[*] VJ Mode changed to: {vj_mode_names[new_vj_mode_idx]}")
+                self.state.set_vj_mode(self.vj_modes[new_vj_mode_idx])
+                print(f"[*] VJ Mode changed to: {self.vj_mode_names[new_vj_mode_idx]}")
 
             imgui.spacing()
             imgui.separator()
@@ -143,27 +158,25 @@ class OverlayUI:
 
             # Venue selection
             imgui.text("Venue")
-            venue_names = [v.name for v in venues]
-            current_venue_idx = list(venues).index(self.state.venue)
+            current_venue_idx = self.venue_index[self.state.venue]
             clicked, new_venue_idx = imgui.combo(
-                "##venue", current_venue_idx, venue_names
+                "##venue", current_venue_idx, self.venue_names
             )
             if clicked and new_venue_idx != current_venue_idx:
-                self.state.set_venue(list(venues)[new_venue_idx])
-                print(f"[*] Venue changed to: {venue_names[new_venue_idx]}")
+                self.state.set_venue(self.venues[new_venue_idx])
+                print(f"[*] Venue changed to: {self.venue_names[new_venue_idx]}")
 
             imgui.spacing()
 
             # Theme/Color Scheme selection
             imgui.text("Color Scheme")
-            theme_names = [t.name for t in themes]
-            current_theme_idx = themes.index(self.state.theme)
+            current_theme_idx = self.theme_index[self.state.theme.name]
             clicked, new_theme_idx = imgui.combo(
-                "##theme", current_theme_idx, theme_names
+                "##theme", current_theme_idx, self.theme_names
             )
             if clicked and new_theme_idx != current_theme_idx:
                 self.state.set_theme(themes[new_theme_idx])
-                print(f"[*] Color scheme changed to: {theme_names[new_theme_idx]}")
+                print(f"[*] Color scheme changed to: {self.theme_names[new_theme_idx]}")
 
         imgui.end()
 
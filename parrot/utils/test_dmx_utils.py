@@ -1,5 +1,4 @@
 import pytest
-import os
 import math
 from unittest.mock import Mock, patch, MagicMock
 from parrot.utils.dmx_utils import (
@@ -8,7 +7,10 @@ from parrot.utils.dmx_utils import (
     get_controller,
     get_entec_controller,
     ArtNetController,
+    DMX_KEEPALIVE_INTERVAL,
+    RECONNECT_MAX_DELAY,
     SwitchController,
+    submit_frame,
     Universe,
 )
 from parrot.utils.mock_controller import MockDmxController
@@ -72,17 +74,33 @@ class TestDmxUtils:
         expected = [127, 255]
         assert dmx_clamp_list(input_list) == expected
 
+    def test_dmx_clamp_list_maps_nan_to_zero(self):
+        """Test dmx_clamp_list treats NaN like dmx_clamp does."""
+        assert dmx_clamp_list([float("nan"), float("inf"), 12.7]) == [0, 255, 12]
+
+    def test_dmx_clamp_list_returns_list_for_bytes(self):
+        """Test dmx_clamp_list turns byte buffers into a list of ints."""
+        assert dmx_clamp_list(bytearray([0, 128, 255])) == [0, 128, 255]
+
+    def test_dmx_clamp_list_long_lists_match_short_path(self):
+        """Test the NumPy path for long lists clamps like the per-item path."""
+        values = [float("nan"), float("inf"), float("-inf"), -3.0, 12.7, 300.0]
+        long_values = values * 50
+
+        assert dmx_clamp_list(long_values) == dmx_clamp_list(values) * 50
+        assert dmx_clamp_list(values) == [0, 255, 0, 0, 12, 255]
+
     def test_dmx_clamp_list_empty_list(self):
         """Test dmx_clamp_list with empty list."""
         assert dmx_clamp_list([]) == []
 
-    @patch.dict(os.environ, {"MOCK_DMX": "true"})
+    @patch("parrot.utils.dmx_utils._MOCK_DMX", True)
     def test_get_entec_controller_mock_environment(self):
         """Test get_entec_controller returns mock when MOCK_DMX is set."""
         controller = get_entec_controller()
         assert isinstance(controller, MockDmxController)
 
-    @patch.dict(os.environ, {}, clear=True)
+    @patch("parrot.utils.dmx_utils._MOCK_DMX", False)
     @patch("parrot.utils.dmx_utils.Controller")
     def test_get_entec_controller_success(self, mock_controller_class):
         """Test get_entec_controller returns real controller when available."""
@@ -94,7 +112,7 @@ class TestDmxUtils:
         assert controller == mock_controller_instance
         mock_controller_class.assert_called_once_with("/dev/cu.usbserial-EN419206")
 
-    @patch.dict(os.environ, {}, clear=True)
+    @patch("parrot.utils.dmx_utils._MOCK_DMX", False)
     @patch("parrot.utils.dmx_utils.Controller")
     def test_get_entec_controller_exception(self, mock_controller_class):
         """Test get_entec_controller falls back to mock when real controller fails."""
@@ -105,12 +123,14 @@ class TestDmxUtils:
         assert isinstance(controller, MockDmxController)
         mock_controller_class.assert_called_once_with("/dev/cu.usbserial-EN419206")
 
-    @patch.dict(os.environ, {"MOCK_DMX": ""})
-    def test_get_entec_controller_empty_mock_env(self):
-        """Test get_entec_controller with empty MOCK_DMX environment variable."""
-        # Empty string is truthy in Python, so it will use mock controller
+    @patch("parrot.utils.dmx_utils._MOCK_DMX", False)
+    @patch("parrot.utils.dmx_utils.find_entec_port", return_value=None)
+    def test_get_entec_controller_mock_disabled(self, mock_find_port):
+        """Test get_entec_controller looks for a real port when MOCK_DMX is off."""
+        # Falls back to the mock only because no port was found
         controller = get_entec_controller()
 
+        mock_find_port.assert_called_once()
         assert isinstance(controller, MockDmxController)
 
     def test_dmx_clamp_type_consistency(self):
@@ -141,7 +161,7 @@ class TestDmxUtils:
         assert result == [255, 0, 127, 64, 192]
 
     @patch("builtins.print")
-    @patch.dict(os.environ, {}, clear=True)
+    @patch("parrot.utils.dmx_utils._MOCK_DMX", False)
     @patch("parrot.utils.dmx_utils.Controller")
     def test_get_entec_controller_exception_prints_message(
         self, mock_controller_class, mock_print
@@ -195,6 +215,34 @@ class TestDmxUtils:
         assert sent_data[9] == 128  # Channel 10
         assert sent_data[511] == 64  # Channel 512
 
+    @patch("parrot.utils.dmx_utils.StupidArtnet")
+    def test_artnet_controller_writes_into_packet_buffer(self, mock_artnet_class):
+        """Test ArtNetController hands Art-Net one buffer and clamps writes into it."""
+        mock_artnet = Mock()
+        mock_artnet_class.return_value = mock_artnet
+
+        controller = ArtNetController("192.168.1.100", 0)
+        controller.set_channel(1, 300)
+        controller.set_channel(2, -5)
+        controller.submit()
+        controller.submit()
+
+        # The buffer is registered once and shared, not re-sent per frame
+        mock_artnet.set.assert_called_once_with(controller.dmx_data)
+        assert mock_artnet.show.call_count == 2
+        assert controller.dmx_data[0] == 255
+        assert controller.dmx_data[1] == 0
+
+    @patch("parrot.utils.dmx_utils.StupidArtnet")
+    def test_artnet_controller_array_view_shares_buffer(self, mock_artnet_class):
+        """Test the NumPy view edits the same bytes Art-Net sends."""
+        controller = ArtNetController("192.168.1.100", 0)
+        controller.set_channel(3, 200)
+
+        controller.dmx_array[:] //= 2
+
+        assert controller.dmx_data[2] == 100
+
     @patch("parrot.utils.dmx_utils.StupidArtnet")
     def test_artnet_controller_initialization(self, mock_artnet_class):
         """Test ArtNetController initialization."""
@@ -236,6 +284,25 @@ class TestDmxUtils:
         mock_art1.set_channel.assert_called_once_with(15, 150)
         mock_default.set_channel.assert_not_called()
 
+    @patch("parrot.utils.dmx_utils.StupidArtnet")
+    def test_switch_controller_set_channels_bulk(self, mock_artnet_class):
+        """Test bulk channel writes land in each controller's DMX buffer."""
+
+        class EntecLike:
+            def __init__(self):
+                self.channels = bytearray(512)
+
+        entec = EntecLike()
+        artnet = ArtNetController("192.168.1.100", 0)
+        switch = SwitchController({Universe.default: entec, Universe.art1: artnet})
+
+        switch.set_channels(10, [1, 2, 3])
+        switch.set_channels(511, [7, 8, 9], universe=Universe.art1)
+
+        assert entec.channels[9:12] == bytes([1, 2, 3])
+        # Writes past channel 512 are dropped
+        assert artnet.dmx_data[510:] == bytes([7, 8])
+
     def test_switch_controller_submit_all(self):
         """Test SwitchController submits all controllers."""
         mock_controller1 = Mock()
@@ -254,7 +321,141 @@ class TestDmxUtils:
         mock_controller1.submit.assert_called_once()
         mock_controller2.submit.assert_called_once()
 
-    @patch.dict(os.environ, {"MOCK_DMX": "true"})
+    @patch("parrot.utils.dmx_utils.time.monotonic")
+    @patch("parrot.utils.dmx_utils.StupidArtnet")
+    def test_switch_controller_skips_unchanged_frames(
+        self, mock_artnet_class, mock_monotonic
+    ):
+        """Test SwitchController only re-sends unchanged universes as a keepalive."""
+        mock_artnet = Mock()
+        mock_artnet_class.return_value = mock_artnet
+        mock_monotonic.return_value = 100.0
+
+        switch = SwitchController({Universe.art1: ArtNetController("10.0.0.1", 0)})
+
+        switch.set_channel(1, 200, universe=Universe.art1)
+        switch.submit()
+        switch.submit()
+        assert mock_artnet.show.call_count == 1
+
+        # A changed channel is sent right away
+        switch.set_channel(1, 100, universe=Universe.art1)
+        switch.submit()
+        assert mock_artnet.show.call_count == 2
+
+        # An unchanged universe is still refreshed after the keepalive interval
+        mock_monotonic.return_value = 100.0 + DMX_KEEPALIVE_INTERVAL
+        switch.submit()
+        assert mock_artnet.show.call_count == 3
+
+    @patch("parrot.utils.dmx_utils.time.monotonic")
+    @patch("parrot.utils.dmx_utils.get_entec_controller")
+    def test_switch_controller_backs_off_entec_reconnects(
+        self, mock_get_entec, mock_monotonic
+    ):
+        """Test a repeatedly failing Entec port is not reopened every frame."""
+        from serial.serialutil import SerialException
+
+        class FailingController:
+            is_entec = True
+
+            def submit(self):
+                raise SerialException("device disconnected")
+
+        mock_get_entec.side_effect = FailingController
+        mock_monotonic.return_value = 10.0
+
+        switch = SwitchController({Universe.default: FailingController()})
+        switch._mark_entec_universe(Universe.default)
+
+        switch.submit()
+        switch.submit()
+        assert mock_get_entec.call_count == 1
+
+        # The next attempt waits for the backoff delay
+        mock_monotonic.return_value = 10.0 + RECONNECT_MAX_DELAY * 2
+        switch.submit()
+        assert mock_get_entec.call_count == 2
+
+    def test_switch_controller_async_submit_runs_on_writer_thread(self):
+        """Test async SwitchController submits off the calling thread."""
+        import threading
+
+        submitted = threading.Event()
+        submit_threads = []
+        mock_controller = Mock()
+        mock_controller.submit.side_effect = lambda: (
+            submit_threads.append(threading.current_thread()),
+            submitted.set(),
+        )
+
+        switch = SwitchController(
+            {Universe.default: mock_controller}, async_submit=True
+        )
+        switch.submit()
+
+        assert submitted.wait(timeout=2.0)
+        assert submit_threads[0] is not threading.current_thread()
+
+    @patch("parrot.utils.dmx_utils.StupidArtnet")
+    def test_switch_controller_async_submit_keeps_changes_while_busy(
+        self, mock_artnet_class
+    ):
+        """Test frames posted while the writer is busy are sent, as snapshots."""
+        import threading
+
+        slow_started = threading.Event()
+        release_slow = threading.Event()
+        fast_sent = threading.Event()
+        sent = {"slow": [], "fast": []}
+
+        def make_artnet(name):
+            artnet = Mock()
+
+            def show():
+                sent[name].append(bytes(artnet.buffer[:1]))
+                if name == "slow":
+                    slow_started.set()
+                    release_slow.wait(timeout=2.0)
+                elif sent[name][-1] == bytes([2]):
+                    fast_sent.set()
+
+            artnet.show.side_effect = show
+            return artnet
+
+        mock_artnet_class.side_effect = [make_artnet("slow"), make_artnet("fast")]
+        switch = SwitchController(
+            {
+                Universe.default: ArtNetController("10.0.0.1", 0),
+                Universe.art1: ArtNetController("10.0.0.2", 0),
+            },
+            async_submit=True,
+        )
+
+        switch.set_channel(1, 1, universe=Universe.default)
+        switch.set_channel(1, 1, universe=Universe.art1)
+        switch.submit()
+        assert slow_started.wait(timeout=2.0)
+
+        # The writer is stuck on the slow universe; change the fast one, then
+        # post a frame with nothing new, which must not drop that change
+        switch.set_channel(1, 9, universe=Universe.default)
+        switch.set_channel(1, 2, universe=Universe.art1)
+        switch.submit()
+        assert Universe.default not in switch._last_submitted
+        switch.set_channel(1, 1, universe=Universe.default)
+        switch.submit()
+
+        release_slow.set()
+        assert fast_sent.wait(timeout=2.0)
+        # The slow universe sent the frame it was handed, not later writes
+        assert sent["slow"][0] == bytes([1])
+        assert sent["fast"] == [bytes([1]), bytes([2])]
+
+        switch.submit()
+        assert switch._last_submitted[Universe.art1][0][:1] == bytes([2])
+
+    @patch("parrot.utils.dmx_utils._MOCK_DMX", True)
     def test_get_controller_no_venue(self):
         """Test get_controller without venue returns SwitchController with default universe only."""
         controller = get_controller()
@@ -262,7 +463,7 @@ class TestDmxUtils:
         assert Universe.default in controller.controller_map
         assert Universe.art1 not in controller.controller_map
 
-    @patch.dict(os.environ, {"MOCK_DMX": "true"})
+    @patch("parrot.utils.dmx_utils._MOCK_DMX", True)
     @patch("parrot.utils.dmx_utils.StupidArtnet")
     def test_get_controller_with_configured_venue(self, mock_artnet_class):
         """Test get_controller with configured venue returns SwitchController with both universes."""
@@ -285,7 +486,7 @@ class TestDmxUtils:
             "192.168.100.113", 0, 512, 30, True, True
         )
 
-    @patch.dict(os.environ, {"MOCK_DMX": "true"})
+    @patch("parrot.utils.dmx_utils._MOCK_DMX", True)
     def test_get_controller_with_unconfigured_venue(self):
         """Test get_controller with unconfigured venue returns SwitchController with default universe only."""
         mock_venue = Mock()
@@ -135,9 +135,7 @@ class ColorStrobe(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
     def _update_strobe_colors(self, scheme: ColorScheme):
         """Update the strobe color palette from the color scheme"""
         # Extract RGB values from color scheme (already in 0-1 range)
-        fg_rgb = scheme.fg.rgb
-        bg_rgb = scheme.bg.rgb
-        bg_contrast_rgb = scheme.bg_contrast.rgb
+        fg_rgb, bg_rgb, bg_contrast_rgb = scheme.rgb
 
         # Create a palette of colors for strobing
         self.strobe_colors = [
@@ -190,7 +188,7 @@ class ColorStrobe(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
         # Primary signal: Subtle color presence
         elif primary_signal_value > 0.3:
             # Use a subtle version of the foreground color
-            color = scheme.fg.rgb
+            color = scheme.rgb[0]
             opacity = primary_signal_value * 0.3  # Keep it subtle
 
         # Store current color for consistency
@@ -532,6 +532,11 @@ class ConcertStage(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
             camera_up=self.camera_up,
         )
 
+    def generate_recursive(self, vibe: Vibe, threshold: float = 1.0):
+        """Generate the stage, then resolve the layers' forwarding nodes"""
+        super().generate_recursive(vibe, threshold)
+        self.mode_switch.compile_render_plan()
+
     def render(
         self, frame: Frame, scheme: ColorScheme, context: mgl.Context
     ) -> Optional[mgl.Framebuffer]:
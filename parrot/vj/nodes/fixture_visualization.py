@@ -14,7 +14,7 @@ from parrot.vj.renderers.factory import create_renderer
 from parrot.vj.renderers.base import (
     FixtureRenderer,
     quaternion_from_axis_angle,
-    quaternion_rotate_vector,
+    quaternion_rotate_vectors_batch,
 )
 from parrot.vj.renderers.room_3d import Room3DRenderer
 from parrot.vj.renderers.motionstrip import MotionstripRenderer
@@ -29,6 +29,23 @@ import numpy as np
 import math
 
 
+def average_texture_color(texture: mgl.Texture) -> np.ndarray:
+    """Average RGB color of a texture in 0-1 range
+
+    Lets the GPU reduce the texture through its mipmap chain and reads back only
+    the 1x1 top level instead of copying the whole image to the CPU.
+    """
+    top_level = max(texture.width, texture.height).bit_length() - 1
+    # build_mipmaps switches the texture to mipmapped filtering; keep the
+    # owner's filter so sampling it elsewhere is unchanged
+    texture_filter = texture.filter
+    texture.build_mipmaps()
+    texture.filter = texture_filter
+    raw_data = texture.read(level=top_level)
+    pixel = np.frombuffer(raw_data, dtype=np.uint8)[:3]
+    return pixel / 255.0
+
+
 @beartype
 class FixtureVisualization(GenerativeEffectBase):
     """
@@ -63,15 +80,28 @@ class FixtureVisualization(GenerativeEffectBase):
         self.vj_director = vj_director
         self.canvas_width = canvas_width
         self.canvas_height = canvas_height
+        self._canvas_size = (float(canvas_width), float(canvas_height))
 
         # Subscribe to venue changes to reload fixtures
         self.state.events.on_venue_change += self._on_venue_change
 
         # Load fixtures and create renderers for each
+        self._fixtures: list = []
         self.renderers: list[FixtureRenderer] = []
         self.room_renderer: Optional[Room3DRenderer] = None
         self.depth_texture: Optional[mgl.Texture] = None
 
+        # Fixture lights from the last frame and the fixture state they came from
+        self._lights_cache: Optional[list] = None
+        self._lights_signature: Optional[list] = None
+        # Renderers split by how the passes treat them, for the renderers list
+        # they were built from
+        self._lasers: list[FixtureRenderer] = []
+        self._non_lasers: list[FixtureRenderer] = []
+        self._motionstrip_flags: list[bool] = []
+        self._bounding_radii = np.zeros(0, dtype=np.float32)
+        self._partitioned_for: Optional[list[FixtureRenderer]] = None
+
         # Bloom effect parameters
         self.bloom_alpha = (
             4.0  # Bloom contribution (increased for visibility, emissive removed)
@@ -87,11 +117,21 @@ class FixtureVisualization(GenerativeEffectBase):
         self.bloom_texture: Optional[mgl.Texture] = None
         self.bloom_temp_framebuffer: Optional[mgl.Framebuffer] = None
         self.bloom_temp_texture: Optional[mgl.Texture] = None
+        # Whichever ping-pong texture holds the finished bloom
+        self.bloom_output_texture: Optional[mgl.Texture] = None
+        self.black_texture: Optional[mgl.Texture] = None
 
         # Shader programs for post-processing
         self.kawase_shader: Optional[mgl.Program] = None
         self.composite_shader: Optional[mgl.Program] = None
-
+        # Uniforms written every frame, resolved once when the shaders are built
+        self._u_kawase_offset: Optional[mgl.Uniform] = None
+        self._u_bloom_alpha: Optional[mgl.Uniform] = None
+        # Fullscreen quad vertices shared by every fullscreen pass
+        self._quad_vbo: Optional[mgl.Buffer] = None
+
+        # Flattened fixture list per venue
+        self._fixtures_cache: dict = {}
         self._load_fixtures()
 
     def _setup_gl_resources(
@@ -113,24 +153,33 @@ class FixtureVisualization(GenerativeEffectBase):
                 color_attachments=[self.texture], depth_attachment=self.depth_texture
             )
 
-            # Emissive framebuffer (shares depth buffer for proper occlusion)
-            self.emissive_texture = context.texture((width, height), 3)
+            # Emissive and bloom targets are half resolution: the glow is blurred
+            # anyway, and every blur pass then touches a quarter of the pixels.
+            # Linear filtering upscales the bloom in the composite. The emissive
+            # pass runs without depth testing, so it needs no depth buffer.
+            # Half floats keep additive emissive light above 1.0 through the
+            # blur instead of clipping it and rounding dim glow away at 8 bits
+            bloom_size = (max(1, width // 2), max(1, height // 2))
+            self.emissive_texture = context.texture(bloom_size, 3, dtype="f2")
             self.emissive_framebuffer = context.framebuffer(
-                color_attachments=[self.emissive_texture],
-                depth_attachment=self.depth_texture,  # Share depth from opaque pass
+                color_attachments=[self.emissive_texture]
             )
 
             # Bloom framebuffers for ping-pong blur
-            self.bloom_texture = context.texture((width, height), 3)
+            self.bloom_texture = context.texture(bloom_size, 3, dtype="f2")
             self.bloom_framebuffer = context.framebuffer(
                 color_attachments=[self.bloom_texture]
             )
 
-            self.bloom_temp_texture = context.texture((width, height), 3)
+            self.bloom_temp_texture = context.texture(bloom_size, 3, dtype="f2")
             self.bloom_temp_framebuffer = context.framebuffer(
                 color_attachments=[self.bloom_temp_texture]
             )
 
+        if not self.black_texture:
+            # Stands in for the bloom texture when nothing is emitting light
+            self.black_texture = context.texture((1, 1), 3, bytes(3))
+
         if not self.shader_program:
             vertex_shader = self._get_vertex_shader()
             fragment_shader = self._get_fragment_shader()
@@ -152,14 +201,28 @@ class FixtureVisualization(GenerativeEffectBase):
                 fragment_shader=composite.get_fragment_shader(),
             )
 
+        # Texture units and texel size don't change between frames, so set them
+        # here (again after a resize) and keep handles to the per-frame uniforms
+        self.kawase_shader["inputTexture"] = 0
+        # Offsets stay in full-resolution pixels so the glow spreads as far on
+        # screen as it did at full resolution
+        self.kawase_shader["texelSize"] = (1.0 / width, 1.0 / height)
+        self._u_kawase_offset = self.kawase_shader["offset"]
+        self.composite_shader["opaqueTexture"] = 0
+        self.composite_shader["bloomTexture"] = 1
+        self._u_bloom_alpha = self.composite_shader["bloomAlpha"]
+
         if not self.quad_vao:
-            self.quad_vao = self._create_fullscreen_quad(context)
-            # Create separate VAOs for kawase and composite shaders
+            # One VBO, bound by a VAO per shader (they share the same layout)
+            self._quad_vbo = self._create_quad_vbo(context)
+            self.quad_vao = self._create_quad_for_shader(
+                context, self.shader_program, self._quad_vbo
+            )
             self.kawase_quad_vao = self._create_quad_for_shader(
-                context, self.kawase_shader
+                context, self.kawase_shader, self._quad_vbo
             )
             self.composite_quad_vao = self._create_quad_for_shader(
-                context, self.composite_shader
+                context, self.composite_shader, self._quad_vbo
             )
 
     def _on_venue_change(self, venue):
@@ -168,23 +231,27 @@ class FixtureVisualization(GenerativeEffectBase):
 
     def _load_fixtures(self):
         """Load fixtures from the current venue's patch bay, create renderers, and flatten groups"""
-        fixtures = []
-        print(f"loading fixtures for {self.state.venue}")
-        # Get fixtures from current venue in state (live fixtures)
-        for item in venue_patches[self.state.venue]:
-            if isinstance(item, FixtureGroup):
-                # Add all fixtures from the group
-                for fixture in item.fixtures:
-                    fixtures.append(fixture)
-            else:
-                # Individual fixture
-                fixtures.append(item)
+        # Patches are static per venue, so flatten each venue only once
+        fixtures = self._fixtures_cache.get(self.state.venue)
+        if fixtures is None:
+            fixtures = []
+            print(f"loading fixtures for {self.state.venue}")
+            # Get fixtures from current venue in state (live fixtures)
+            for item in venue_patches[self.state.venue]:
+                if isinstance(item, FixtureGroup):
+                    # Add all fixtures from the group
+                    for fixture in item.fixtures:
+                        fixtures.append(fixture)
+                else:
+                    # Individual fixture
+                    fixtures.append(item)
 
-        # Also include manual fixtures (actor/performance lights)
-        manual_group = get_manual_group(self.state.venue)
-        if manual_group is not None:
-            for fixture in manual_group.fixtures:
-                fixtures.append(fixture)
+            # Also include manual fixtures (actor/performance lights)
+            manual_group = get_manual_group(self.state.venue)
+            if manual_group is not None:
+                for fixture in manual_group.fixtures:
+                    fixtures.append(fixture)
+            self._fixtures_cache[self.state.venue] = fixtures
 
         # Store fixtures temporarily - will create renderers after room_renderer is initialized
         self._fixtures = fixtures
@@ -205,80 +272,130 @@ class FixtureVisualization(GenerativeEffectBase):
             if orientation is not None:
                 renderer.orientation = orientation
 
+    def _partition_renderers(self):
+        """Split renderers into lasers and the rest, flag motionstrips and
+        gather bounding radii
+
+        Only redone when ``self.renderers`` has been replaced.
+        """
+        if self._partitioned_for is self.renderers:
+            return
+
+        self._lasers = [r for r in self.renderers if isinstance(r, LaserRenderer)]
+        self._non_lasers = [
+            r for r in self.renderers if not isinstance(r, LaserRenderer)
+        ]
+        self._motionstrip_flags = [
+            isinstance(renderer, MotionstripRenderer) for renderer in self.renderers
+        ]
+        self._bounding_radii = np.array(
+            [renderer.get_bounding_radius() for renderer in self.renderers],
+            dtype=np.float32,
+        )
+        self._partitioned_for = self.renderers
+
+    def _visible_renderers(
+        self, canvas_size: tuple[float, float]
+    ) -> list[FixtureRenderer]:
+        """Renderers whose bounding sphere is at least partly on camera"""
+        if not self.renderers:
+            return []
+
+        centers = np.array(
+            [renderer.get_3d_position(canvas_size) for renderer in self.renderers],
+            dtype=np.float32,
+        )
+        visible = self.room_renderer.spheres_in_frustum(centers, self._bounding_radii)
+        return [
+            renderer
+            for renderer, is_visible in zip(self.renderers, visible)
+            if is_visible
+        ]
+
     def _collect_fixture_lights(
         self, frame: Frame
     ) -> list[tuple[tuple[float, float, float], tuple[float, float, float, float]]]:
         """Collect light data from all fixtures for dynamic lighting
 
+        Lights are rebuilt only when a fixture's position, orientation, color or
+        dimmer changed since the last frame; otherwise the previous list is reused.
+
         Returns:
             List of (position, color_rgba) tuples where:
             - position is (x, y, z) in world space
             - color_rgba is (r, g, b, intensity) in 0-1 range
         """
-        lights = []
-        canvas_size = (float(self.canvas_width), float(self.canvas_height))
+        canvas_size = self._canvas_size
+        self._partition_renderers()
+
+        # Everything the lights depend on, gathered per renderer
+        states = []
+        for renderer, is_motionstrip in zip(self.renderers, self._motionstrip_flags):
+            if is_motionstrip:
+                # Each motionstrip bulb is a separate light source
+                states.append(
+                    (
+                        renderer.position,
+                        renderer.orientation.tobytes(),
+                        renderer._get_pan_rotation(),
+                        self._motionstrip_bulb_states(renderer),
+                    )
+                )
+            else:
+                states.append(
+                    (
+                        renderer.position,
+                        renderer.get_effective_dimmer(frame),
+                        renderer.get_color(),
+                    )
+                )
 
-        for renderer in self.renderers:
-            # Special handling for motionstrip fixtures - each bulb is a separate light source
-            if isinstance(renderer, MotionstripRenderer):
+        signature = states
+        if self._lights_cache is not None and signature == self._lights_signature:
+            # Callers append to the list, so hand out a copy
+            return list(self._lights_cache)
+
+        lights = []
+        for renderer, state, is_motionstrip in zip(
+            self.renderers, states, self._motionstrip_flags
+        ):
+            if is_motionstrip:
                 lights.extend(
-                    self._collect_motionstrip_lights(renderer, frame, canvas_size)
+                    self._collect_motionstrip_lights(
+                        renderer, state[2], state[3], canvas_size
+                    )
                 )
                 continue
 
-            # Get effective dimmer (includes strobe effect)
-            dimmer = renderer.get_effective_dimmer(frame)
+            _, dimmer, color = state
 
             # Skip if light is off or very dim
             if dimmer < 0.01:
                 continue
 
-            # Get color (RGB 0-1)
-            color = renderer.get_color()
-
             # Get 3D position in world space
             world_pos = renderer.get_3d_position(canvas_size)
 
             # Create light entry: position, (r, g, b, intensity)
             lights.append((world_pos, (color[0], color[1], color[2], dimmer)))
 
-        return lights
+        self._lights_signature = signature
+        self._lights_cache = lights
+        return list(lights)
 
-    def _collect_motionstrip_lights(
-        self,
-        renderer: MotionstripRenderer,
-        frame: Frame,
-        canvas_size: tuple[float, float],
-    ) -> list[tuple[tuple[float, float, float], tuple[float, float, float, float]]]:
-        """Collect light data from each bulb in a motionstrip fixture
+    def _motionstrip_bulb_states(
+        self, renderer: MotionstripRenderer
+    ) -> list[Optional[tuple[float, float, float, float]]]:
+        """Color and intensity of each bulb in a motionstrip fixture
 
         Returns:
-            List of (position, color_rgba) tuples for each bulb
+            (r, g, b, intensity) per bulb in 0-1 range, or None for bulbs that
+            can't be read
         """
-        lights = []
-        fixture = renderer.fixture
-
-        # Get fixture base position in world space
-        fixture_world_pos = renderer.get_3d_position(canvas_size)
-
-        # Calculate pan rotation (same logic as MotionstripRenderer)
-        pan_rotation_deg = renderer._get_pan_rotation()
-        pan_rotation_rad = math.radians(pan_rotation_deg)
-        x_axis = np.array([1.0, 0.0, 0.0], dtype=np.float32)
-        pan_quaternion = quaternion_from_axis_angle(x_axis, pan_rotation_rad)
-
-        # Motionstrip geometry parameters (matching render_emissive)
-        body_height = renderer.cube_size * 0.2
-        body_depth = renderer.cube_size * 0.3
-        bulb_spacing = 0.22
-        num_bulbs = renderer._num_bulbs
-        start_offset_x = -(num_bulbs - 1) * bulb_spacing / 2
-        bulb_forward_distance = body_depth * 0.7
-
-        # Get all bulbs from fixture
-        bulbs = fixture.get_bulbs()
+        states = []
+        fixture_dimmer = renderer.get_dimmer()
 
-        for i, bulb in enumerate(bulbs):
+        for bulb in renderer.fixture.get_bulbs():
             try:
                 # Get bulb color
                 bulb_color_obj = bulb.get_color()
@@ -299,56 +416,76 @@ class FixtureVisualization(GenerativeEffectBase):
 
                 # Get bulb dimmer
                 bulb_dimmer = bulb.get_dimmer() / 255.0
-                fixture_dimmer = renderer.get_dimmer()
                 effective_intensity = bulb_dimmer * fixture_dimmer
 
-                # Skip if bulb is off or very dim
-                if effective_intensity < 0.01:
-                    continue
-
-                # Calculate bulb position in local space (matching render_emissive)
-                bulb_x_local = start_offset_x + i * bulb_spacing
-                bulb_y_local = body_height / 2
-                bulb_z_local = bulb_forward_distance
-                bulb_local_pos = np.array(
-                    [bulb_x_local, bulb_y_local, bulb_z_local], dtype=np.float32
+                states.append(
+                    (float(r), float(g), float(b), float(effective_intensity))
                 )
+            except Exception:
+                states.append(None)  # Skip bulbs that can't be processed
 
-                # Transform to world space:
-                # 1. Apply pan rotation (around X-axis)
-                # 2. Apply fixture orientation
-                # 3. Add fixture world position
+        return states
 
-                # Apply pan rotation
-                bulb_pos_rotated = quaternion_rotate_vector(
-                    pan_quaternion, bulb_local_pos
-                )
+    def _collect_motionstrip_lights(
+        self,
+        renderer: MotionstripRenderer,
+        pan_rotation_deg: float,
+        bulb_states: list[Optional[tuple[float, float, float, float]]],
+        canvas_size: tuple[float, float],
+    ) -> list[tuple[tuple[float, float, float], tuple[float, float, float, float]]]:
+        """Collect light data from each bulb in a motionstrip fixture
 
-                # Apply fixture orientation
-                bulb_pos_oriented = quaternion_rotate_vector(
-                    renderer.orientation, bulb_pos_rotated
-                )
+        Returns:
+            List of (position, color_rgba) tuples for each bulb
+        """
+        lights = []
 
-                # Add fixture world position
-                bulb_world_pos = (
-                    fixture_world_pos[0] + bulb_pos_oriented[0],
-                    fixture_world_pos[1] + bulb_pos_oriented[1],
-                    fixture_world_pos[2] + bulb_pos_oriented[2],
-                )
+        # Get fixture base position in world space
+        fixture_world_pos = renderer.get_3d_position(canvas_size)
 
-                # Create light entry: position, (r, g, b, intensity)
-                lights.append(
-                    (
-                        (
-                            float(bulb_world_pos[0]),
-                            float(bulb_world_pos[1]),
-                            float(bulb_world_pos[2]),
-                        ),
-                        (float(r), float(g), float(b), float(effective_intensity)),
-                    )
-                )
-            except Exception:
-                pass  # Skip bulbs that can't be processed
+        # Calculate pan rotation (same logic as MotionstripRenderer)
+        pan_rotation_rad = math.radians(pan_rotation_deg)
+        x_axis = np.array([1.0, 0.0, 0.0], dtype=np.float32)
+        pan_quaternion = quaternion_from_axis_angle(x_axis, pan_rotation_rad)
+
+        # Motionstrip geometry parameters (matching render_emissive)
+        body_height = renderer.cube_size * 0.2
+        body_depth = renderer.cube_size * 0.3
+        bulb_spacing = 0.22
+        num_bulbs = renderer._num_bulbs
+        start_offset_x = -(num_bulbs - 1) * bulb_spacing / 2
+        bulb_forward_distance = body_depth * 0.7
+
+        # Skip bulbs that are unreadable, off or very dim
+        lit = [
+            i
+            for i, bulb_state in enumerate(bulb_states)
+            if bulb_state is not None and bulb_state[3] >= 0.01
+        ]
+        if not lit:
+            return lights
+
+        # Bulb positions in local space (matching render_emissive)
+        bulb_local_pos = np.empty((len(lit), 3), dtype=np.float32)
+        bulb_local_pos[:, 0] = start_offset_x + np.array(lit) * bulb_spacing
+        bulb_local_pos[:, 1] = body_height / 2
+        bulb_local_pos[:, 2] = bulb_forward_distance
+
+        # Transform to world space:
+        # 1. Apply pan rotation (around X-axis)
+        # 2. Apply fixture orientation
+        # 3. Add fixture world position
+        bulb_pos_rotated = quaternion_rotate_vectors_batch(
+            pan_quaternion, bulb_local_pos
+        )
+        bulb_pos_oriented = quaternion_rotate_vectors_batch(
+            renderer.orientation, bulb_pos_rotated
+        )
+        bulb_world_pos = bulb_pos_oriented + np.asarray(fixture_world_pos)
+
+        # Create light entries: position, (r, g, b, intensity)
+        for i, world_pos in zip(lit, bulb_world_pos.tolist()):
+            lights.append((tuple(world_pos), bulb_states[i]))
 
         return lights
 
@@ -414,14 +551,7 @@ class FixtureVisualization(GenerativeEffectBase):
 
         if vj_texture:
             try:
-                # Read texture data and compute average
-                raw_data = vj_texture.read()
-                pixels = np.frombuffer(raw_data, dtype=np.uint8).reshape(
-                    (vj_texture.height, vj_texture.width, 3)
-                )
-                # Downsample for performance (every 16th pixel)
-                sampled = pixels[::16, ::16, :]
-                avg_color = np.mean(sampled, axis=(0, 1)) / 255.0
+                avg_color = average_texture_color(vj_texture)
                 # Scale down for subtle lighting effect
                 global_light_color = tuple(avg_color * 0.3)
 
@@ -446,13 +576,14 @@ class FixtureVisualization(GenerativeEffectBase):
             )
 
         # Create or recreate renderers if fixtures changed (venue change)
-        if hasattr(self, "_fixtures") and len(self.renderers) != len(self._fixtures):
+        if len(self.renderers) != len(self._fixtures):
             self.renderers = [
                 create_renderer(fixture, self.room_renderer)
                 for fixture in self._fixtures
             ]
             # Apply positions from fixtures (set by position manager) to renderers
             self._apply_positions_to_renderers()
+        self._partition_renderers()
 
         # Update camera rotation based on frame time
         self.room_renderer.update_camera(frame.time)
@@ -463,6 +594,10 @@ class FixtureVisualization(GenerativeEffectBase):
         # Collect and set dynamic lights from fixtures
         fixture_lights = self._collect_fixture_lights(frame)
 
+        # Lights only include fixtures bright enough to see, so with none the
+        # emissive pass would stay black and the bloom passes can be skipped
+        skip_bloom = not fixture_lights
+
         # Add video wall as a light source if it's active
         if video_wall_color is not None:
             # Video wall position (center of billboard at back of room)
@@ -472,7 +607,7 @@ class FixtureVisualization(GenerativeEffectBase):
 
         self.room_renderer.set_dynamic_lights(fixture_lights)
 
-        canvas_size = (float(self.canvas_width), float(self.canvas_height))
+        canvas_size = self._canvas_size
 
         # === PASS 1: Render opaque Blinn-Phong geometry ===
         self.opaque_framebuffer.use()
@@ -505,36 +640,43 @@ class FixtureVisualization(GenerativeEffectBase):
                 normal=(0.0, 0.0, 1.0),  # Face forward toward audience
             )
 
-        # Render fixture bodies (Blinn-Phong materials)
-        for renderer in self.renderers:
-            renderer.render_opaque(context, canvas_size, frame)
-
-        # === PASS 2: Render emissive materials (bulbs and beams, excluding lasers) ===
-        self.emissive_framebuffer.use()
-        context.clear(0.0, 0.0, 0.0)
-        # Don't clear depth - use depth from opaque pass for occlusion
+        # Render fixture bodies (Blinn-Phong materials). Bodies are all boxes, so
+        # they're drawn together as one instanced draw call. Fixtures entirely
+        # off camera are skipped
+        with self.room_renderer.batched_boxes():
+            for renderer in self._visible_renderers(canvas_size):
+                renderer.render_opaque(context, canvas_size, frame)
+
+        if skip_bloom:
+            # Composite against black instead of a blurred empty buffer
+            context.disable(context.DEPTH_TEST)
+            self.bloom_output_texture = self.black_texture
+        else:
+            # === PASS 2: Render emissive materials (bulbs and beams, excluding lasers) ===
+            # (half resolution; use() sets the viewport to match)
+            self.emissive_framebuffer.use()
+            context.clear(0.0, 0.0, 0.0)
 
-        # Disable depth testing entirely for beams so they blend additively
-        # Depth writes are already disabled, but we also disable depth testing
-        # so beams don't occlude each other - they should all blend additively
-        context.disable(context.DEPTH_TEST)
-        context.depth_mask = False
+            # Disable depth testing entirely for beams so they blend additively
+            # Depth writes are already disabled, but we also disable depth testing
+            # so beams don't occlude each other - they should all blend additively
+            context.disable(context.DEPTH_TEST)
+            context.depth_mask = False
 
-        # Enable additive blending for emissive materials
-        context.enable(context.BLEND)
-        context.blend_func = context.SRC_ALPHA, context.ONE
+            # Enable additive blending for emissive materials
+            context.enable(context.BLEND)
+            context.blend_func = context.SRC_ALPHA, context.ONE
 
-        # Render emissive materials (bulbs and beams, but skip lasers - they render sharp)
-        for renderer in self.renderers:
-            if not isinstance(renderer, LaserRenderer):
+            # Render emissive materials (bulbs and beams, but skip lasers - they render sharp)
+            for renderer in self._non_lasers:
                 renderer.render_emissive(context, canvas_size, frame)
 
-        # Restore depth writes
-        context.depth_mask = True
-        context.disable(context.BLEND)
+            # Restore depth writes
+            context.depth_mask = True
+            context.disable(context.BLEND)
 
-        # === PASS 3: Apply Kawase blur to create bloom ===
-        self._apply_kawase_blur(context)
+            # === PASS 3: Apply Kawase blur to create bloom ===
+            self._apply_kawase_blur(context)
 
         # === PASS 4: Composite final image ===
         self._composite_final_image(context)
@@ -549,9 +691,8 @@ class FixtureVisualization(GenerativeEffectBase):
         context.blend_func = context.SRC_ALPHA, context.ONE
 
         # Render lasers directly to final framebuffer (sharp, no blur)
-        for renderer in self.renderers:
-            if isinstance(renderer, LaserRenderer):
-                renderer.render_emissive(context, canvas_size, frame)
+        for renderer in self._lasers:
+            renderer.render_emissive(context, canvas_size, frame)
 
         # Restore state
         context.depth_mask = True
@@ -565,40 +706,36 @@ class FixtureVisualization(GenerativeEffectBase):
         if not self.kawase_shader or not self.emissive_texture:
             return
 
-        # Ping-pong between bloom_framebuffer and bloom_temp_framebuffer
-        # Start with emissive texture as input
-        current_input = self.emissive_texture
-        current_output = self.bloom_framebuffer
+        # Ping-pong between bloom_framebuffer and bloom_temp_framebuffer,
+        # starting with the emissive texture as input. Every pass draws a
+        # fullscreen quad over the whole target, so no clear is needed
+        framebuffers = (self.bloom_framebuffer, self.bloom_temp_framebuffer)
+        textures = (self.bloom_texture, self.bloom_temp_texture)
 
-        texel_size = (1.0 / self.width, 1.0 / self.height)
+        context.disable(context.DEPTH_TEST)
 
         for i in range(self.kawase_iterations):
-            current_output.use()
-            context.clear(0.0, 0.0, 0.0)
+            framebuffers[i & 1].use()
 
-            # Bind input texture
-            current_input.use(0)
+            # Bind input texture: emissive first, then the previous pass output
+            if i == 0:
+                self.emissive_texture.use(0)
+            else:
+                textures[(i - 1) & 1].use(0)
 
-            # Set uniforms
-            self.kawase_shader["inputTexture"] = 0
-            self.kawase_shader["texelSize"] = texel_size
             # Offset increases more gradually with each iteration for smoother blur
             # Start smaller and increase more gradually to avoid streaks
-            self.kawase_shader["offset"] = 1.0 + i * 2.0
+            self._u_kawase_offset.value = 1.0 + i * 2.0
 
             # Render fullscreen quad
             self.kawase_quad_vao.render(mgl.TRIANGLE_STRIP)
 
-            # Ping-pong: output becomes input for next iteration
-            if i < self.kawase_iterations - 1:
-                if current_output == self.bloom_framebuffer:
-                    current_input = self.bloom_texture
-                    current_output = self.bloom_temp_framebuffer
-                else:
-                    current_input = self.bloom_temp_texture
-                    current_output = self.bloom_framebuffer
-
-        # Final result is in bloom_framebuffer/bloom_texture
+        # Texture the last pass wrote to, used by the composite
+        self.bloom_output_texture = (
+            textures[(self.kawase_iterations - 1) & 1]
+            if self.kawase_iterations > 0
+            else self.emissive_texture
+        )
 
     def _composite_final_image(self, context: mgl.Context):
         """Composite opaque, emissive, and bloom textures into final image"""
@@ -611,20 +748,16 @@ class FixtureVisualization(GenerativeEffectBase):
 
         # Bind textures for composite
         self.opaque_texture.use(0)  # Opaque (Blinn-Phong)
-        self.bloom_texture.use(1)  # Bloom
+        self.bloom_output_texture.use(1)  # Bloom
 
-        # Set uniforms
-        self.composite_shader["opaqueTexture"] = 0
-        self.composite_shader["bloomTexture"] = 1
-        self.composite_shader["bloomAlpha"] = self.bloom_alpha
+        # Texture units are set once in _setup_gl_resources
+        self._u_bloom_alpha.value = self.bloom_alpha
 
         # Render fullscreen quad
         self.composite_quad_vao.render(mgl.TRIANGLE_STRIP)
 
-    def _create_quad_for_shader(
-        self, context: mgl.Context, shader: mgl.Program
-    ) -> mgl.VertexArray:
-        """Create a fullscreen quad VAO for a specific shader"""
+    def _create_quad_vbo(self, context: mgl.Context) -> mgl.Buffer:
+        """Create the fullscreen quad vertex buffer (position, texcoord)"""
         vertices = np.array(
             [
                 # Position  # TexCoord
@@ -647,7 +780,12 @@ class FixtureVisualization(GenerativeEffectBase):
             ],
             dtype=np.float32,
         )
-        vbo = context.buffer(vertices.tobytes())
+        return context.buffer(vertices.tobytes())
+
+    def _create_quad_for_shader(
+        self, context: mgl.Context, shader: mgl.Program, vbo: mgl.Buffer
+    ) -> mgl.VertexArray:
+        """Create a fullscreen quad VAO for a specific shader over a shared VBO"""
         return context.vertex_array(
             shader, [(vbo, "2f 2f", "in_position", "in_texcoord")]
         )
@@ -706,6 +844,7 @@ class FixtureVisualization(GenerativeEffectBase):
         self.bloom_texture = None
         self.bloom_temp_framebuffer = None
         self.bloom_temp_texture = None
+        self.bloom_output_texture = None
 
         # Recreate with new dimensions
         self._setup_gl_resources(context, width, height)
@@ -399,8 +399,7 @@ class LaserScanHeads(GenerativeEffectBase):
         blinder_intensity = self.blinder_level
 
         # Use color scheme for laser colors - both fg and bg
-        laser_fg_rgb = scheme.fg.rgb
-        laser_bg_rgb = scheme.bg.rgb
+        laser_fg_rgb, laser_bg_rgb, _ = scheme.rgb
 
         # Convert placement scheme to int for shader
         placement_scheme_map = {"corners": 0, "bottom_row": 1, "top_row": 2}
@@ -2,7 +2,7 @@
 
 import struct
 import moderngl as mgl
-from typing import List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 from enum import Enum
 from beartype import beartype
 
@@ -64,6 +64,10 @@ class LayerCompose(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
         self.quad_vao: Optional[mgl.VertexArray] = None
         self._context: Optional[mgl.Context] = None
 
+        # Render functions of each layer's render target, set by
+        # compile_render_plan() once the tree has been generated
+        self._render_plan: Optional[List[Callable]] = None
+
     def enter(self, context: mgl.Context):
         """Initialize compositing resources"""
         self._context = context
@@ -86,10 +90,23 @@ class LayerCompose(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
         if self.quad_vao:
             self.quad_vao.release()
         self._context = None
+        # The plan points at nodes that are exiting too
+        self._render_plan = None
 
     def generate(self, vibe: Vibe):
         """Generate all layers - handled by base class recursive call"""
-        pass
+        # Layers are about to pick new children, so the plan is stale
+        self._render_plan = None
+
+    def compile_render_plan(self):
+        """Resolve each layer past nodes that only forward render()
+
+        Call after generate_recursive() has finished; the plan is dropped on the
+        next generate().
+        """
+        self._render_plan = [
+            spec.node.render_target().render for spec in self.layer_specs
+        ]
 
     def _create_fullscreen_quad(self, context: mgl.Context):
         """Create a fullscreen quad for texture compositing"""
@@ -189,36 +206,47 @@ class LayerCompose(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
         else:
             return 0
 
-    def _composite_layer(
+    def _composite_layers(
         self,
         context: mgl.Context,
-        texture: mgl.Texture,
-        blend_mode: BlendMode,
-        opacity: float,
+        layers: List[Tuple[int, mgl.Framebuffer, LayerSpec]],
     ):
-        """Composite a layer texture onto the final framebuffer"""
-        if not self.quad_program or not self.quad_vao:
-            return
+        """Composite rendered layers onto the final framebuffer, in layer order
 
-        # Get blend function
-        blend_src, blend_dst = self._get_blend_func(blend_mode)
-
-        # Set up required GL state for compositing
-        # No need to save/restore - we explicitly set what we need
+        The framebuffer, program and viewport are bound once for the whole run,
+        and blend state and uniforms are only set when they change between
+        layers.
+        """
+        self.final_framebuffer.use()
+        context.viewport = (0, 0, self.width, self.height)
         context.disable(mgl.DEPTH_TEST)
-        context.enable(mgl.BLEND)
-        context.blend_func = blend_src, blend_dst
 
-        # Bind texture and set uniforms
-        texture.use(location=0)
+        if not self.quad_program or not self.quad_vao:
+            return
+
         self.quad_program["texture0"] = 0
-        self.quad_program["opacity"] = opacity
-        self.quad_program["blend_mode"] = self._get_blend_mode_int(blend_mode)
+        blend_mode = None
+        opacity = None
+        for i, framebuffer, layer_spec in layers:
+            if i == 0:
+                # First layer: copy directly (base layer)
+                context.disable(mgl.BLEND)
+                context.copy_framebuffer(self.final_framebuffer, framebuffer)
+                self.final_framebuffer.use()
+                blend_mode = None
+                continue
 
-        # Render to final framebuffer
-        self.final_framebuffer.use()
-        context.viewport = (0, 0, self.width, self.height)
-        self.quad_vao.render(mgl.TRIANGLE_STRIP)
+            if layer_spec.blend_mode is not blend_mode:
+                blend_mode = layer_spec.blend_mode
+                context.enable(mgl.BLEND)
+                context.blend_func = self._get_blend_func(blend_mode)
+                self.quad_program["blend_mode"] = self._get_blend_mode_int(blend_mode)
+            if layer_spec.opacity != opacity:
+                opacity = layer_spec.opacity
+                self.quad_program["opacity"] = opacity
+
+            framebuffer.color_attachments[0].use(location=0)
+            self.quad_vao.render(mgl.TRIANGLE_STRIP)
 
     def render(
         self, frame: Frame, scheme: ColorScheme, context: mgl.Context
@@ -236,27 +264,32 @@ class LayerCompose(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
         context.viewport = (0, 0, self.width, self.height)
         context.clear(0.0, 0.0, 0.0, 0.0)
 
-        # Render and composite each layer
-        for i, layer_spec in enumerate(self.layer_specs):
-            # Render the layer
-            layer_result = layer_spec.node.render(frame, scheme, context)
+        render_fns = self._render_plan
+        if render_fns is None:
+            render_fns = [spec.node.render for spec in self.layer_specs]
+
+        # Render every layer into its own framebuffer first, then composite
+        # them in one run, so the final framebuffer isn't rebound per layer
+        rendered = []
+        rendered_fns = []
+        for i, (layer_spec, render_fn) in enumerate(zip(self.layer_specs, render_fns)):
+            if render_fn in rendered_fns:
+                # A node rendered twice reuses its framebuffer, so its earlier
+                # result has to be composited before it is overwritten
+                self._composite_layers(context, rendered)
+                context.disable(mgl.BLEND)
+                rendered = []
+                rendered_fns = []
+            rendered_fns.append(render_fn)
+
+            layer_result = render_fn(frame, scheme, context)
 
             if not layer_result or not layer_result.color_attachments:
                 continue
 
-            if i == 0:
-                # First layer: copy directly (base layer)
-                # Disable blending for base layer copy
-                context.disable(mgl.BLEND)
-                context.copy_framebuffer(self.final_framebuffer, layer_result)
-            else:
-                # Subsequent layers: composite with blend mode
-                self._composite_layer(
-                    context,
-                    layer_result.color_attachments[0],
-                    layer_spec.blend_mode,
-                    layer_spec.opacity,
-                )
+            rendered.append((i, layer_result, layer_spec))
+
+        self._composite_layers(context, rendered)
 
         # Restore GL state to be a good citizen
         # Leave blending disabled (expected by calling code)
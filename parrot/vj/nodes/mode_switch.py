@@ -83,6 +83,12 @@ class ModeSwitch(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
         if self.current_child is not None:
             self.current_child.generate_recursive(vibe)
 
+    def render_target(self) -> BaseInterpretationNode:
+        """The current child's render target"""
+        if self.current_child is None:
+            return self
+        return self.current_child.render_target()
+
     def print_self(self) -> str:
         """Return class name with current mode"""
         mode_name = None
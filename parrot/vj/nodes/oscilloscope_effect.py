@@ -280,9 +280,7 @@ class OscilloscopeEffect(GenerativeEffectBase):
         self.shader_program["resolution"] = (float(self.width), float(self.height))
 
         # Set colors from color scheme (already in 0-1 range)
-        primary_color = list(scheme.fg.rgb)
-        bg_color = list(scheme.bg.rgb)
-        secondary_color = list(scheme.bg_contrast.rgb)
+        primary_color, bg_color, secondary_color = scheme.rgb
 
         # Use the actual color scheme colors instead of forcing green
         base_color = (
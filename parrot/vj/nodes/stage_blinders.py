@@ -222,7 +222,7 @@ class StageBlinders(GenerativeEffectBase):
 
         # Determine blinder color based on use_color_scheme flag
         if self.use_color_scheme:
-            blinder_color = scheme.fg.rgb  # Use color scheme foreground color
+            blinder_color = scheme.rgb[0]  # Use color scheme foreground color
         else:
             blinder_color = (1.0, 1.0, 1.0)  # Use white
 
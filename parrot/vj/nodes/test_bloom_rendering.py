@@ -237,8 +237,7 @@ class TestBloomRendering:
         """Test that beams are properly occluded by fixture bodies"""
         renderer.enter(gl_context)
 
-        # This test verifies the depth buffer is shared correctly
-        # If working, beams behind fixture bodies should not be visible
+        # This test verifies the depth buffer is set up for the opaque pass
 
         # Set all fixtures bright
         for fixture in renderer._fixtures[:5]:
@@ -258,15 +257,15 @@ class TestBloomRendering:
         # Verify depth texture exists and was used
         assert renderer.depth_texture is not None, "Depth texture should exist"
         assert (
-            renderer.emissive_framebuffer.depth_attachment is not None
-        ), "Emissive FB should share depth"
+            renderer.opaque_framebuffer.depth_attachment == renderer.depth_texture
+        ), "Opaque pass should write depth"
 
-        # Verify that emissive framebuffer uses the same depth texture
+        # Emissive pass blends additively without depth testing, at half resolution
         assert (
-            renderer.emissive_framebuffer.depth_attachment == renderer.depth_texture
-        ), "Depth buffer should be shared"
+            renderer.emissive_framebuffer.depth_attachment is None
+        ), "Emissive FB doesn't need depth"
 
-        print("\n✓ Depth buffer is properly shared between passes")
+        print("\n✓ Depth buffer is attached to the opaque pass")
 
         renderer.exit()
 
@@ -105,6 +105,22 @@ class TestConcertStage:
 
         assert isinstance(stage.laser_scan_heads.current_child, LaserScanHeads)
 
+    def test_generate_compiles_render_plan(self):
+        """Test layers render their selected nodes without the ModeSwitch hops"""
+        stage = ConcertStage()
+        stage.generate_recursive(Vibe(VJMode.full_rave))
+
+        plan = stage.mode_switch._render_plan
+        assert len(plan) == len(stage.mode_switch.layer_specs)
+        laser_index = [spec.node for spec in stage.mode_switch.layer_specs].index(
+            stage.laser_scan_heads
+        )
+        assert plan[laser_index] == stage.laser_scan_heads.current_child.render
+
+        # A plain generate picks new children, so the stale plan is dropped
+        stage.mode_switch.generate(Vibe(VJMode.blackout))
+        assert stage.mode_switch._render_plan is None
+
     def test_direct_component_control(self):
         """Test that ModeSwitch components can be accessed"""
         stage = ConcertStage()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+
+import os
+import shutil
+import tempfile
+from unittest.mock import Mock, patch
+
+import pytest
+import numpy as np
+import moderngl as mgl
+
+from parrot.director.color_schemes import scheme_halloween
+from parrot.director.frame import Frame
+from parrot.fixtures.position_manager import FixturePositionManager
+from parrot.patch_bay import venues
+from parrot.state import State
+from parrot.vj.nodes.fixture_visualization import (
+    FixtureVisualization,
+    average_texture_color,
+)
+from parrot.vj.renderers.factory import create_renderer
+from parrot.vj.renderers.laser import LaserRenderer
+from parrot.vj.renderers.room_3d import Room3DRenderer
+from parrot.vj.vj_director import VJDirector
+
+
+class TestAverageTextureColor:
+    """Test GPU-side average color of the VJ texture"""
+
+    @pytest.fixture
+    def gl_context(self):
+        """Create a real OpenGL context for testing"""
+        try:
+            # Create a headless OpenGL context
+            context = mgl.create_context(standalone=True, backend="egl")
+            yield context
+        except Exception:
+            # Fallback for systems without EGL
+            try:
+                context = mgl.create_context(standalone=True)
+                yield context
+            except Exception as e:
+                raise RuntimeError(f"OpenGL context creation failed: {e}")
+
+    def test_average_matches_cpu_mean(self, gl_context):
+        """Test the mipmap reduction matches averaging every pixel on the CPU"""
+        pixels = np.zeros((64, 128, 3), dtype=np.uint8)
+        pixels[:, :64] = (200, 100, 50)
+        texture = gl_context.texture((128, 64), 3, pixels.tobytes())
+
+        avg_color = average_texture_color(texture)
+
+        expected = pixels.reshape(-1, 3).mean(axis=0) / 255.0
+        assert np.allclose(avg_color, expected, atol=2 / 255.0)
+
+    def test_texture_filter_preserved(self, gl_context):
+        """Test building mipmaps doesn't change how the texture is sampled"""
+        texture = gl_context.texture((64, 32), 3)
+        texture.filter = (mgl.NEAREST, mgl.NEAREST)
+
+        average_texture_color(texture)
+
+        assert texture.filter == (mgl.NEAREST, mgl.NEAREST)
+
+
+class TestFixtureVisualization:
+    """Test FixtureVisualization lights and passes with a real GL context"""
+
+    def setup_method(self):
+        """Use temp dir to avoid writing to state.json"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.original_cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+
+    def teardown_method(self):
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    @pytest.fixture
+    def gl_context(self):
+        """Create standalone GL context"""
+        try:
+            ctx = mgl.create_context(standalone=True, backend="egl")
+        except Exception:
+            ctx = mgl.create_context(standalone=True)
+        yield ctx
+        ctx.release()
+
+    @pytest.fixture
+    def viz(self, gl_context):
+        """Fixture visualization for mtn lotus with renderers created"""
+        state = State()
+        state.set_venue(venues.mtn_lotus)
+        vj_director = Mock(spec=VJDirector)
+        vj_director.render.return_value = None
+        viz = FixtureVisualization(
+            state,
+            FixturePositionManager(state),
+            vj_director,
+            width=64,
+            height=64,
+        )
+        room_renderer = Room3DRenderer(gl_context, 64, 64)
+        viz.renderers = [
+            create_renderer(fixture, room_renderer) for fixture in viz._fixtures
+        ]
+        viz._apply_positions_to_renderers()
+        for fixture in viz._fixtures:
+            fixture.set_dimmer(255)
+        return viz
+
+    def test_unchanged_fixtures_reuse_lights(self, viz):
+        """Test an unchanged frame reuses the cached lights"""
+        frame = Frame({})
+        lights = viz._collect_fixture_lights(frame)
+        assert len(lights) > 0
+        cached = viz._lights_cache
+
+        assert viz._collect_fixture_lights(frame) == lights
+        assert viz._lights_cache is cached
+
+    def test_returned_lights_are_a_copy(self, viz):
+        """Test appending to the returned list doesn't touch the cache"""
+        frame = Frame({})
+        lights = viz._collect_fixture_lights(frame)
+        lights.append(((0.0, 0.0, 0.0), (1.0, 1.0, 1.0, 1.0)))
+
+        assert viz._collect_fixture_lights(frame) == lights[:-1]
+
+    def test_dimmer_change_rebuilds_lights(self, viz):
+        """Test turning fixtures off invalidates the cache"""
+        frame = Frame({})
+        assert len(viz._collect_fixture_lights(frame)) > 0
+
+        for fixture in viz._fixtures:
+            fixture.set_dimmer(0)
+
+        assert viz._collect_fixture_lights(frame) == []
+
+    def test_bloom_skipped_when_fixtures_dark(self, viz, gl_context):
+        """Test a blacked-out frame composites against black without blurring"""
+        for fixture in viz._fixtures:
+            fixture.set_dimmer(0)
+
+        viz.render(Frame({}), scheme_halloween[0], gl_context)
+
+        assert viz.bloom_output_texture is viz.black_texture
+
+    def test_bloom_applied_when_fixtures_lit(self, viz, gl_context):
+        """Test lit fixtures still get the blurred bloom"""
+        viz.render(Frame({}), scheme_halloween[0], gl_context)
+
+        assert viz.bloom_output_texture in (viz.bloom_texture, viz.bloom_temp_texture)
+
+    def test_venue_fixtures_flattened_once(self, viz):
+        """Test reloading a venue reuses its flattened fixture list"""
+        fixtures = viz._fixtures
+
+        viz.state.set_venue(venues.big)
+        viz.state.set_venue(venues.mtn_lotus)
+
+        assert viz._fixtures is fixtures
+        assert viz.renderers == []
+
+    def test_bloom_targets_half_resolution(self, viz, gl_context):
+        """Test emissive and bloom render at half size, the output at full size"""
+        viz.render(Frame({}), scheme_halloween[0], gl_context)
+
+        assert viz.texture.size == (64, 64)
+        assert viz.emissive_texture.size == (32, 32)
+        assert viz.bloom_texture.size == (32, 32)
+        assert viz.bloom_temp_texture.size == (32, 32)
+
+    def test_bloom_targets_half_float(self, viz, gl_context):
+        """Test the emissive and bloom chain is HDR, the output 8-bit"""
+        viz.render(Frame({}), scheme_halloween[0], gl_context)
+
+        assert viz.texture.dtype == "f1"
+        for texture in (
+            viz.emissive_texture,
+            viz.bloom_texture,
+            viz.bloom_temp_texture,
+        ):
+            assert texture.dtype == "f2"
+
+    def test_renderers_partitioned_by_pass(self, viz):
+        """Test lasers and the rest are split once per renderers list"""
+        viz._partition_renderers()
+        lasers, non_lasers = viz._lasers, viz._non_lasers
+
+        assert len(lasers) + len(non_lasers) == len(viz.renderers)
+        assert all(isinstance(r, LaserRenderer) for r in lasers)
+        assert not any(isinstance(r, LaserRenderer) for r in non_lasers)
+
+        viz._partition_renderers()
+        assert viz._lasers is lasers
+
+        viz.renderers = list(viz.renderers)
+        viz._partition_renderers()
+        assert viz._lasers is not lasers
+
+    def test_fullscreen_passes_share_quad_vbo(self, viz, gl_context):
+        """Test one quad vertex buffer backs the kawase and composite passes"""
+        viz.render(Frame({}), scheme_halloween[0], gl_context)
+
+        assert viz._quad_vbo is not None
+        assert viz.kawase_quad_vao is not viz.composite_quad_vao
+        assert viz._quad_vbo.size == 16 * 4
+
+    def test_offscreen_fixtures_skip_opaque_pass(self, viz, gl_context):
+        """Test fixtures entirely off camera aren't drawn in the opaque pass"""
+        viz.render(Frame({}), scheme_halloween[0], gl_context)
+        canvas_size = viz._canvas_size
+        visible_from_afar = viz._visible_renderers(canvas_size)
+
+        # Close up on the middle of the room, so more fixtures leave the view
+        viz.room_renderer.camera_distance = 2.0
+        visible = viz._visible_renderers(canvas_size)
+        assert 0 < len(visible) < len(visible_from_afar)
+
+        offscreen = [r for r in viz.renderers if r not in visible]
+        with patch.object(type(offscreen[0]), "render_opaque") as render_opaque:
+            viz.render(Frame({}), scheme_halloween[0], gl_context)
+        drawn = [call.args[0] for call in render_opaque.call_args_list]
+        assert offscreen[0] not in drawn
@@ -235,3 +235,66 @@ class TestLayerComposeOpacity:
             assert (
                 next_red > current_red
             ), f"Higher opacity ({next_opacity}) should produce higher red value than lower opacity ({current_opacity}). Got {next_red} vs {current_red}"
+
+
+class TestLayerComposeOrdering:
+    """Test layers composite in order when blend modes and nodes repeat"""
+
+    @pytest.fixture
+    def gl_context(self):
+        """Create a real OpenGL context for testing"""
+        try:
+            return mgl.create_context(standalone=True, backend="egl")
+        except Exception as e:
+            pytest.skip(f"Cannot create OpenGL context for testing: {e}")
+
+    @pytest.fixture
+    def frame(self):
+        """Create test frame"""
+        return Frame({FrameSignal.freq_low: 0.5})
+
+    @pytest.fixture
+    def color_scheme(self):
+        """Create test color scheme"""
+        return Mock(spec=ColorScheme)
+
+    def test_mixed_blend_modes_composite_in_layer_order(
+        self, gl_context, frame, color_scheme
+    ):
+        """Test consecutive layers with different blend modes apply in order"""
+
+        class ColorSequence(StaticColor):
+            """Renders the next color of a sequence on each render"""
+
+            def __init__(self, *colors):
+                super().__init__(color=colors[0], width=64, height=64)
+                self.colors = list(colors)
+
+            def render(self, frame, scheme, context):
+                self.color = self.colors.pop(0)
+                return super().render(frame, scheme, context)
+
+        black = StaticColor(color=(0.0, 0.0, 0.0), width=64, height=64)
+        green = StaticColor(color=(0.0, 1.0, 0.0), width=64, height=64)
+        # Rendered by two layers, so its framebuffer is overwritten in between
+        sequence = ColorSequence((1.0, 0.0, 0.0), (0.0, 0.0, 1.0))
+
+        layer_compose = LayerCompose(
+            LayerSpec(black, BlendMode.NORMAL),
+            LayerSpec(sequence, BlendMode.ADDITIVE, opacity=0.5),
+            LayerSpec(green, BlendMode.NORMAL, opacity=0.5),
+            LayerSpec(sequence, BlendMode.ADDITIVE, opacity=0.5),
+            width=64,
+            height=64,
+        )
+
+        layer_compose.enter(gl_context)
+        try:
+            result_framebuffer = layer_compose.render(frame, color_scheme, gl_context)
+            pixels = np.frombuffer(result_framebuffer.read(), dtype=np.uint8)
+            center_pixel = pixels.reshape((64, 64, 3))[32, 32].astype(int)
+        finally:
+            layer_compose.exit()
+
+        # Half red, half green over that, then half blue added on top
+        assert np.abs(center_pixel - (64, 128, 128)).max() <= 3
@@ -4,7 +4,7 @@ import os
 import sys
 import time
 from collections import defaultdict, deque
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from functools import wraps
 from itertools import count
 from threading import local
@@ -25,6 +25,8 @@ _render_stack_local = local()
 _node_ids: WeakKeyDictionary[Any, int] = WeakKeyDictionary()
 _node_id_counter = count(1)
 _hook_installed = False
+# Shared by every profile() call while profiling is off, so it allocates nothing
+_null_profile = nullcontext()
 
 
 @beartype
@@ -152,12 +154,13 @@ class VJProfiler:
 
         _install_node_render_profiling()
 
-    @contextmanager
     def profile(self, operation_name: str):
         if not self.enabled:
-            yield
-            return
+            return _null_profile
+        return self._profile(operation_name)
 
+    @contextmanager
+    def _profile(self, operation_name: str):
         start_time = time.perf_counter()
         self.operation_stack.append(operation_name)
         try:
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Texture atlas for small images that renderers draw many of (e.g. text labels).
+Packing them into one texture means drawing them never switches textures.
+"""
+
+from beartype import beartype
+from typing import Optional
+import moderngl as mgl
+import numpy as np
+
+
+@beartype
+class ShelfPacker:
+    """Packs rectangles into a fixed-size area in rows ("shelves")
+
+    Each rectangle goes at the end of the current shelf; when it doesn't fit, a
+    new shelf starts below the tallest rectangle of the current one.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self._shelf_x = 0
+        self._shelf_y = 0
+        self._shelf_height = 0
+
+    def pack(self, width: int, height: int) -> Optional[tuple[int, int]]:
+        """Reserve a width x height rectangle
+
+        Returns:
+            (x, y) of the rectangle, or None if the area is full
+        """
+        if width > self.width:
+            return None
+
+        if self._shelf_x + width > self.width:
+            # Start a new shelf
+            self._shelf_y += self._shelf_height
+            self._shelf_x = 0
+            self._shelf_height = 0
+
+        if self._shelf_y + height > self.height:
+            return None
+
+        x, y = self._shelf_x, self._shelf_y
+        self._shelf_x += width
+        self._shelf_height = max(self._shelf_height, height)
+        return (x, y)
+
+
+@beartype
+class TextureAtlas:
+    """Single texture holding many small images, looked up by key"""
+
+    def __init__(
+        self,
+        context: mgl.Context,
+        width: int = 512,
+        height: int = 512,
+        components: int = 1,
+        padding: int = 1,
+    ):
+        """
+        Args:
+            context: ModernGL context
+            width: Atlas width in pixels
+            height: Atlas height in pixels
+            components: Channels per pixel (1 for grayscale masks)
+            padding: Empty pixels kept around each image so linear filtering
+                doesn't bleed neighbours in
+        """
+        self.components = components
+        self.padding = padding
+        self.texture = context.texture(
+            (width, height), components, bytes(width * height * components)
+        )
+        self.texture.filter = (mgl.LINEAR, mgl.LINEAR)
+        self._packer = ShelfPacker(width, height)
+        # key -> (u offset, v offset, u scale, v scale)
+        self._uv_rects: dict[str, tuple[float, float, float, float]] = {}
+
+    def get(self, key: str) -> Optional[tuple[float, float, float, float]]:
+        """UV rect (u offset, v offset, u scale, v scale) of an added image"""
+        return self._uv_rects.get(key)
+
+    def add(
+        self, key: str, pixels: np.ndarray
+    ) -> Optional[tuple[float, float, float, float]]:
+        """Copy an image into the atlas
+
+        Args:
+            key: Name to look the image up by
+            pixels: uint8 array of shape (height, width) or (height, width,
+                components), in OpenGL row order (bottom row first)
+
+        Returns:
+            UV rect of the image, or None if the atlas is full
+        """
+        height, width = pixels.shape[:2]
+        pad = self.padding
+        origin = self._packer.pack(width + 2 * pad, height + 2 * pad)
+        if origin is None:
+            return None
+
+        x, y = origin[0] + pad, origin[1] + pad
+        self.texture.write(
+            np.ascontiguousarray(pixels, dtype=np.uint8).tobytes(),
+            viewport=(x, y, width, height),
+        )
+
+        atlas_width, atlas_height = self.texture.size
+        uv_rect = (
+            x / atlas_width,
+            y / atlas_height,
+            width / atlas_width,
+            height / atlas_height,
+        )
+        self._uv_rects[key] = uv_rect
+        return uv_rect
+
+    def release(self):
+        """Release the atlas texture"""
+        self.texture.release()
+        self._uv_rects.clear()
@@ -17,47 +17,60 @@ def quaternion_identity() -> np.ndarray:
 
 def quaternion_from_axis_angle(axis: np.ndarray, angle: float) -> np.ndarray:
     """Create quaternion from axis-angle representation"""
-    axis = axis / np.linalg.norm(axis)
+    x, y, z = np.asarray(axis).tolist()
     half_angle = angle / 2.0
-    return np.array(
-        [
-            axis[0] * math.sin(half_angle),
-            axis[1] * math.sin(half_angle),
-            axis[2] * math.sin(half_angle),
-            math.cos(half_angle),
-        ],
-        dtype=np.float32,
+    # sin(half_angle) scaled by 1 / |axis| to normalize the axis
+    s = math.sin(half_angle) / math.sqrt(x * x + y * y + z * z)
+    return np.array([x * s, y * s, z * s, math.cos(half_angle)], dtype=np.float32)
+
+
+def _quaternion_product(
+    x1: float,
+    y1: float,
+    z1: float,
+    w1: float,
+    x2: float,
+    y2: float,
+    z2: float,
+    w2: float,
+) -> tuple[float, float, float, float]:
+    """Hamilton product on plain floats (much cheaper than on numpy scalars)"""
+    return (
+        w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+        w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+        w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+        w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
     )
 
 
 def quaternion_multiply(q1: np.ndarray, q2: np.ndarray) -> np.ndarray:
     """Multiply two quaternions"""
-    x1, y1, z1, w1 = q1
-    x2, y2, z2, w2 = q2
+    x1, y1, z1, w1 = np.asarray(q1).tolist()
+    x2, y2, z2, w2 = np.asarray(q2).tolist()
     return np.array(
-        [
-            w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
-            w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
-            w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
-            w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
-        ],
-        dtype=np.float32,
+        _quaternion_product(x1, y1, z1, w1, x2, y2, z2, w2), dtype=np.float32
     )
 
 
 def quaternion_rotate_vector(q: np.ndarray, v: np.ndarray) -> np.ndarray:
     """Rotate a vector by a quaternion"""
-    # Convert vector to quaternion [v.x, v.y, v.z, 0]
-    v_quat = np.array([v[0], v[1], v[2], 0.0], dtype=np.float32)
+    qx, qy, qz, qw = np.asarray(q).tolist()
+    vx, vy, vz = np.asarray(v).tolist()[:3]
+
+    # Rotate: q * v * q_conj, with v as quaternion [v.x, v.y, v.z, 0]
+    temp = _quaternion_product(qx, qy, qz, qw, vx, vy, vz, 0.0)
+    x, y, z, _ = _quaternion_product(*temp, -qx, -qy, -qz, qw)
 
-    # Conjugate of q
-    q_conj = np.array([-q[0], -q[1], -q[2], q[3]], dtype=np.float32)
+    return np.array([x, y, z], dtype=np.float32)
 
-    # Rotate: q * v * q_conj
-    temp = quaternion_multiply(q, v_quat)
-    result = quaternion_multiply(temp, q_conj)
 
-    return np.array([result[0], result[1], result[2]], dtype=np.float32)
+def quaternion_rotate_vectors_batch(q: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+    """Rotate an (N, 3) array of vectors by a quaternion in one pass"""
+    q_xyz = np.asarray(q[:3], dtype=np.float32)
+    vectors = np.asarray(vectors, dtype=np.float32)
+    # Expanded form of q * v * q_conj for unit quaternions
+    t = np.cross(q_xyz, vectors) + q[3] * vectors
+    return vectors + 2.0 * np.cross(q_xyz, t)
 
 
 @beartype
@@ -113,7 +126,7 @@ class FixtureRenderer:
 
     def get_effective_dimmer(self, frame: Frame) -> float:
         """Get effective dimmer including strobe effect
-        
+
         If dimmer > 0 and strobe > 0, applies a true strobe effect (on/off toggle).
         Otherwise returns the base dimmer value.
         """
@@ -143,6 +156,14 @@ class FixtureRenderer:
             x, y, z, canvas_size[0], canvas_size[1]
         )
 
+    def get_bounding_radius(self) -> float:
+        """Radius around get_3d_position() enclosing the opaque body and label
+
+        Used to skip fixtures that are entirely off camera, so it errs large.
+        """
+        # DMX address label sits cube_size + 0.1 above the center
+        return self.cube_size * 1.5
+
     def get_oriented_offset(self, offset: tuple[float, float, float]) -> np.ndarray:
         """Apply orientation quaternion to a local offset vector
 
@@ -30,6 +30,13 @@ class MotionstripRenderer(FixtureRenderer):
         height = BULB_MARGIN * 2 + BULB_DIA
         return (width, height)
 
+    def get_bounding_radius(self) -> float:
+        """Radius enclosing the bulb bar, which is wider than a cube"""
+        # Body is _num_bulbs * 0.22 wide, centered on the fixture
+        return max(
+            super().get_bounding_radius(), self._num_bulbs * 0.11 + self.cube_size
+        )
+
     def _get_pan_rotation(self) -> float:
         """Calculate pan rotation angle in degrees based on fixture's pan value.
         Pan 0 -> +90°, Pan 255 -> -90° (flipped)
@@ -14,9 +14,13 @@ from PIL import Image, ImageDraw, ImageFont
 
 from parrot.fixtures.base import FixtureBase
 from parrot.vj.renderers.base import FixtureRenderer
+from parrot.vj.renderers.atlas import TextureAtlas
 from parrot.director.frame import Frame
 from parrot.utils.input_events import InputEvents
 
+# Must match MAX_LIGHTS in the Blinn-Phong fragment shader
+MAX_LIGHTS = 64
+
 
 @beartype
 class Room3DRenderer:
@@ -84,6 +88,13 @@ class Room3DRenderer:
         self.dynamic_lights: list[
             tuple[tuple[float, float, float], tuple[float, float, float, float]]
         ] = []
+        # Dynamic lights packed for upload: (x, y, z) and (r, g, b, intensity)
+        # rows, zero-padded to MAX_LIGHTS as the shader arrays expect
+        self._light_positions = np.zeros((MAX_LIGHTS, 3), dtype=np.float32)
+        self._light_colors = np.zeros((MAX_LIGHTS, 4), dtype=np.float32)
+        self._light_positions_bytes = self._light_positions.tobytes()
+        self._light_colors_bytes = self._light_colors.tobytes()
+        self._num_lights = 0
 
         self._setup_shaders()
         self._setup_emission_shader()  # Separate shader for pure emission (no lighting)
@@ -98,7 +109,9 @@ class Room3DRenderer:
         self.position_stack: list[tuple[float, float, float]] = [(0.0, 0.0, 0.0)]
         self.rotation_stack: list[np.ndarray] = [self._identity_quaternion()]
 
-        # Text rendering cache
+        # Text rendering cache. Labels are packed into one atlas texture; the
+        # per-label cache only holds labels that didn't fit in the atlas
+        self._text_atlas = TextureAtlas(self.ctx)
         self._text_texture_cache: dict[str, mgl.Texture] = {}
         self._text_font: Optional[ImageFont.ImageFont] = None
         self._load_text_font()
@@ -124,32 +137,20 @@ class Room3DRenderer:
             tuple[mgl.Buffer, mgl.Buffer, mgl.VertexArray, int, np.ndarray],
         ] = {}
 
+        # Instanced box drawing (see batched_boxes). While a batch is open, boxes
+        # are collected as (model matrix, color) and text labels are deferred
+        self._box_batch: Optional[list[tuple[np.ndarray, tuple]]] = None
+        self._deferred_labels: Optional[list[tuple]] = None
+        self._box_instance_vbo: Optional[mgl.Buffer] = None
+        self._box_instance_vao: Optional[mgl.VertexArray] = None
+        self._box_instance_capacity = 0
+        self._unit_box_vbo: Optional[mgl.Buffer] = None
+        self._unit_box_normal_vbo: Optional[mgl.Buffer] = None
+
     def _setup_shaders(self):
         """Setup OpenGL shaders for 3D rendering with Blinn-Phong lighting"""
-        self.shader = self.ctx.program(
-            vertex_shader="""
-                #version 330 core
-                in vec3 position;
-                in vec4 color;
-                in vec3 normal;
-                
-                uniform mat4 mvp;
-                uniform mat4 model;
-                
-                out vec3 frag_pos;
-                out vec4 frag_color;
-                out vec3 frag_normal;
-                
-                void main() {
-                    vec4 pos = mvp * vec4(position, 1.0);
-                    pos.y = -pos.y;  // Flip Y axis
-                    gl_Position = pos;
-                    frag_pos = vec3(model * vec4(position, 1.0));
-                    frag_color = color;
-                    frag_normal = mat3(model) * normal;
-                }
-            """,
-            fragment_shader="""
+        # Shared by the per-draw shader and the instanced box shader
+        blinn_phong_fragment_shader = """
                 #version 330 core
                 in vec3 frag_pos;
                 in vec4 frag_color;
@@ -229,7 +230,61 @@ class Room3DRenderer:
                         color = vec4(result, frag_color.a);
                     }
                 }
+            """
+
+        self.shader = self.ctx.program(
+            vertex_shader="""
+                #version 330 core
+                in vec3 position;
+                in vec4 color;
+                in vec3 normal;
+                
+                uniform mat4 mvp;
+                uniform mat4 model;
+                
+                out vec3 frag_pos;
+                out vec4 frag_color;
+                out vec3 frag_normal;
+                
+                void main() {
+                    vec4 pos = mvp * vec4(position, 1.0);
+                    pos.y = -pos.y;  // Flip Y axis
+                    gl_Position = pos;
+                    frag_pos = vec3(model * vec4(position, 1.0));
+                    frag_color = color;
+                    frag_normal = mat3(model) * normal;
+                }
             """,
+            fragment_shader=blinn_phong_fragment_shader,
+        )
+
+        # Same lighting, with the model matrix and color supplied per instance so
+        # many boxes can be drawn in one call (see batched_boxes)
+        self.box_instance_shader = self.ctx.program(
+            vertex_shader="""
+                #version 330 core
+                in vec3 position;
+                in vec3 normal;
+                in mat4 instance_model;
+                in vec4 instance_color;
+                
+                uniform mat4 view_proj;
+                
+                out vec3 frag_pos;
+                out vec4 frag_color;
+                out vec3 frag_normal;
+                
+                void main() {
+                    vec4 world_pos = instance_model * vec4(position, 1.0);
+                    vec4 pos = view_proj * world_pos;
+                    pos.y = -pos.y;  // Flip Y axis
+                    gl_Position = pos;
+                    frag_pos = world_pos.xyz;
+                    frag_color = instance_color;
+                    frag_normal = mat3(instance_model) * normal;
+                }
+            """,
+            fragment_shader=blinn_phong_fragment_shader,
         )
 
     def _setup_emission_shader(self):
@@ -337,10 +392,11 @@ class Room3DRenderer:
                 
                 uniform sampler2D text_texture;
                 uniform vec3 text_color;
+                uniform vec4 uv_rect;  // Label's offset (xy) and size (zw) in the texture
                 
                 void main() {
                     // Sample text alpha from texture (white text on black background)
-                    float alpha = texture(text_texture, uv).r;
+                    float alpha = texture(text_texture, uv_rect.xy + uv * uv_rect.zw).r;
                     // Output colored text with transparency
                     color = vec4(text_color, alpha);
                 }
@@ -551,6 +607,41 @@ class Room3DRenderer:
         mvp = proj @ view @ model
         return mvp
 
+    def get_frustum_planes(self) -> np.ndarray:
+        """Camera frustum as (6, 4) planes (a, b, c, d) with normals pointing in
+
+        A world point (x, y, z) is inside when a*x + b*y + c*z + d >= 0 for all
+        six planes (left, right, bottom, top, near, far).
+        """
+        m = self._get_mvp_matrix().astype(np.float64)
+        planes = np.array(
+            [
+                m[3] + m[0],
+                m[3] - m[0],
+                m[3] + m[1],
+                m[3] - m[1],
+                m[3] + m[2],
+                m[3] - m[2],
+            ]
+        )
+        # Normalize so plane distances are in world units
+        planes /= np.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+        return planes
+
+    def spheres_in_frustum(self, centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+        """Which bounding spheres are at least partly inside the camera frustum
+
+        Args:
+            centers: (N, 3) sphere centers in world space
+            radii: (N,) sphere radii
+
+        Returns:
+            (N,) bool array, False only for spheres entirely outside a plane
+        """
+        planes = self.get_frustum_planes()
+        distances = centers @ planes[:, :3].T + planes[:, 3]
+        return ~(distances < -radii[:, None]).any(axis=1)
+
     def _create_look_at_matrix(self, eye, center, up):
         """Create a look-at view matrix"""
         # Forward vector (from eye to center)
@@ -627,43 +718,36 @@ class Room3DRenderer:
         """
         self.dynamic_lights = lights
 
+        # Pack once per frame; every lit draw uploads the same bytes
+        num_lights = min(len(lights), MAX_LIGHTS)
+        self._light_positions.fill(0.0)
+        self._light_colors.fill(0.0)
+        if num_lights > 0:
+            packed = np.array(
+                [(*pos, *color_rgba) for pos, color_rgba in lights[:num_lights]],
+                dtype=np.float32,
+            )
+            self._light_positions[:num_lights] = packed[:, :3]
+            self._light_colors[:num_lights] = packed[:, 3:]
+        self._light_positions_bytes = self._light_positions.tobytes()
+        self._light_colors_bytes = self._light_colors.tobytes()
+        self._num_lights = num_lights
+
     def update_camera(self, time: float):
         """Update camera - no longer auto-rotates, controlled by mouse"""
         # Camera angle is now controlled by mouse drag
         pass
 
-    def _set_dynamic_lights_uniforms(self):
-        """Set dynamic light uniforms in the shader"""
-        num_lights = min(len(self.dynamic_lights), 64)  # Max 64 lights
+    def _set_dynamic_lights_uniforms(self, shader: Optional[mgl.Program] = None):
+        """Set dynamic light uniforms in the shader (the Blinn-Phong one by default)"""
+        if shader is None:
+            shader = self.shader
 
-        if num_lights > 0:
-            # Prepare arrays for positions and colors
-            positions = []
-            colors = []
-
-            for i in range(num_lights):
-                pos, color_rgba = self.dynamic_lights[i]
-                positions.extend(pos)
-                colors.extend(color_rgba)
-
-            # Pad with zeros if needed (shader expects arrays of size MAX_LIGHTS)
-            for i in range(num_lights, 64):
-                positions.extend([0.0, 0.0, 0.0])
-                colors.extend([0.0, 0.0, 0.0, 0.0])
-
-            # Set uniforms
-            self.shader["numLights"] = num_lights
-
-            # Set arrays as flat arrays
-            positions_array = np.array(positions, dtype=np.float32)
-            colors_array = np.array(colors, dtype=np.float32)
-
-            # Write the entire array at once using tuple conversion
-            self.shader["lightPositions"].write(positions_array.tobytes())
-            self.shader["lightColors"].write(colors_array.tobytes())
-        else:
-            # No lights
-            self.shader["numLights"] = 0
+        shader["numLights"] = self._num_lights
+        if self._num_lights > 0:
+            # Write the entire packed arrays at once
+            shader["lightPositions"].write(self._light_positions_bytes)
+            shader["lightColors"].write(self._light_colors_bytes)
 
     # Transform stack methods
 
@@ -984,6 +1068,11 @@ class Room3DRenderer:
             color: RGB color tuple
             size: Size of the cube
         """
+        if self._box_batch is not None:
+            # Cube geometry spans -size/2..size/2 in X/Z and 0..size in Y
+            self._add_box_instance(position, (size, size, size), color)
+            return
+
         # Get or create cached geometry
         if size not in self._cube_cache:
             self._cube_cache[size] = self._create_cube_geometry(size)
@@ -1057,6 +1146,10 @@ class Room3DRenderer:
         depth: float,
     ):
         """Render a rectangular box (not a cube) with custom dimensions"""
+        if self._box_batch is not None:
+            self._add_box_instance((x, y, z), (width, height, depth), color)
+            return
+
         half_width = width / 2.0
         half_height = height / 2.0
         half_depth = depth / 2.0
@@ -1200,6 +1293,209 @@ class Room3DRenderer:
         color_vbo.release()
         vao.release()
 
+    @contextmanager
+    def batched_boxes(self):
+        """Context manager that draws all boxes and cubes as one instanced draw call
+
+        render_cube and render_rectangular_box calls inside the block are
+        collected with their current transform and drawn together when the
+        block exits. Text labels are deferred until after the boxes so their
+        blended quads don't hide boxes that come later.
+
+        Usage:
+            with room_renderer.batched_boxes():
+                for renderer in renderers:
+                    renderer.render_opaque(context, canvas_size, frame)
+        """
+        self._box_batch = []
+        self._deferred_labels = []
+        try:
+            yield
+            boxes = self._box_batch
+            labels = self._deferred_labels
+        finally:
+            self._box_batch = None
+            self._deferred_labels = None
+
+        if boxes:
+            self._render_box_instances(boxes)
+
+        for position, rotation, args in labels:
+            self.position_stack.append(position)
+            self.rotation_stack.append(rotation)
+            try:
+                self.render_text_label(*args)
+            finally:
+                self.position_stack.pop()
+                self.rotation_stack.pop()
+
+    def _add_box_instance(
+        self,
+        position: tuple[float, float, float],
+        scale: tuple[float, float, float],
+        color: tuple[float, float, float],
+    ):
+        """Queue a unit box, scaled and offset in local space, for the open batch"""
+        x, y, z = position
+        sx, sy, sz = scale
+        local_model = np.array(
+            [[sx, 0, 0, x], [0, sy, 0, y], [0, 0, sz, z], [0, 0, 0, 1]],
+            dtype=np.float32,
+        )
+        self._box_batch.append((self._get_current_model_matrix() @ local_model, color))
+
+    def _create_unit_box_geometry(self):
+        """Create the box drawn by the instanced shader
+
+        Spans -0.5..0.5 in X/Z and 0..1 in Y, matching render_rectangular_box
+        with unit dimensions at the origin.
+        """
+        faces = [
+            # Front face (normal: 0, 0, -1)
+            (
+                [
+                    [-0.5, 0, -0.5],
+                    [0.5, 0, -0.5],
+                    [-0.5, 1, -0.5],
+                    [0.5, 0, -0.5],
+                    [0.5, 1, -0.5],
+                    [-0.5, 1, -0.5],
+                ],
+                [0.0, 0.0, -1.0],
+            ),
+            # Back face (normal: 0, 0, 1)
+            (
+                [
+                    [-0.5, 0, 0.5],
+                    [-0.5, 1, 0.5],
+                    [0.5, 0, 0.5],
+                    [0.5, 0, 0.5],
+                    [-0.5, 1, 0.5],
+                    [0.5, 1, 0.5],
+                ],
+                [0.0, 0.0, 1.0],
+            ),
+            # Left face (normal: -1, 0, 0)
+            (
+                [
+                    [-0.5, 0, -0.5],
+                    [-0.5, 1, -0.5],
+                    [-0.5, 0, 0.5],
+                    [-0.5, 0, 0.5],
+                    [-0.5, 1, -0.5],
+                    [-0.5, 1, 0.5],
+                ],
+                [-1.0, 0.0, 0.0],
+            ),
+            # Right face (normal: 1, 0, 0)
+            (
+                [
+                    [0.5, 0, -0.5],
+                    [0.5, 0, 0.5],
+                    [0.5, 1, -0.5],
+                    [0.5, 1, -0.5],
+                    [0.5, 0, 0.5],
+                    [0.5, 1, 0.5],
+                ],
+                [1.0, 0.0, 0.0],
+            ),
+            # Top face (normal: 0, 1, 0)
+            (
+                [
+                    [-0.5, 1, -0.5],
+                    [0.5, 1, -0.5],
+                    [-0.5, 1, 0.5],
+                    [0.5, 1, -0.5],
+                    [0.5, 1, 0.5],
+                    [-0.5, 1, 0.5],
+                ],
+                [0.0, 1.0, 0.0],
+            ),
+            # Bottom face (normal: 0, -1, 0)
+            (
+                [
+                    [-0.5, 0, -0.5],
+                    [-0.5, 0, 0.5],
+                    [0.5, 0, -0.5],
+                    [0.5, 0, -0.5],
+                    [-0.5, 0, 0.5],
+                    [0.5, 0, 0.5],
+                ],
+                [0.0, -1.0, 0.0],
+            ),
+        ]
+
+        vertices = np.array([v for face, _ in faces for v in face], dtype=np.float32)
+        normals = np.array(
+            [normal for face, normal in faces for _ in face], dtype=np.float32
+        )
+
+        self._unit_box_vbo = self.ctx.buffer(vertices.tobytes())
+        self._unit_box_normal_vbo = self.ctx.buffer(normals.tobytes())
+
+    def _render_box_instances(self, boxes: list[tuple[np.ndarray, tuple]]):
+        """Draw the collected boxes with a single instanced draw call"""
+        if self._unit_box_vbo is None:
+            self._create_unit_box_geometry()
+
+        num_boxes = len(boxes)
+        if num_boxes > self._box_instance_capacity:
+            # Grow the per-instance buffer and rebuild the VAO that points at it
+            if self._box_instance_vao is not None:
+                self._box_instance_vao.release()
+                self._box_instance_vbo.release()
+            self._box_instance_capacity = max(
+                num_boxes, 2 * self._box_instance_capacity
+            )
+            self._box_instance_vbo = self.ctx.buffer(
+                reserve=self._box_instance_capacity * 20 * 4
+            )  # mat4 model + RGBA color per instance
+            self._box_instance_vao = self.ctx.vertex_array(
+                self.box_instance_shader,
+                [
+                    (self._unit_box_vbo, "3f", "position"),
+                    (self._unit_box_normal_vbo, "3f", "normal"),
+                    (
+                        self._box_instance_vbo,
+                        "16f 4f/i",
+                        "instance_model",
+                        "instance_color",
+                    ),
+                ],
+            )
+
+        instances = np.empty((num_boxes, 20), dtype=np.float32)
+        # GLSL reads matrices column-major, so store each model transposed
+        instances[:, :16] = (
+            np.stack([model for model, _ in boxes])
+            .transpose(0, 2, 1)
+            .reshape(num_boxes, 16)
+        )
+        instances[:, 16:19] = [color for _, color in boxes]
+        instances[:, 19] = 1.0
+        self._box_instance_vbo.write(instances.tobytes())
+
+        horizontal_distance = self.camera_distance * math.cos(self.camera_tilt)
+        cam_x = horizontal_distance * math.sin(self.camera_angle)
+        cam_z = horizontal_distance * math.cos(self.camera_angle)
+        cam_y = self.camera_height + self.camera_distance * math.sin(self.camera_tilt)
+
+        shader = self.box_instance_shader
+        shader["view_proj"] = self._get_mvp_matrix().T.flatten()
+        shader["viewPos"] = (cam_x, cam_y, cam_z)
+        shader["dirLightDir"] = tuple(self.directional_light_dir)
+        shader["dirLightColor"] = tuple(self.directional_light_color)
+        shader["ambientColor"] = tuple(self.ambient_light_color)
+        shader["ambientStrength"] = self.ambient_strength
+        shader["specularStrength"] = self.specular_strength
+        shader["shininess"] = self.shininess
+        shader["emission"] = 0.0  # Boxes use normal lighting
+
+        # Set dynamic lights
+        self._set_dynamic_lights_uniforms(shader)
+
+        self._box_instance_vao.render(mgl.TRIANGLES, instances=num_boxes)
+
     def _create_circle_geometry(self, radius: float, segments: int):
         """Create reusable circle geometry at origin facing +Z (for Blinn-Phong shader)"""
         circle_vertices = []
@@ -1895,6 +2191,20 @@ class Room3DRenderer:
         self.ctx.disable(mgl.BLEND)
         self.ctx.disable(mgl.CULL_FACE)
 
+    def _render_text_image(self, text: str) -> np.ndarray:
+        """Draw a text label into a grayscale image in OpenGL row order"""
+        # Use a small image size for text labels
+        img_width, img_height = 64, 16
+        image = Image.new("L", (img_width, img_height), 0)  # Grayscale, black background
+        draw = ImageDraw.Draw(image)
+
+        # Draw white text
+        draw.text((2, 2), text, fill=255, font=self._text_font)
+
+        # Convert to numpy and flip vertically to match OpenGL texture coordinates
+        img_array = np.array(image, dtype=np.uint8)
+        return np.ascontiguousarray(np.flipud(img_array))
+
     def render_text_label(
         self,
         text: str,
@@ -1913,28 +2223,36 @@ class Room3DRenderer:
         if not self._text_font:
             return
 
-        # Create or get cached texture for this text
-        cache_key = text
-        if cache_key not in self._text_texture_cache:
-            # Create PIL image with text
-            # Use a small image size for text labels
-            img_width, img_height = 64, 16
-            image = Image.new(
-                "L", (img_width, img_height), 0
-            )  # Grayscale, black background
-            draw = ImageDraw.Draw(image)
-
-            # Draw white text
-            draw.text((2, 2), text, fill=255, font=self._text_font)
-
-            # Convert to numpy and flip vertically to match OpenGL texture coordinates
-            img_array = np.array(image, dtype=np.uint8)
-            img_array = np.flipud(img_array)  # Flip to match OpenGL coords
-            texture = self.ctx.texture((img_width, img_height), 1, img_array.tobytes())
-            texture.filter = (mgl.LINEAR, mgl.LINEAR)
-            self._text_texture_cache[cache_key] = texture
-
-        texture = self._text_texture_cache[cache_key]
+        if self._deferred_labels is not None:
+            # Drawn after the batched boxes, with the transform in effect now
+            self._deferred_labels.append(
+                (
+                    self.position_stack[-1],
+                    self.rotation_stack[-1],
+                    (text, position, color, size),
+                )
+            )
+            return
+
+        # Find this text in the label atlas, adding it the first time it's drawn
+        texture = self._text_atlas.texture
+        uv_rect = self._text_atlas.get(text)
+        if uv_rect is None:
+            if text not in self._text_texture_cache:
+                img_array = self._render_text_image(text)
+                uv_rect = self._text_atlas.add(text, img_array)
+                if uv_rect is None:
+                    # Atlas is full - give this label its own texture
+                    label_texture = self.ctx.texture(
+                        (img_array.shape[1], img_array.shape[0]),
+                        1,
+                        img_array.tobytes(),
+                    )
+                    label_texture.filter = (mgl.LINEAR, mgl.LINEAR)
+                    self._text_texture_cache[text] = label_texture
+            if uv_rect is None:
+                texture = self._text_texture_cache[text]
+                uv_rect = (0.0, 0.0, 1.0, 1.0)
 
         # Create a quad to display the text
         x, y, z = position
@@ -1990,6 +2308,7 @@ class Room3DRenderer:
 
         self.text_shader["mvp"] = mvp_with_model.T.flatten()
         self.text_shader["text_color"] = color
+        self.text_shader["uv_rect"] = uv_rect
 
         # Bind texture and render
         texture.use(0)
@@ -2173,6 +2492,7 @@ class Room3DRenderer:
     def cleanup(self):
         """Clean up OpenGL resources"""
         # Cleanup text textures
+        self._text_atlas.release()
         for texture in self._text_texture_cache.values():
             texture.release()
         self._text_texture_cache.clear()
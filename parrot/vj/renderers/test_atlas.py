@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+import pytest
+import numpy as np
+import moderngl as mgl
+
+from parrot.vj.renderers.atlas import ShelfPacker, TextureAtlas
+
+
+def test_shelf_packer_fills_rows_then_starts_new_shelf():
+    """Test rectangles go left to right, then onto a new shelf"""
+    packer = ShelfPacker(100, 100)
+
+    assert packer.pack(40, 10) == (0, 0)
+    assert packer.pack(40, 20) == (40, 0)
+    # Doesn't fit on the first shelf; next shelf starts below the tallest
+    assert packer.pack(40, 10) == (0, 20)
+
+
+def test_shelf_packer_reports_full():
+    """Test packing fails once the area is used up"""
+    packer = ShelfPacker(50, 20)
+
+    assert packer.pack(50, 20) == (0, 0)
+    assert packer.pack(10, 10) is None
+    assert packer.pack(60, 5) is None
+
+
+class TestTextureAtlas:
+    """Test packing images into an atlas texture"""
+
+    @pytest.fixture
+    def gl_context(self):
+        """Create a real OpenGL context for testing"""
+        try:
+            # Create a headless OpenGL context
+            context = mgl.create_context(standalone=True, backend="egl")
+            yield context
+        except Exception:
+            # Fallback for systems without EGL
+            try:
+                context = mgl.create_context(standalone=True)
+                yield context
+            except Exception as e:
+                raise RuntimeError(f"OpenGL context creation failed: {e}")
+
+    def test_images_land_at_their_uv_rects(self, gl_context):
+        """Test each image can be read back from the rect the atlas returns"""
+        atlas = TextureAtlas(gl_context, 64, 64)
+        first = np.full((16, 32), 200, dtype=np.uint8)
+        second = np.arange(16 * 32, dtype=np.uint8).reshape(16, 32)
+
+        first_rect = atlas.add("first", first)
+        second_rect = atlas.add("second", second)
+
+        data = np.frombuffer(atlas.texture.read(), dtype=np.uint8).reshape(64, 64)
+        for image, (u, v, su, sv) in ((first, first_rect), (second, second_rect)):
+            x, y = round(u * 64), round(v * 64)
+            w, h = round(su * 64), round(sv * 64)
+            assert (w, h) == (32, 16)
+            assert np.array_equal(data[y : y + h, x : x + w], image)
+
+        assert atlas.get("second") == second_rect
+        assert atlas.get("missing") is None
+
+    def test_full_atlas_returns_none(self, gl_context):
+        """Test adding to a full atlas fails instead of overlapping images"""
+        atlas = TextureAtlas(gl_context, 32, 16, padding=0)
+        image = np.zeros((16, 32), dtype=np.uint8)
+
+        assert atlas.add("first", image) is not None
+        assert atlas.add("second", image) is None
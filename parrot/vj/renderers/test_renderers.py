@@ -1,13 +1,22 @@
 #!/usr/bin/env python3
 
+import math
+
 import pytest
 import moderngl as mgl
+import numpy as np
 
 from parrot.fixtures.led_par import ParRGB
 from parrot.fixtures.chauvet.intimidator160 import ChauvetSpot160_12Ch
 from parrot.fixtures.oultia.laser import TwoBeamLaser
 from parrot.fixtures.motionstrip import Motionstrip38
 from parrot.vj.renderers.factory import create_renderer
+from parrot.vj.renderers.base import (
+    quaternion_from_axis_angle,
+    quaternion_multiply,
+    quaternion_rotate_vector,
+    quaternion_rotate_vectors_batch,
+)
 from parrot.vj.renderers.bulb import BulbRenderer
 from parrot.vj.renderers.moving_head import MovingHeadRenderer
 from parrot.vj.renderers.laser import LaserRenderer
@@ -339,3 +348,49 @@ def test_room_renderer_floor_optional():
     room_no_floor.cleanup()
     room_with_floor.cleanup()
     ctx.release()
+
+
+def test_quaternion_rotate_vectors_batch_matches_single():
+    """Test batched rotation matches rotating each vector on its own"""
+    q = quaternion_from_axis_angle(np.array([1.0, 2.0, 0.5]), math.radians(70))
+    vectors = np.array(
+        [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.3, -0.2, 0.7], [0.0, 0.0, 0.0]],
+        dtype=np.float32,
+    )
+
+    rotated = quaternion_rotate_vectors_batch(q, vectors)
+
+    assert rotated.shape == (4, 3)
+    for vector, result in zip(vectors, rotated):
+        assert np.allclose(result, quaternion_rotate_vector(q, vector), atol=1e-5)
+
+
+def test_quaternion_multiply_composes_rotations():
+    """Test rotating by a product equals rotating by each quaternion in turn"""
+    q1 = quaternion_from_axis_angle(np.array([0.0, 1.0, 0.0]), math.radians(90))
+    q2 = quaternion_from_axis_angle(np.array([1.0, 0.0, 0.0]), math.radians(90))
+    vector = np.array([1.0, 0.0, 0.0], dtype=np.float32)
+
+    # 90 degrees about Y takes +X to -Z
+    rotated = quaternion_rotate_vector(q1, vector)
+    assert np.allclose(rotated, [0.0, 0.0, -1.0], atol=1e-6)
+
+    combined = quaternion_multiply(q2, q1)
+    assert combined.dtype == np.float32
+    assert np.allclose(
+        quaternion_rotate_vector(combined, vector),
+        quaternion_rotate_vector(q2, rotated),
+        atol=1e-6,
+    )
+
+
+def test_motionstrip_bounding_radius_covers_bulb_bar():
+    """Test the motionstrip bound reaches past both ends of its bulb bar"""
+    renderer = create_renderer(Motionstrip38(1, 0, 256))
+    bulb_bar_half_width = renderer._num_bulbs * 0.22 / 2
+
+    assert renderer.get_bounding_radius() > bulb_bar_half_width
+    assert (
+        renderer.get_bounding_radius()
+        >= create_renderer(ParRGB(1)).get_bounding_radius()
+    )
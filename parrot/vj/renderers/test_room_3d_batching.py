@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+
+import math
+
+import pytest
+import numpy as np
+import moderngl as mgl
+
+from parrot.vj.renderers.base import quaternion_from_axis_angle
+from parrot.vj.renderers.room_3d import MAX_LIGHTS, Room3DRenderer
+
+
+class TestBatchedBoxes:
+    """Test instanced box drawing matches drawing each box on its own"""
+
+    @pytest.fixture
+    def gl_context(self):
+        """Create a real OpenGL context for testing"""
+        try:
+            # Create a headless OpenGL context
+            context = mgl.create_context(standalone=True, backend="egl")
+            yield context
+        except Exception:
+            # Fallback for systems without EGL
+            try:
+                context = mgl.create_context(standalone=True)
+                yield context
+            except Exception as e:
+                raise RuntimeError(f"OpenGL context creation failed: {e}")
+
+    def _render(self, context, room_renderer, batched):
+        texture = context.texture((160, 120), 3)
+        depth = context.depth_texture((160, 120))
+        framebuffer = context.framebuffer(
+            color_attachments=[texture], depth_attachment=depth
+        )
+        framebuffer.use()
+        context.clear(0.0, 0.0, 0.0, depth=1.0)
+        context.enable(context.DEPTH_TEST)
+
+        tilt = quaternion_from_axis_angle(np.array([0.0, 1.0, 0.0]), math.radians(30))
+
+        def draw():
+            room_renderer.render_cube((0.0, 0.0, 0.0), (0.8, 0.2, 0.2), 0.6)
+            with room_renderer.local_position((1.5, 0.5, 0.0)):
+                with room_renderer.local_rotation(tilt):
+                    room_renderer.render_rectangular_box(
+                        0.0, 0.2, 0.0, (0.2, 0.8, 0.2), 1.2, 0.4, 0.3
+                    )
+
+        if batched:
+            with room_renderer.batched_boxes():
+                draw()
+        else:
+            draw()
+
+        context.disable(context.DEPTH_TEST)
+        pixels = np.frombuffer(framebuffer.read(components=3), dtype=np.uint8)
+        framebuffer.release()
+        return pixels
+
+    def test_batched_matches_immediate(self, gl_context):
+        """Test a batch of boxes renders the same pixels as individual draws"""
+        room_renderer = Room3DRenderer(gl_context, 160, 120)
+        room_renderer.set_dynamic_lights([((0.0, 2.0, 1.0), (1.0, 0.5, 0.2, 1.0))])
+
+        immediate = self._render(gl_context, room_renderer, batched=False)
+        batched = self._render(gl_context, room_renderer, batched=True)
+
+        assert immediate.max() > 0
+        assert np.abs(immediate.astype(int) - batched.astype(int)).max() <= 2
+
+    def test_batch_closed_after_block(self, gl_context):
+        """Test boxes outside the block are drawn immediately again"""
+        room_renderer = Room3DRenderer(gl_context, 160, 120)
+
+        with room_renderer.batched_boxes():
+            room_renderer.render_cube((0.0, 0.0, 0.0), (1.0, 1.0, 1.0), 0.5)
+            assert len(room_renderer._box_batch) == 1
+
+        assert room_renderer._box_batch is None
+        assert room_renderer._deferred_labels is None
+
+
+class TestDynamicLights:
+    """Test dynamic lights are packed once for upload"""
+
+    @pytest.fixture
+    def gl_context(self):
+        """Create a real OpenGL context for testing"""
+        try:
+            context = mgl.create_context(standalone=True, backend="egl")
+            yield context
+        except Exception:
+            try:
+                context = mgl.create_context(standalone=True)
+                yield context
+            except Exception as e:
+                raise RuntimeError(f"OpenGL context creation failed: {e}")
+
+    def test_lights_packed_and_padded(self, gl_context):
+        """Test lights land in the packed arrays with the rest zeroed"""
+        room_renderer = Room3DRenderer(gl_context, 64, 64)
+        room_renderer.set_dynamic_lights(
+            [
+                ((1.0, 2.0, 3.0), (0.1, 0.2, 0.3, 0.4)),
+                ((4.0, 5.0, 6.0), (0.5, 0.6, 0.7, 0.8)),
+            ]
+        )
+        room_renderer.set_dynamic_lights([((7.0, 8.0, 9.0), (1.0, 0.9, 0.8, 0.7))])
+
+        assert room_renderer._num_lights == 1
+        positions = np.frombuffer(
+            room_renderer._light_positions_bytes, dtype=np.float32
+        ).reshape(MAX_LIGHTS, 3)
+        colors = np.frombuffer(
+            room_renderer._light_colors_bytes, dtype=np.float32
+        ).reshape(MAX_LIGHTS, 4)
+        assert np.allclose(positions[0], (7.0, 8.0, 9.0))
+        assert np.allclose(colors[0], (1.0, 0.9, 0.8, 0.7))
+        assert not positions[1:].any()
+        assert not colors[1:].any()
+
+    def test_lights_capped_at_max(self, gl_context):
+        """Test extra lights beyond the shader's limit are dropped"""
+        room_renderer = Room3DRenderer(gl_context, 64, 64)
+        lights = [
+            ((float(i), 0.0, 0.0), (1.0, 1.0, 1.0, 1.0)) for i in range(MAX_LIGHTS + 5)
+        ]
+
+        room_renderer.set_dynamic_lights(lights)
+
+        assert room_renderer._num_lights == MAX_LIGHTS
+
+
+class TestFrustumCulling:
+    """Test bounding spheres are tested against the camera frustum"""
+
+    @pytest.fixture
+    def gl_context(self):
+        """Create a real OpenGL context for testing"""
+        try:
+            context = mgl.create_context(standalone=True, backend="egl")
+            yield context
+        except Exception:
+            try:
+                context = mgl.create_context(standalone=True)
+                yield context
+            except Exception as e:
+                raise RuntimeError(f"OpenGL context creation failed: {e}")
+
+    def test_spheres_in_frustum(self, gl_context):
+        """Test spheres in view, behind the camera and off to the side"""
+        room_renderer = Room3DRenderer(gl_context, 160, 120)
+        centers = np.array(
+            [
+                [0.0, 1.5, 0.0],  # Camera look-at point
+                [0.0, 0.5, 20.0],  # Behind the camera
+                [-50.0, 1.5, 0.0],  # Far off to the left
+                [-50.0, 1.5, 0.0],  # Same, but big enough to reach into view
+            ],
+            dtype=np.float32,
+        )
+        radii = np.array([0.5, 0.5, 1.0, 60.0], dtype=np.float32)
+
+        visible = room_renderer.spheres_in_frustum(centers, radii)
+
+        assert visible.tolist() == [True, False, False, True]
+
+    def test_frustum_follows_camera(self, gl_context):
+        """Test turning the camera changes what is in view"""
+        room_renderer = Room3DRenderer(gl_context, 160, 120)
+        centers = np.array([[0.0, 1.5, -8.0]], dtype=np.float32)
+        radii = np.array([0.5], dtype=np.float32)
+
+        assert room_renderer.spheres_in_frustum(centers, radii).tolist() == [True]
+
+        # Orbit to the far side of the room, looking back the other way
+        room_renderer.camera_angle = math.pi
+        room_renderer.camera_distance = 2.0
+
+        assert room_renderer.spheres_in_frustum(centers, radii).tolist() == [False]
@@ -65,3 +65,27 @@ def test_render_profiling_records_each_node():
     assert any(name.startswith("node_render:_LeafNode") for name in stats)
 
     vj_profiler.enabled = False
+
+
+def test_profile_disabled_shares_null_context():
+    _clear_profiler_state()
+    vj_profiler.enabled = False
+
+    first = vj_profiler.profile("op")
+    with first:
+        pass
+
+    assert vj_profiler.profile("other_op") is first
+    assert vj_profiler.get_stats() == {}
+
+
+def test_profile_records_operation():
+    _clear_profiler_state()
+    vj_profiler.enabled = True
+
+    with vj_profiler.profile("op"):
+        pass
+
+    assert vj_profiler.get_stats()["op"]["total_calls"] == 1
+
+    vj_profiler.enabled = False
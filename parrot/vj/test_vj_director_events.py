@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 
+import logging
 import pytest
 from unittest.mock import Mock, patch
+from parrot.director.color_schemes import scheme_halloween
+from parrot.director.frame import Frame
 from parrot.vj.vj_director import VJDirector
 from parrot.vj.vj_mode import VJMode
 from parrot.state import State
@@ -50,6 +53,33 @@ class TestVJDirectorEvents:
         # Verify unsubscribed
         assert vj_director._on_vj_mode_change not in state.events.on_vj_mode_change
 
+    def test_cleanup_releases_stage_and_frame_data(self):
+        """Test cleanup exits the stage and drops references to it"""
+        state = State()
+        vj_director = VJDirector(state)
+        concert_stage = vj_director.concert_stage
+        vj_director.step(Frame({}), scheme_halloween[0])
+
+        with patch.object(concert_stage, "exit_recursive") as mock_exit:
+            vj_director.cleanup()
+
+        mock_exit.assert_called_once()
+        assert vj_director.concert_stage is None
+        assert vj_director._render_fn is None
+        assert vj_director.get_latest_frame_data() == (None, None)
+
+    def test_use_after_cleanup_is_a_no_op(self):
+        """Test a cleaned up director renders and shifts nothing"""
+        state = State()
+        vj_director = VJDirector(state)
+        vj_director.cleanup()
+
+        assert vj_director.get_concert_stage() is None
+        assert vj_director.render(Mock(), Frame({}), scheme_halloween[0]) is None
+        vj_director.shift(VJMode.full_rave)
+        # A second cleanup is harmless too
+        vj_director.cleanup()
+
     def test_multiple_mode_changes(self):
         """Test that mode changes trigger regeneration"""
         state = State()
@@ -82,6 +112,82 @@ class TestVJDirectorEvents:
             assert new_mode_1 in modes_used
             assert new_mode_2 in modes_used
 
+    def test_mode_changes_reuse_vibe_per_mode(self):
+        """Test each VJ mode's Vibe is built once and shared"""
+        state = State()
+        state.set_vj_mode(VJMode.golden_age)
+        vj_director = VJDirector(state)
+
+        with patch.object(
+            vj_director.concert_stage, "generate_recursive"
+        ) as mock_generate:
+            state.set_vj_mode(VJMode.blackout)
+            state.set_vj_mode(VJMode.full_rave)
+            state.set_vj_mode(VJMode.blackout)
+            vj_director.shift(VJMode.full_rave)
+
+        vibes = [call[0][0] for call in mock_generate.call_args_list]
+        assert vibes[0] is vibes[2]
+        assert vibes[1] is vibes[3]
+        assert vibes[0] is not vibes[1]
+
+    def test_mode_change_to_generated_mode_skips_regeneration(self):
+        """Test a mode change the stage was already generated for is a no-op"""
+        state = State()
+        state.set_vj_mode(VJMode.golden_age)
+        vj_director = VJDirector(state)
+
+        with patch.object(
+            vj_director.concert_stage, "generate_recursive"
+        ) as mock_generate:
+            vj_director.shift(VJMode.blackout)
+            state.set_vj_mode(VJMode.blackout)
+            assert mock_generate.call_count == 1
+
+            # A partial shift leaves the stage in no single mode
+            vj_director.shift(VJMode.full_rave, threshold=0.5)
+            state.set_vj_mode(VJMode.full_rave)
+            assert mock_generate.call_count == 3
+
+    def test_mode_change_tree_only_built_for_debug_logging(self, caplog):
+        """Test the stage tree is only stringified when debug logging is on"""
+        state = State()
+        vj_director = VJDirector(state)
+
+        with patch.object(
+            vj_director.concert_stage, "generate_recursive"
+        ), patch.object(
+            vj_director.concert_stage, "print_tree", return_value="<tree>"
+        ) as mock_print_tree:
+            caplog.set_level(logging.INFO, logger="parrot.vj.vj_director")
+            state.set_vj_mode(VJMode.blackout)
+            mock_print_tree.assert_not_called()
+
+            caplog.set_level(logging.DEBUG, logger="parrot.vj.vj_director")
+            state.set_vj_mode(VJMode.full_rave)
+            mock_print_tree.assert_called_once()
+
+        assert "after mode change to full_rave" in caplog.text
+        assert "<tree>" in caplog.text
+
+
+class TestVJDirectorFrameData:
+    """Test frame data handed from the director to the render loop"""
+
+    def test_latest_frame_data_is_one_pair(self):
+        """Test step() publishes frame and scheme together"""
+        state = State()
+        vj_director = VJDirector(state)
+
+        assert vj_director.get_latest_frame_data() == (None, None)
+
+        frame = Frame({})
+        vj_director.step(frame, scheme_halloween[0])
+        latest = vj_director.get_latest_frame_data()
+
+        assert latest == (frame, scheme_halloween[0])
+        assert vj_director.get_latest_frame_data() is latest
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
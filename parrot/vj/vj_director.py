@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 
+import logging
 import time
+from functools import lru_cache
+from typing import Optional, Tuple
 from beartype import beartype
 
 from parrot.director.frame import Frame, FrameSignal
@@ -11,6 +14,14 @@ from parrot.vj.nodes.concert_stage import ConcertStage
 from parrot.vj.profiler import vj_profiler
 from parrot.state import State
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _vibe_for(vj_mode: VJMode) -> Vibe:
+    """Shared Vibe for a VJ mode, so shifts don't build a new one each time"""
+    return Vibe(vj_mode)
+
 
 @beartype
 class VJDirector:
@@ -22,15 +33,20 @@ class VJDirector:
     def __init__(self, state: State):
         # Create the complete concert stage with 2D canvas and 3D lighting
         self.concert_stage = ConcertStage()
+        # Bound once; render() runs every frame
+        self._render_fn = self.concert_stage.render
 
-        self.last_shift_time = time.time()
+        self.last_shift_time = time.monotonic()
         self.shift_count = 0
         self.window = None  # Will be set by the window manager
         self.state = state
 
-        # Latest frame data from director
-        self._latest_frame = None
-        self._latest_scheme = None
+        # Latest (frame, scheme) from director. Stored as one tuple so the
+        # render thread never sees a frame paired with another step's scheme
+        self._latest: Tuple[Optional[Frame], Optional[ColorScheme]] = (None, None)
+
+        # Mode the whole concert stage was last generated for, if any
+        self._generated_mode: Optional[VJMode] = None
 
         # Subscribe to VJ mode changes
         self.state.events.on_vj_mode_change += self._on_vj_mode_change
@@ -40,44 +56,48 @@ class VJDirector:
         with vj_profiler.profile("vj_director_setup"):
             self.concert_stage.enter_recursive(context)
 
-            vibe = Vibe(self.state.vj_mode)
+            vibe = _vibe_for(self.state.vj_mode)
             self.concert_stage.generate_recursive(vibe)
+            self._generated_mode = self.state.vj_mode
 
-            # Print the tree structure after initialization
-            print("VJ Concert Stage Tree (after initialization):")
-            # print(self.concert_stage.print_tree())
+            self._log_tree("initialization")
 
     def step(self, frame: Frame, scheme: ColorScheme):
         """Step method called by director - stores latest frame data for rendering"""
-        self._latest_frame = frame
-        self._latest_scheme = scheme
+        self._latest = (frame, scheme)
 
     def get_latest_frame_data(self):
         """Get latest frame data for rendering"""
-        return self._latest_frame, self._latest_scheme
+        return self._latest
 
     def render(self, context, frame: Frame, scheme: ColorScheme):
-        """Render the complete concert stage"""
+        """Render the complete concert stage; None once cleaned up"""
+        render_fn = self._render_fn
+        if render_fn is None:
+            return None
         with vj_profiler.profile("vj_director_render"):
-            return self.concert_stage.render(frame, scheme, context)
+            return render_fn(frame, scheme, context)
 
     def shift(self, vj_mode: VJMode, threshold: float = 1.0):
         """Shift the visual mode and update the concert stage"""
+        if self.concert_stage is None:
+            return
         with vj_profiler.profile("vj_director_shift"):
-            vibe = Vibe(vj_mode)
+            vibe = _vibe_for(vj_mode)
             self.concert_stage.generate_recursive(vibe, threshold)
+            if threshold >= 1.0:
+                self._generated_mode = vj_mode
+            elif vj_mode != self._generated_mode:
+                # Only part of the stage switched over, so it has no single mode
+                self._generated_mode = None
 
-            self.last_shift_time = time.time()
+            self.last_shift_time = time.monotonic()
             self.shift_count += 1
 
-            # Print the tree structure after shift
-            print(
-                f"VJ Concert Stage Tree (after shift #{self.shift_count} to {vj_mode}):"
-            )
-            # print(self.concert_stage.print_tree())
+            self._log_tree("shift #%d to %s", self.shift_count, vj_mode)
 
-    def get_concert_stage(self) -> ConcertStage:
-        """Get the complete concert stage"""
+    def get_concert_stage(self) -> Optional[ConcertStage]:
+        """Get the complete concert stage, or None once cleaned up"""
         return self.concert_stage
 
     def get_current_vj_mode(self) -> VJMode:
@@ -94,18 +114,40 @@ class VJDirector:
 
     def _on_vj_mode_change(self, vj_mode: VJMode):
         """Handle VJ mode changes by regenerating the visual tree"""
-        print(f"[*] VJ Mode changed to: {vj_mode.name}, regenerating visuals...")
-        vibe = Vibe(vj_mode)
+        if vj_mode == self._generated_mode:
+            # Already showing this mode (e.g. a shift got there first)
+            return
+
+        logger.debug("VJ Mode changed to: %s, regenerating visuals...", vj_mode.name)
+        vibe = _vibe_for(vj_mode)
         self.concert_stage.generate_recursive(vibe, threshold=1.0)
+        self._generated_mode = vj_mode
+
+        self._log_tree("mode change to %s", vj_mode.name)
 
-        # Print the tree structure after mode change
-        print(f"VJ Concert Stage Tree (after mode change to {vj_mode.name}):")
-        # print(self.concert_stage.print_tree())
+    def _log_tree(self, after: str, *args):
+        """Log the concert stage tree; only built when debug logging is on"""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "VJ Concert Stage Tree (after " + after + "):\n%s",
+                *args,
+                self.concert_stage.print_tree(),
+            )
 
     def cleanup(self):
-        """Clean up resources"""
+        """Clean up resources; the director renders nothing afterwards"""
+        if self.concert_stage is None:
+            return
+
         # Unsubscribe from events
         self.state.events.on_vj_mode_change -= self._on_vj_mode_change
 
         # Clean up concert stage
         self.concert_stage.exit_recursive()
+
+        # Drop references now so the stage's nodes and the last frame are freed
+        # on cleanup, not whenever the director itself is collected
+        self.concert_stage = None
+        self._render_fn = None
+        self._latest = (None, None)
+        self._generated_mode = None